@@ -4,21 +4,9 @@ Analyze convergence pattern of (s-1)² · L_M(s)
 """
 import mpmath as mp
 
-mp.dps = 50
-
-def C_func(s, jmax):
-    """C(s) = sum_{j=2}^{jmax} H_{j-1}(s) / j^s"""
-    result = mp.mpf(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = sum(mp.power(k, -s) for k in range(1, j))
-        result += H_j_minus_1 / mp.power(j, s)
-    return result
+from orbit_py import L_M_closed_form
 
-def L_M_closed(s, jmax=500):
-    """L_M(s) via closed form"""
-    zeta_s = mp.zeta(s)
-    C_s = C_func(s, jmax)
-    return zeta_s * (zeta_s - 1) - C_s
+mp.dps = 50
 
 print("=== Convergence Pattern Analysis ===")
 print("")
@@ -28,7 +16,7 @@ data = []
 for k in range(1, 10):
     eps = mp.power(10, -k)
     s = 1 + eps
-    L_val = L_M_closed(s, jmax=500)
+    L_val = L_M_closed_form(s, jmax=500)
     coeff = eps**2 * L_val
     deviation = coeff - 1
     data.append((k, float(eps), float(coeff), float(deviation)))
@@ -4,30 +4,26 @@ Analyze L_M(s) on the critical line Re(s) = 1/2
 
 Focus: Study the phase arg(R(s)) where R(s) = L_M(1-s)/L_M(s)
 On critical line, 1-s = conj(s), so |R(s)| = 1 by Schwarz symmetry.
+
+The last section leaves the line: orbit_py.field scans a σ × t grid of the
+strip and reports, per σ, how far each candidate γ from gamma_search is
+from satisfying γ(s)L_M(s) = γ(1-s)L_M(1-s).
 """
 
-from mpmath import mp, zeta, gamma, pi, sin, cos, exp, log, sqrt
+import numpy as np
+from mpmath import mp, gamma, pi, sin, cos, exp, log, sqrt
 from mpmath import re, im, arg, fabs, conj
 
+from orbit_py import L_M_closed_form
+from orbit_py.field import scan_strip
+from orbit_py.gamma_search import NAMED
+
+FIELD_SIGMA = np.linspace(0.1, 0.9, 9)
+FIELD_T = np.linspace(5, 50, 2001)
+
 # Set precision
 mp.dps = 50
 
-def partial_zeta(s, n):
-    """Compute H_n(s) = sum_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=300):
-    """
-    Compute L_M(s) using closed form:
-    L_M(s) = ζ(s)[ζ(s) - 1] - Σ_{j=2}^∞ H_{j-1}(s)/j^s
-    """
-    zeta_s = zeta(s)
-    correction = mp.mpf(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
 def analyze_critical_line():
     """Analyze L_M(s) on critical line Re(s) = 1/2"""
 
@@ -143,5 +139,24 @@ def analyze_critical_line():
     print("We need to analyze OFF critical line to find the functional equation.")
     print()
 
+    print("=" * 80)
+    print(f"Functional-Equation Residuals Over the Strip (t ∈ [{FIELD_T[0]:g}, {FIELD_T[-1]:g}])")
+    print("=" * 80)
+    print()
+    print("Median over t of |log R(s) - log γ(s)/γ(1-s)|, R = L_M(1-s)/L_M(s)")
+    print("(full L_M = (ζ² + ζ(2s))/2 - ζ; fraction of t with residual < 1e-6 in brackets)")
+    print()
+
+    field = scan_strip(FIELD_SIGMA, FIELD_T, jmax=200)
+    residuals = {name: field.fe_residual(family, params, full=True)
+                 for name, (family, params) in NAMED.items()}
+
+    print(f"{'σ':<8}" + "".join(f"{name:<22}" for name in residuals))
+    print("-" * (8 + 22 * len(residuals)))
+    for i, sigma in enumerate(FIELD_SIGMA):
+        cols = "".join(f"{np.median(r[i]):<9.3e} [{np.mean(r[i] < 1e-6):4.2f}]      " for r in residuals.values())
+        print(f"{sigma:<8.2f}{cols}")
+    print()
+
 if __name__ == "__main__":
     analyze_critical_line()
@@ -6,98 +6,30 @@ Tests U-shape primality signature hypothesis
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import minimize_scalar
 from typing import Dict, Tuple, Optional
-import pickle
-from pathlib import Path
-
-# ============================================================================
-# SOFT-MIN IMPLEMENTATION
-# ============================================================================
-
-def soft_min_squared(x: int, d: int, alpha: float = 7.0) -> float:
-    """Compute soft-min of squared distances from x to all points k*d + d^2"""
-    max_k = x // d
-    distances_sq = [(x - (k*d + d**2))**2 for k in range(max_k + 1)]
-
-    neg_dist_sq = [-alpha * d for d in distances_sq]
-    M = max(neg_dist_sq)
-
-    log_sum_exp = M + np.log(sum(np.exp(nd - M) for nd in neg_dist_sq))
-
-    return -log_sum_exp / alpha
-
-
-def compute_F_n(n: int, s: float, alpha: float = 7.0, max_d: int = 500) -> float:
-    """Compute F_n(s) = Sum[soft-min_d(n)^(-s), {d, 2, maxD}]"""
-    cutoff = min(max_d, 10 * n)
-    terms = []
-
-    for d in range(2, cutoff + 1):
-        soft_min = soft_min_squared(n, d, alpha)
-        if soft_min > 0:
-            terms.append(soft_min ** (-s))
-
-    return sum(terms)
-
-
-# ============================================================================
-# PRIMALITY TESTING
-# ============================================================================
-
-def is_prime(n: int) -> bool:
-    """Simple primality test"""
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(np.sqrt(n)) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
 
+from orbit_py import is_prime, SoftMinSeries, scan_exponents
+from orbit_py.exponents import FIELDS
 
 # ============================================================================
 # OPTIMAL EXPONENT FINDING
 # ============================================================================
 
 def find_optimal_s(n: int, alpha: float = 7.0, s_bounds: Tuple[float, float] = (0.5, 5.0),
-                   tol: float = 0.01) -> Tuple[Optional[float], float, bool]:
+                   tol: float = 1e-10) -> Tuple[Optional[float], float, bool]:
     """
     Find s*(n) = argmin F_n(s)
 
+    F_n is convex in s (F_n'' = Sum[m_d^(-s) log^2 m_d] > 0), so F_n is
+    monotonic on s_bounds unless F_n' changes sign between them; s* is the
+    root of F_n', found by safeguarded Newton with the analytic F_n''.
+
     Returns:
         s_opt: optimal s (or None if monotonic)
-        F_min: minimum value of F_n
+        F_min: minimum value of F_n (at a bound if monotonic)
         has_minimum: True if genuine minimum exists
     """
-
-    # Define objective function
-    def objective(s):
-        return compute_F_n(n, s, alpha)
-
-    # Find minimum using Brent's method
-    result = minimize_scalar(objective, bounds=s_bounds, method='bounded',
-                            options={'xatol': tol})
-
-    s_opt = result.x
-    F_min = result.fun
-
-    # Check if it's a genuine minimum (not at boundary)
-    boundary_tolerance = 0.1
-    is_at_boundary = (s_opt < s_bounds[0] + boundary_tolerance or
-                     s_opt > s_bounds[1] - boundary_tolerance)
-
-    # Also check endpoints to verify it's not monotonic
-    F_left = compute_F_n(n, s_bounds[0] + 0.1, alpha)
-    F_right = compute_F_n(n, s_bounds[1] - 0.1, alpha)
-
-    # If minimum is at boundary and endpoint value is lower, it's monotonic
-    is_monotonic = is_at_boundary and (F_left <= F_min or F_right <= F_min)
-
-    has_minimum = not is_monotonic
+    s_opt, F_min, has_minimum = SoftMinSeries(n, alpha).minimize(s_bounds, tol)
 
     return (s_opt if has_minimum else None, F_min, has_minimum)
 
@@ -107,48 +39,34 @@ def find_optimal_s(n: int, alpha: float = 7.0, s_bounds: Tuple[float, float] = (
 # ============================================================================
 
 def analyze_range(n_min: int, n_max: int, alpha: float = 7.0,
-                 cache_file: str = "cache/optimal_exponents.pkl") -> Dict:
+                 cache_dir: Optional[str] = None, block: int = 1000,
+                 workers: Optional[int] = None) -> Dict:
     """
     Analyze optimal exponents for range of n
-    """
-    cache_path = Path(cache_file)
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Try to load cache
-    if cache_path.exists():
-        print(f"Loading cached results from {cache_file}...")
-        with open(cache_path, 'rb') as f:
-            cached = pickle.load(f)
 
-        if cached.get('n_max', 0) >= n_max and cached.get('alpha') == alpha:
-            print(f"✓ Cache valid for n ≤ {n_max}")
-            return {n: data for n, data in cached['results'].items()
-                   if n_min <= n <= n_max}
+    The range is cut into blocks of n that run on a process pool; each
+    finished block is checkpointed to its own file (under cache_dir, default
+    cache/optimal_exponents/), so an interrupted run resumes from the
+    missing blocks. The blocks are merged once all are done.
+    """
+    def report(done, total):
+        print(f"  Progress: {done}/{total} blocks ({100*done/total:.1f}%)", end="\r")
 
-    # Compute
     print(f"Analyzing n ∈ [{n_min}, {n_max}]...")
-    results = {}
-
-    for n in range(n_min, n_max + 1):
-        if n % 50 == 0:
-            print(f"  Progress: {n}/{n_max} ({100*n/n_max:.1f}%)", end="\r")
-
-        s_opt, F_min, has_min = find_optimal_s(n, alpha)
-        prime = is_prime(n)
+    store = scan_exponents(n_min, n_max, alpha, block=block, path=cache_dir,
+                           workers=workers, progress=report)
+    merged = store.merge(n_min, n_max)
 
+    results = {}
+    for n, s_opt, F_min, has_min, prime in zip(*(merged[name].tolist() for name in FIELDS)):
         results[n] = {
-            's_opt': s_opt,
+            's_opt': s_opt if has_min else None,
             'F_min': F_min,
             'has_minimum': has_min,
             'is_prime': prime
         }
 
-    print(f"\n✓ Analyzed {len(results)} values")
-
-    # Save cache
-    with open(cache_path, 'wb') as f:
-        pickle.dump({'n_max': n_max, 'alpha': alpha, 'results': results}, f)
-    print(f"✓ Cached to {cache_file}")
+    print(f"\n✓ Analyzed {len(results)} values (blocks in {store.path})")
 
     return results
 
@@ -257,8 +175,7 @@ def plot_heatmap(results: Dict, n_sample: int, s_range: np.ndarray,
     for i, n in enumerate(n_sampled):
         if i % 10 == 0:
             print(f"  Row {i}/{len(n_sampled)}", end="\r")
-        for j, s in enumerate(s_range):
-            grid[i, j] = compute_F_n(n, s, alpha)
+        grid[i] = SoftMinSeries(n, alpha)(s_range)
 
     print(" " * 50, end="\r")
     print(f"✓ Computed {grid.size} grid points")
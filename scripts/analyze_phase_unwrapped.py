@@ -14,76 +14,16 @@ Strategy:
 This will tell us the functional form of f(s).
 """
 
-from mpmath import mp, zeta, gamma, pi, exp, log, sqrt
-from mpmath import re, im, arg, fabs, conj
+from mpmath import mp, exp, log, sqrt
+from mpmath import re, im, fabs
 import math
+import time
 
-mp.dps = 50
-
-def partial_zeta(s, n):
-    """H_n(s) = Σ_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=200):
-    """L_M(s) using closed form (fixed jmax for critical line)"""
-    zeta_s = zeta(s)
-    correction = mp.mpc(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
-def gamma_classical(s):
-    """Classical gamma factor: γ(s) = π^(-s/2) Γ(s/2)"""
-    return mp.power(pi, -s/2) * gamma(s/2)
-
-def compute_phase(t, jmax=200):
-    """
-    Compute arg(f(s)/f(1-s)) at s = 1/2 + it
-
-    Returns unwrapped phase (cumulative, no 2π jumps)
-    """
-    s = mp.mpc(0.5, t)
-
-    # L_M values
-    L_s = L_M_closed_form(s, jmax)
-    L_1ms = conj(L_s)  # Schwarz symmetry
-
-    # Classical gamma
-    g_s = gamma_classical(s)
-    g_1ms = gamma_classical(1 - s)
-
-    # f ratio
-    ratio_L = L_1ms / L_s
-    ratio_gamma = g_1ms / g_s
-    f_ratio = ratio_L / ratio_gamma
-
-    # Phase
-    phase = arg(f_ratio)
-
-    return float(phase)
-
-def unwrap_phase(phases):
-    """
-    Remove 2π jumps from phase sequence.
-
-    Returns cumulative unwrapped phase.
-    """
-    unwrapped = [phases[0]]
-    cumulative_shift = 0
-
-    for i in range(1, len(phases)):
-        diff = phases[i] - phases[i-1]
-
-        # Detect jump
-        if diff > math.pi:
-            cumulative_shift -= 2 * math.pi
-        elif diff < -math.pi:
-            cumulative_shift += 2 * math.pi
+import numpy as np
 
-        unwrapped.append(phases[i] + cumulative_shift)
+from orbit_py import phase_scan, phase_sweep, adaptive_phase_grid, phase_increment
 
-    return unwrapped
+mp.dps = 50
 
 def main():
     print("=" * 80)
@@ -113,13 +53,16 @@ def main():
     print()
 
     phases_raw = []
+    phases_unwrapped = []
 
     print(f"{'t':<10} {'arg(f/f) [rad]':<20}")
     print("-" * 30)
 
-    for t in t_values:
-        phase = compute_phase(t, jmax=200)
+    # Sharded across all cores; results stream back in t order and are
+    # unwrapped as they arrive
+    for t, phase, unwrapped in phase_sweep(t_values, jmax=200, dps=mp.dps):
         phases_raw.append(phase)
+        phases_unwrapped.append(unwrapped)
         print(f"{t:<10.3f} {phase:<20.10f}")
 
     print()
@@ -128,8 +71,6 @@ def main():
     print("=" * 80)
     print()
 
-    phases_unwrapped = unwrap_phase(phases_raw)
-
     print(f"{'t':<10} {'Unwrapped θ(t)':<20} {'θ(t)/log(t)':<20} {'θ(t)/t':<20}")
     print("-" * 70)
 
@@ -149,6 +90,46 @@ def main():
             'theta_over_t': theta_over_t
         })
 
+    print()
+    print("=" * 80)
+    print("STEP 2b: Dense double-precision survey (mpmath only near zeros)")
+    print("=" * 80)
+    print()
+
+    t_dense = np.linspace(2, 50, 9601)
+    start = time.perf_counter()
+    theta_dense, rel_err, escalated = phase_scan(t_dense, jmax=200, tol=1e-10, dps=mp.dps)
+    elapsed = time.perf_counter() - start
+    theta_dense = np.unwrap(theta_dense)
+
+    print(f"  {len(t_dense)} points in t ∈ [2, 50], {elapsed:.2f} s")
+    print(f"  Escalated to mpmath ({mp.dps} digits): {int(escalated.sum())}")
+    print(f"  Max relative error estimate of L_M: {rel_err.max():.2e}")
+    print(f"  Unwrapped θ range: [{theta_dense.min():.6f}, {theta_dense.max():.6f}]")
+
+    # Coarse samples that land on the dense grid, for a consistency check
+    on_grid = [(t, th) for t, th in zip(t_values, phases_unwrapped) if abs(t * 200 - round(t * 200)) < 1e-9]
+    diffs = [abs((theta_dense[round((t - 2) * 200)] - th + math.pi) % (2 * math.pi) - math.pi)
+             for t, th in on_grid]
+    print(f"  Max |Δθ| vs mpmath at {len(on_grid)} shared t values: {max(diffs):.2e}")
+
+    # Adaptive grid: bisect only where θ moves by more than π/2 per step
+    t_adapt, _, theta_adapt = adaptive_phase_grid(
+        2, 50, step=1.0, phase_func=lambda ts: phase_scan(ts, jmax=200, tol=1e-10, dps=mp.dps)[0])
+    print()
+    print(f"  Adaptive grid: {len(t_adapt)} points (smallest step {np.diff(t_adapt).min():.4f})")
+    print(f"  Unwrapped θ(50): adaptive {theta_adapt[-1]:.6f}, dense {theta_dense[-1]:.6f}")
+
+    # No sampling at all: integrate dθ/dt = Re ψ(s/2) - log π - 2·Re(L_M'/L_M)
+    increment = phase_increment(2, 50, jmax=200)
+    print(f"  ∫ dθ/dt over [2, 50]: {increment:.10f}  (dense unwrap: {theta_dense[-1] - theta_dense[0]:.10f})")
+
+    # 2π wraps that the coarse t_values grid of STEP 2 misses
+    theta_ref = np.interp(t_values, t_adapt, theta_adapt)
+    missed = [round((ref - th) / (2 * math.pi)) for ref, th in zip(theta_ref, phases_unwrapped)]
+    print(f"  Coarse-grid unwrapping off by 2π·k at {sum(k != 0 for k in missed)} of {len(t_values)} "
+          f"t values (k up to {max(abs(k) for k in missed)})")
+
     print()
     print("=" * 80)
     print("STEP 3: Pattern analysis")
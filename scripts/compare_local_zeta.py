@@ -6,60 +6,15 @@ Variant B: Fair comparison - both functions study local structure of n
 
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import List, Tuple
+from typing import Tuple
 import sympy as sp
 
-# ============================================================================
-# SOFT-MIN IMPLEMENTATION (from Wolfram script)
-# ============================================================================
-
-def soft_min_squared(x: int, d: int, alpha: float = 7.0) -> float:
-    """
-    Compute soft-min of squared distances from x to all points k*d + d^2
-    Uses log-sum-exp trick for numerical stability
-    """
-    max_k = x // d
-    distances_sq = [(x - (k*d + d**2))**2 for k in range(max_k + 1)]
-
-    # Log-sum-exp with numerical stability
-    neg_dist_sq = [-alpha * d for d in distances_sq]
-    M = max(neg_dist_sq)
-
-    log_sum_exp = M + np.log(sum(np.exp(nd - M) for nd in neg_dist_sq))
-
-    return -log_sum_exp / alpha
-
-
-def dirichlet_like_sum(n: int, s: float, alpha: float = 7.0, max_d: int = 500) -> float:
-    """
-    Compute F_n(s) = Sum[soft-min_d(n)^(-s), {d, 2, maxD}]
-    """
-    cutoff = min(max_d, 10 * n)
-    terms = []
-
-    for d in range(2, cutoff + 1):
-        soft_min = soft_min_squared(n, d, alpha)
-        if soft_min > 0:
-            terms.append(soft_min ** (-s))
-
-    return sum(terms)
-
+from orbit_py import divisors, SoftMinSeries
 
 # ============================================================================
 # LOCAL ZETA FUNCTION
 # ============================================================================
 
-def divisors(n: int) -> List[int]:
-    """Find all divisors of n"""
-    divs = []
-    for i in range(1, int(np.sqrt(n)) + 1):
-        if n % i == 0:
-            divs.append(i)
-            if i != n // i:
-                divs.append(n // i)
-    return sorted(divs)
-
-
 def local_zeta(n: int, s: float) -> float:
     """
     Compute ζ_n(s) = Sum[d^(-s)] for d dividing n
@@ -81,22 +36,19 @@ def compare_functions(n: int, s_range: np.ndarray, alpha: float = 7.0):
     print(f"Number of divisors: {len(divisors(n))}")
     print()
 
-    f_values = []
+    # F_n at every s from one soft-min vector
+    f_values = SoftMinSeries(n, alpha, max_d=500)(s_range)
     zeta_values = []
 
     for s in s_range:
         print(f"  s = {s:.1f}...", end="\r")
-        f_val = dirichlet_like_sum(n, s, alpha, max_d=500)
-        z_val = local_zeta(n, s)
-
-        f_values.append(f_val)
-        zeta_values.append(z_val)
+        zeta_values.append(local_zeta(n, s))
 
     print(" " * 50, end="\r")  # Clear line
     print(f"✓ Computed {len(s_range)} points")
     print()
 
-    return np.array(f_values), np.array(zeta_values)
+    return f_values, np.array(zeta_values)
 
 
 # ============================================================================
@@ -8,7 +8,8 @@ This is the algebraically cleaner variant with better numerical properties.
 
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import List
+
+from orbit_py import divisors
 
 # ============================================================================
 # POWER-MEAN SOFT-MIN (P-NORM)
@@ -71,17 +72,6 @@ def dirichlet_like_sum_powermean(n: int, s: float, p: float = 3.0, eps: float =
 # LOCAL ZETA FUNCTION (same as before)
 # ============================================================================
 
-def divisors(n: int) -> List[int]:
-    """Find all divisors of n"""
-    divs = []
-    for i in range(1, int(np.sqrt(n)) + 1):
-        if n % i == 0:
-            divs.append(i)
-            if i != n // i:
-                divs.append(n // i)
-    return sorted(divs)
-
-
 def local_zeta(n: int, s: float) -> float:
     """
     Compute ζ_n(s) = Sum[d^(-s)] for d dividing n
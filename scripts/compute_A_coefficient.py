@@ -2,32 +2,16 @@
 """
 Compute coefficient A of double pole in L_M(s) at s=1
 Using closed form: L_M(s) = ζ(s)[ζ(s)-1] - C(s)
-"""
-import mpmath as mp
-
-mp.dps = 50  # 50 decimal places precision
 
-def M(n):
-    """Childhood function M(n) = floor((tau(n)-1)/2)"""
-    tau = mp.nint(sum(1 for k in range(1, n+1) if n % k == 0))
-    return int((tau - 1) // 2)
+The ε-probes (s-1)²·L_M(1+ε) are kept for comparison; A itself is read off
+the Laurent expansion at s = 1, from the series of ζ and C (exact) and from
+N evaluations on a circle around s = 1 (with an error estimate).
+"""
+from mpmath import mp
 
-def C_func(s, jmax):
-    """
-    C(s) = sum_{j=2}^{jmax} H_{j-1}(s) / j^s
-    where H_j(s) = sum_{k=1}^j k^{-s}
-    """
-    result = mp.mpf(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = sum(mp.power(k, -s) for k in range(1, j))
-        result += H_j_minus_1 / mp.power(j, s)
-    return result
+from orbit_py import L_M_closed_form, L_M_laurent, laurent_contour
 
-def L_M_closed(s, jmax=500):
-    """L_M(s) via closed form"""
-    zeta_s = mp.zeta(s)
-    C_s = C_func(s, jmax)
-    return zeta_s * (zeta_s - 1) - C_s
+mp.dps = 50  # 50 decimal places precision
 
 print("=== Computing A via Closed Form (Python/mpmath) ===")
 print("")
@@ -41,7 +25,7 @@ print("")
 # Test s = 2 first (should converge)
 s_test = mp.mpf(2)
 for jmax in [100, 200, 500]:
-    L_val = L_M_closed(s_test, jmax)
+    L_val = L_M_closed_form(s_test, jmax)
     print(f"s=2, jmax={jmax:4d}: L_M(2) = {mp.nstr(L_val, 15)}")
 
 print("")
@@ -54,11 +38,24 @@ for k in range(1, 8):
     eps = mp.power(10, -k)
     s = 1 + eps
 
-    L_val = L_M_closed(s, jmax)
+    L_val = L_M_closed_form(s, jmax)
     coeff = eps**2 * L_val
 
     print(f"eps = 10^-{k}: (s-1)² · L_M(s) = {mp.nstr(coeff, 20)}")
 
+print("")
+print(f"Laurent expansion at s=1 (jmax={jmax}):")
+print("")
+
+series = L_M_laurent(jmax, order=2)
+N = 64
+contour, errors = laurent_contour(lambda s: L_M_closed_form(s, jmax), 1, radius=0.25, num=N,
+                                  lowest=-2, count=3)
+labels = ["A   (s-1)^-2", "B   (s-1)^-1", "c0  (s-1)^0 "]
+for label, a, c, e in zip(labels, series, contour, errors):
+    print(f"{label}: series = {mp.nstr(a, 25)}")
+    print(f"{'':17}contour = {mp.nstr(c.real, 25)}  (± {mp.nstr(e, 3)}, {N} evaluations)")
+
 print("")
 print("Pattern analysis:")
 print("If values converge to constant A ≠ 0: double pole with coefficient A")
@@ -7,58 +7,27 @@ If γ(s) L_M(s) = γ(1-s) L_M(1-s), then:
     γ(s)/γ(1-s) = L_M(1-s)/L_M(s)
 
 We compute this ratio numerically and look for patterns.
+
+L_M(s), L_M(1-s) come from orbit_py.gamma_search.point_values, memoized on
+disk, so grid_search_gamma.py and reruns reuse them; the closing ranking
+scores the named candidates on all analysis points at once and stores it
+in cache/gamma_search.sqlite.
 """
 
 from mpmath import mp, zeta, gamma, pi, sin, cos, exp, log, sqrt
 from mpmath import re, im, arg, fabs
 
+from orbit_py import L_M_closed_form
+from orbit_py.gamma_search import point_values, ratio_features, score_candidates, describe, SearchStore, NAMED
+
 # Set precision
 mp.dps = 50  # 50 decimal places
 
-def M(n):
-    """Divisor count function M(n) = floor((tau(n)-1)/2)"""
-    # tau(n) = number of divisors
-    # For now, compute by factorization
-    tau = 0
-    for d in range(1, int(n**0.5) + 2):
-        if d * d > n:
-            break
-        if n % d == 0:
-            tau += 1 if d * d == n else 2
-    return (tau - 1) // 2
-
-def L_M_direct(s, nmax=200):
-    """Compute L_M(s) directly from definition"""
-    total = mp.mpf(0)
-    for n in range(1, nmax + 1):
-        total += mp.mpf(M(n)) / mp.power(n, s)
-    return total
-
-def partial_zeta(s, n):
-    """Compute H_n(s) = sum_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=300):
-    """
-    Compute L_M(s) using closed form:
-    L_M(s) = ζ(s)[ζ(s) - 1] - Σ_{j=2}^∞ H_{j-1}(s)/j^s
-    """
-    zeta_s = zeta(s)
-
-    # Correction sum
-    correction = mp.mpf(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-
-    return zeta_s * (zeta_s - 1) - correction
-
 def compute_ratio(s):
     """
     Compute R(s) = L_M(1-s) / L_M(s)
     """
-    L_s = L_M_closed_form(s)
-    L_1ms = L_M_closed_form(1 - s)
+    L_s, L_1ms, _, _ = point_values(s, 300)
 
     if fabs(L_s) < 1e-40:
         return None  # Avoid division by zero
@@ -201,6 +170,19 @@ def main():
         except Exception as e:
             print(f"  ERROR: {e}")
 
+    print("\n" + "=" * 80)
+    print("Ranking Over All Analysis Points")
+    print("=" * 80)
+    print()
+
+    features = ratio_features(analysis_points, jmax=300)
+    ranking = score_candidates(features, list(NAMED.values()))
+    run = SearchStore().add_run("empirical_gamma_search", features, ranking)
+    print(f"  {'Candidate':<25} {'rms|Δlog R|':<14} {'rms Δlog':<12} {'rms Δphase':<12}   (run {run})")
+    print(f"  {'-'*65}")
+    for r in ranking:
+        print(f"  {describe(r['family'], r['params']):<25} {r['score']:<14.6f} {r['mag_rms']:<12.6f} {r['phase_rms']:<12.6f}")
+
     print("\n" + "=" * 80)
     print("Analysis Complete")
     print("=" * 80)
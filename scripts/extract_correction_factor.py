@@ -17,32 +17,15 @@ On critical line Re(s) = 1/2:
 Then analyze behavior to guess form of f(s).
 """
 
-from mpmath import mp, zeta, gamma, pi, exp, log, sqrt
+from mpmath import mp, zeta, exp, log, sqrt
 from mpmath import re, im, arg, fabs, conj
 
-mp.dps = 50
-
-def partial_zeta(s, n):
-    """H_n(s) = Σ_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
+from orbit_py import L_M_closed_form, gamma_classical, cached
 
-def L_M_closed_form(s, jmax=200):
-    """
-    L_M(s) = ζ(s)[ζ(s) - 1] - Σ_{j=2}^jmax H_{j-1}(s)/j^s
+mp.dps = 50
 
-    Note: Only converges for Re(s) > 1
-    For Re(s) = 1/2, we use fixed jmax (oscillates, but value exists)
-    """
-    zeta_s = zeta(s)
-    correction = mp.mpc(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
-def gamma_classical(s):
-    """Classical gamma factor: γ(s) = π^(-s/2) Γ(s/2)"""
-    return mp.power(pi, -s/2) * gamma(s/2)
+# Memoized on disk across runs (cache/orbit_py.sqlite, keyed by s, jmax, dps)
+L_M_closed_form = cached(L_M_closed_form)
 
 def extract_f_ratio(s, jmax=200):
     """
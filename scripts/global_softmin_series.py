@@ -11,41 +11,18 @@ import pickle
 import os
 from pathlib import Path
 
+from orbit_py import is_prime, compute_F_n, compute_F_n_batch
+
 # ============================================================================
 # SOFT-MIN IMPLEMENTATION (from local comparison)
 # ============================================================================
 
-def soft_min_squared(x: int, d: int, alpha: float = 7.0) -> float:
-    """
-    Compute soft-min of squared distances from x to all points k*d + d^2
-    Uses log-sum-exp trick for numerical stability
-    """
-    max_k = x // d
-    distances_sq = [(x - (k*d + d**2))**2 for k in range(max_k + 1)]
-
-    # Log-sum-exp with numerical stability
-    neg_dist_sq = [-alpha * d for d in distances_sq]
-    M = max(neg_dist_sq)
-
-    log_sum_exp = M + np.log(sum(np.exp(nd - M) for nd in neg_dist_sq))
-
-    return -log_sum_exp / alpha
-
-
 def compute_F_n_at_1(n: int, alpha: float = 7.0, max_d: int = 500) -> float:
     """
     Compute F_n(1) = Sum[soft-min_d(n)^(-1), {d, 2, maxD}]
     This is the CANONICAL soft-min metric with exponent t=1
     """
-    cutoff = min(max_d, 10 * n)
-    terms = []
-
-    for d in range(2, cutoff + 1):
-        soft_min = soft_min_squared(n, d, alpha)
-        if soft_min > 0:
-            terms.append(1.0 / soft_min)  # Exponent s=1
-
-    return sum(terms)
+    return compute_F_n(n, 1.0, alpha, max_d)
 
 
 # ============================================================================
@@ -76,12 +53,13 @@ def load_or_compute_F_values(max_n: int, alpha: float = 7.0,
     # Compute F_n(1) for all n
     print(f"Computing F_n(1) for n ∈ [2, {max_n}]...")
     F_values = {}
+    block = 1000
 
-    for n in range(2, max_n + 1):
-        if n % 100 == 0:
-            print(f"  Progress: {n}/{max_n} ({100*n/max_n:.1f}%)", end="\r")
-
-        F_values[n] = compute_F_n_at_1(n, alpha)
+    # one vectorized soft-min pass per block of n (all d at once)
+    for start in range(2, max_n + 1, block):
+        n_block = np.arange(start, min(start + block, max_n + 1))
+        print(f"  Progress: {n_block[-1]}/{max_n} ({100*n_block[-1]/max_n:.1f}%)", end="\r")
+        F_values.update(zip(n_block.tolist(), compute_F_n_batch(n_block, 1.0, alpha).tolist()))
 
     print(f"\n✓ Computed {len(F_values)} values")
 
@@ -116,19 +94,6 @@ def prime_zeta_partial(s: float, max_n: int) -> float:
     """
     Compute partial sum of prime zeta: Sum[1/p^s] for primes p ≤ max_n
     """
-    # Simple primality test for small n
-    def is_prime(n):
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        for i in range(3, int(np.sqrt(n)) + 1, 2):
-            if n % i == 0:
-                return False
-        return True
-
     primes = [n for n in range(2, max_n + 1) if is_prime(n)]
     return sum(1.0 / (p ** s) for p in primes)
 
@@ -141,18 +106,6 @@ def analyze_F_distribution(F_values: Dict[int, float]):
     """
     Analyze distribution of F_n(1) values by type
     """
-    def is_prime(n):
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        for i in range(3, int(np.sqrt(n)) + 1, 2):
-            if n % i == 0:
-                return False
-        return True
-
     primes = {n: F for n, F in F_values.items() if is_prime(n)}
     composites = {n: F for n, F in F_values.items() if not is_prime(n)}
 
@@ -6,67 +6,50 @@ Compute R(s) = L_M(1-s)/L_M(s) on a grid of s values
 and try to identify the pattern.
 
 Focus on log(R(s)) to separate magnitude and phase.
+
+R(s) is computed once per grid point (process pool, disk cache) by
+orbit_py.gamma_search; the candidate search then scores a whole family of
+factors Q^{1-2s} Γ(λs+μ)/Γ(λ(1-s)+μ) · (ζ(s)/ζ(1-s))^α against it in NumPy
+and stores the ranking in cache/gamma_search.sqlite.
 """
 
-from mpmath import mp, zeta, gamma, pi, sin, cos, exp, log, sqrt
-from mpmath import re, im, arg, fabs, conj
+import numpy as np
+from mpmath import mp
+
+from orbit_py.gamma_search import (ratio_features, log_factor_ratio, score_candidates,
+                                   candidate_grid, describe, SearchStore, NAMED)
 
 # Set precision
 mp.dps = 40
 
-def partial_zeta(s, n):
-    """Compute H_n(s) = sum_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=200):
-    """Compute L_M(s) using closed form"""
-    zeta_s = zeta(s)
-    correction = mp.mpf(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
-def classical_gamma_ratio(s):
-    """Classical γ(s)/γ(1-s) for ζ(s)"""
-    # γ(s) = π^{-s/2} Γ(s/2)
-    # γ(s)/γ(1-s) = π^{(1-2s)/2} Γ(s/2) / Γ((1-s)/2)
-    return mp.power(pi, (1 - 2*s)/2) * gamma(s/2) / gamma((1-s)/2)
-
-def analyze_log_ratio(s):
-    """
-    Analyze log(R(s)) where R(s) = L_M(1-s)/L_M(s)
+JMAX = 150
+WORKERS = None  # all cores
 
-    Returns: log|R(s)|, arg(R(s)), and comparison with known functions
+def analyze_log_ratio(features):
     """
-    L_s = L_M_closed_form(s, jmax=150)
-    L_1ms = L_M_closed_form(1 - s, jmax=150)
-
-    if fabs(L_s) < 1e-30:
-        return None
-
-    ratio = L_1ms / L_s
+    Analyze log(R(s)) where R(s) = L_M(1-s)/L_M(s), at every grid point
 
-    log_mag = log(fabs(ratio))
-    phase = arg(ratio)
-
-    # Compare with classical
-    classical = classical_gamma_ratio(s)
-    log_classical_mag = log(fabs(classical))
-    classical_phase = arg(classical)
-
-    # Compute the "correction" needed
-    log_correction = log_mag - log_classical_mag
-    phase_correction = phase - classical_phase
-
-    return {
-        'log_mag': float(log_mag),
-        'phase': float(phase),
-        'log_classical': float(log_classical_mag),
-        'classical_phase': float(classical_phase),
-        'log_correction': float(log_correction),
-        'phase_correction': float(phase_correction)
-    }
+    Returns: log|R(s)|, arg(R(s)), and comparison with the classical factor
+    (None where L_M(s) vanishes)
+    """
+    family, params = NAMED["Classical γ"]
+    classical = log_factor_ratio(family, params, features['s'], features['log_zeta_ratio'])[0]
+
+    rows = []
+    for log_R, log_classical in zip(features['log_R'], classical):
+        if np.isnan(log_R):
+            rows.append(None)
+            continue
+        classical_phase = np.angle(np.exp(1j * log_classical.imag))  # principal arg
+        rows.append({
+            'log_mag': log_R.real,
+            'phase': log_R.imag,
+            'log_classical': log_classical.real,
+            'classical_phase': classical_phase,
+            'log_correction': log_R.real - log_classical.real,
+            'phase_correction': log_R.imag - classical_phase
+        })
+    return rows
 
 def main():
     print("=" * 80)
@@ -87,27 +70,22 @@ def main():
 
     results = []
 
-    for sigma in sigma_values:
-        for t in t_values:
-            s = mp.mpc(sigma, t)
-
-            try:
-                data = analyze_log_ratio(s)
-                if data is None:
-                    continue
+    grid = [(sigma, t) for sigma in sigma_values for t in t_values]
+    features = ratio_features([complex(sigma, t) for sigma, t in grid], jmax=JMAX, workers=WORKERS)
 
-                s_str = f"{float(sigma):.1f}+{float(t):.1f}i"
-                print(f"{s_str:<20} {data['log_mag']:<15.6f} {data['phase']:<15.6f} "
-                      f"{data['log_classical']:<15.6f} {data['log_correction']:<15.6f} {data['phase_correction']:<15.6f}")
+    for (sigma, t), data in zip(grid, analyze_log_ratio(features)):
+        if data is None:
+            continue
 
-                results.append({
-                    'sigma': sigma,
-                    't': t,
-                    **data
-                })
+        s_str = f"{float(sigma):.1f}+{float(t):.1f}i"
+        print(f"{s_str:<20} {data['log_mag']:<15.6f} {data['phase']:<15.6f} "
+              f"{data['log_classical']:<15.6f} {data['log_correction']:<15.6f} {data['phase_correction']:<15.6f}")
 
-            except Exception as e:
-                print(f"{sigma}+{t}i: ERROR: {e}")
+        results.append({
+            'sigma': sigma,
+            't': t,
+            **data
+        })
 
     print()
     print("=" * 80)
@@ -143,6 +121,34 @@ def main():
                 std_log_corr = (sum((r['log_correction'] - avg_log_corr)**2 for r in sigma_results) / len(sigma_results))**0.5
                 print(f"  σ={sigma:.1f}: avg Δlog = {avg_log_corr:.6f} ± {std_log_corr:.6f}")
 
+    print()
+    print("=" * 80)
+    print("Candidate Search")
+    print("=" * 80)
+    print()
+
+    candidates = candidate_grid(Q=np.linspace(0.5, 4, 36), lam=np.linspace(0, 2, 21),
+                                mu=np.linspace(0, 1, 11), alpha=np.linspace(-2, 2, 41))
+    candidates += list(NAMED.values())
+    ranking = score_candidates(features, candidates, workers=WORKERS)
+    store = SearchStore()
+    run = store.add_run("grid_search_gamma", features, ranking)
+
+    print(f"Scored {len(candidates)} candidates γ(s)/γ(1-s) = Q^(1-2s) Γ(λs+μ)/Γ(λ(1-s)+μ) (ζ(s)/ζ(1-s))^α")
+    print(f"on {len(grid)} points (run {run} in {store.path})")
+    print()
+    print(f"{'rank':<6} {'candidate':<45} {'rms|Δlog R|':<14} {'rms Δlog':<12} {'rms Δphase':<12}")
+    print("-" * 90)
+    for r in store.top(run, limit=10):
+        print(f"{r['rank']:<6} {r['name']:<45} {r['score']:<14.6f} {r['mag_rms']:<12.6f} {r['phase_rms']:<12.6f}")
+    print()
+    seen = set()
+    for rank, r in enumerate(ranking, 1):
+        name = describe(r['family'], r['params'])
+        if name in NAMED and name not in seen:
+            seen.add(name)
+            print(f"{rank:<6} {name:<45} {r['score']:<14.6f} {r['mag_rms']:<12.6f} {r['phase_rms']:<12.6f}")
+
     print()
     print("=" * 80)
     print("Next Steps")
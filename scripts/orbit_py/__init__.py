@@ -0,0 +1,101 @@
+"""
+orbit_py: shared numerical helpers for the Python scripts
+
+One implementation of the helpers that used to be pasted into each
+script, so a speedup lands everywhere at once:
+
+  arith      tau(n), M(n), divisors(n), is_prime(n), factorize(n)
+  lfunc      partial_zeta, correction_sum, correction_tail,
+             L_M_closed_form, L_M_direct,
+             correction_checkpoints, L_M_checkpoints,
+             L_M_closed_form_many, L_M_closed_form_grid, L_M_logderiv,
+             hurwitz_zeta_range, L_M_hurwitz, gamma_classical, classical_gamma_ratio
+  fastpath   zeta_np, L_M_closed_form_np, L_M_scan, phase_scan,
+             zeta_deriv_np, L_M_logderiv_np, phase_derivative_np, phase_increment
+             (complex128, escalating to mpmath near zeros)
+  riemann_siegel
+             rs_theta, theta_exact, hardy_Z, zeta_critical, L_M_critical, phase_critical
+             (O(√t) critical-line evaluation for large t)
+  sieve      M_table, tau_table, M_segments, M_partial_sums
+  summatory  sum_M, sum_M_checkpoints, divisor_summatory
+  softmin    soft_min_squared, soft_min_vector, soft_min_batch, compute_F_n,
+             compute_F_n_batch (log-sum-exp over all d at once, windowed to the
+             lattice points nearest n), SoftMinSeries (F_n and its s-derivatives
+             at many s from one soft-min vector)
+  exponents  scan_exponents, ExponentStore (s*(n) over n ranges, process pool,
+             resumable block files in cache/optimal_exponents/)
+  sweep      phase_sweep, critical_phase, PhaseUnwrapper, adaptive_phase_grid
+             (process-pool sweeps of θ(t), adaptive t-grids for unwrapping)
+  zeros      zeta_zeros, L_M_zeros, find_zeta_zeros, find_L_M_zeros, count_L_M_zeros,
+             ZeroCatalog, write_catalog (binary catalogs in cache/zeros/)
+  convergence
+             convergence_record, fit_rate, classify, write_records
+             (early-stopping jmax sweeps with machine-readable records)
+  quadrature tanh_sinh, polylog_exp, L_M_integral
+             (tanh-sinh with nodes cached per precision, batched Li_s(e^{-t}))
+  laurent    zeta_laurent, correction_taylor, L_M_laurent, laurent_contour
+             (Laurent coefficients at s = 1 by series or contour sampling)
+  gamma_search
+             ratio_features, score_candidates, candidate_grid, SearchStore
+             (R(s) once per point, vectorized γ-candidate scoring, SQLite rankings)
+  field      scan_strip, StripField
+             (tiled σ × t scans into memmapped arrays, FE and closed-form residuals)
+  cache      cached, DiskCache (persistent memoization, cache/orbit_py.sqlite)
+
+Scripts in scripts/ import it directly (the script directory is on
+sys.path when run as python3 scripts/<name>.py):
+
+  from orbit_py import L_M_closed_form, gamma_classical
+
+Benchmarks and consistency checks against the original implementations:
+
+  cd scripts && python3 -m orbit_py.bench
+"""
+
+from .arith import factorize, tau, M, divisors, is_prime
+from .lfunc import (partial_zeta, correction_sum, correction_tail,
+                    correction_checkpoints, L_M_checkpoints,
+                    L_M_closed_form, L_M_direct, L_M_closed_form_many, L_M_closed_form_grid,
+                    L_M_logderiv, hurwitz_zeta_range, L_M_hurwitz, gamma_classical, classical_gamma_ratio)
+from .fastpath import (zeta_np, L_M_closed_form_np, L_M_scan, phase_scan,
+                       zeta_deriv_np, L_M_logderiv_np, phase_derivative_np, phase_increment)
+from .riemann_siegel import rs_theta, theta_exact, hardy_Z, zeta_critical, L_M_critical, phase_critical
+from .sieve import M_table, tau_table, M_segments, M_partial_sums
+from .summatory import sum_M, sum_M_checkpoints, divisor_summatory
+from .softmin import (soft_min_squared, soft_min_vector, soft_min_batch, compute_F_n,
+                      compute_F_n_batch, SoftMinSeries)
+from .exponents import scan_exponents, ExponentStore
+from .sweep import phase_sweep, critical_phase, PhaseUnwrapper, adaptive_phase_grid
+from .zeros import (zeta_zeros, L_M_zeros, find_zeta_zeros, find_L_M_zeros, count_L_M_zeros,
+                    ZeroCatalog, write_catalog)
+from .convergence import convergence_record, fit_rate, classify, write_records
+from .quadrature import tanh_sinh, polylog_exp, L_M_integral
+from .laurent import zeta_laurent, correction_taylor, L_M_laurent, laurent_contour
+from .gamma_search import ratio_features, score_candidates, candidate_grid, SearchStore
+from .field import scan_strip, StripField
+from .cache import cached, DiskCache
+
+__all__ = [
+    'factorize', 'tau', 'M', 'divisors', 'is_prime',
+    'partial_zeta', 'correction_sum', 'correction_tail',
+    'correction_checkpoints', 'L_M_checkpoints',
+    'L_M_closed_form', 'L_M_direct', 'L_M_closed_form_many', 'L_M_closed_form_grid',
+    'L_M_logderiv', 'hurwitz_zeta_range', 'L_M_hurwitz', 'gamma_classical', 'classical_gamma_ratio',
+    'zeta_np', 'L_M_closed_form_np', 'L_M_scan', 'phase_scan',
+    'zeta_deriv_np', 'L_M_logderiv_np', 'phase_derivative_np', 'phase_increment',
+    'rs_theta', 'theta_exact', 'hardy_Z', 'zeta_critical', 'L_M_critical', 'phase_critical',
+    'M_table', 'tau_table', 'M_segments', 'M_partial_sums',
+    'sum_M', 'sum_M_checkpoints', 'divisor_summatory',
+    'soft_min_squared', 'soft_min_vector', 'soft_min_batch', 'compute_F_n',
+    'compute_F_n_batch', 'SoftMinSeries',
+    'scan_exponents', 'ExponentStore',
+    'phase_sweep', 'critical_phase', 'PhaseUnwrapper', 'adaptive_phase_grid',
+    'zeta_zeros', 'L_M_zeros', 'find_zeta_zeros', 'find_L_M_zeros', 'count_L_M_zeros',
+    'ZeroCatalog', 'write_catalog',
+    'convergence_record', 'fit_rate', 'classify', 'write_records',
+    'tanh_sinh', 'polylog_exp', 'L_M_integral',
+    'zeta_laurent', 'correction_taylor', 'L_M_laurent', 'laurent_contour',
+    'ratio_features', 'score_candidates', 'candidate_grid', 'SearchStore',
+    'scan_strip', 'StripField',
+    'cached', 'DiskCache',
+]
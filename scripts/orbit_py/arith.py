@@ -0,0 +1,93 @@
+"""
+Divisor and primality helpers
+
+  tau(n)      - number of divisors of n
+  M(n)        - count of divisors d with 2 ≤ d ≤ √n = floor((tau(n)-1)/2)
+  divisors(n) - sorted list of all divisors of n
+  is_prime(n) - deterministic primality test
+
+tau and divisors go through the prime factorization, which stops as soon
+as the unfactored part is 1 or prime, instead of trial-dividing by every
+d ≤ √n. is_prime uses trial division for small n and deterministic
+Miller-Rabin above that.
+"""
+
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def factorize(n):
+    """Prime factorization of n ≥ 1 as a list of (p, e) pairs, p increasing"""
+    factors = []
+    for p in (2, 3):
+        if n % p == 0:
+            e = 0
+            while n % p == 0:
+                n //= p
+                e += 1
+            factors.append((p, e))
+
+    # Remaining candidates are 6k ± 1
+    p, step = 5, 2
+    while p * p <= n:
+        if n % p == 0:
+            e = 0
+            while n % p == 0:
+                n //= p
+                e += 1
+            factors.append((p, e))
+        p += step
+        step = 6 - step
+
+    if n > 1:
+        factors.append((n, 1))
+    return factors
+
+def tau(n):
+    """Number of divisors of n"""
+    count = 1
+    for _, e in factorize(n):
+        count *= e + 1
+    return count
+
+def M(n):
+    """M(n) = count of divisors d where 2 ≤ d ≤ √n = floor((tau(n)-1)/2)"""
+    return (tau(n) - 1) // 2
+
+def divisors(n):
+    """All divisors of n in increasing order"""
+    divs = [1]
+    for p, e in factorize(n):
+        divs = [d * p**k for d in divs for k in range(e + 1)]
+    return sorted(divs)
+
+def is_prime(n):
+    """Primality test (deterministic for n < 3.3·10^24)"""
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < 43 * 43:
+        return True
+
+    # Miller-Rabin; these base sets are deterministic below the given bounds
+    if n < 3215031751:
+        bases = _SMALL_PRIMES[:4]
+    elif n < 341550071728321:
+        bases = _SMALL_PRIMES[:7]
+    else:
+        bases = _SMALL_PRIMES
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
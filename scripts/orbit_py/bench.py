@@ -0,0 +1,480 @@
+"""
+Benchmark and consistency suite for orbit_py
+
+Each case runs the original per-script implementation (kept below as the
+reference) and the orbit_py version on the same inputs, checks that the
+results agree and reports both timings:
+
+  cd scripts && python3 -m orbit_py.bench
+  cd scripts && python3 -m orbit_py.bench --quick
+
+Exits with status 1 if any case disagrees with its reference.
+
+--precision runs the L_M evaluators instead (closed form with and without
+tail, its complex128 version, direct Dirichlet sum, Hurwitz form, integral
+form) over STANDARD_S × DPS_LEVELS × each evaluator's truncations, and
+records per run
+
+  wall time (best of up to --repeat runs within 0.5 s), peak traced memory
+  (tracemalloc, separate run) and relative error against L_M = (ζ² + ζ(2s))/2 - ζ at
+  max(DPS_LEVELS) + 20 digits
+
+The run is appended as one JSON line to --history (default
+cache/bench/history.jsonl) and compared with the latest earlier run:
+cases that got more than 1.5× slower or lost more than a digit are
+listed, and lost accuracy exits with status 1.
+
+  cd scripts && python3 -m orbit_py.bench --precision --quick
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import mpmath
+import numpy as np
+from mpmath import mp
+
+from . import arith, cache, fastpath, field, lfunc, quadrature, sieve, softmin, summatory, zeros
+
+# ============================================================================
+# REFERENCE IMPLEMENTATIONS (as previously pasted into scripts/)
+# ============================================================================
+
+def _ref_tau(n):
+    count = 0
+    sqrt_n = int(n**0.5) + 1
+    for d in range(1, sqrt_n + 1):
+        if d * d > n:
+            break
+        if n % d == 0:
+            count += 1 if d * d == n else 2
+    return count
+
+def _ref_M(n):
+    return (_ref_tau(n) - 1) // 2
+
+def _ref_divisors(n):
+    divs = []
+    for i in range(1, int(np.sqrt(n)) + 1):
+        if n % i == 0:
+            divs.append(i)
+            if i != n // i:
+                divs.append(n // i)
+    return sorted(divs)
+
+def _ref_is_prime(n):
+    if n < 2:
+        return False
+    if n == 2:
+        return True
+    if n % 2 == 0:
+        return False
+    for i in range(3, int(np.sqrt(n)) + 1, 2):
+        if n % i == 0:
+            return False
+    return True
+
+def _ref_correction_sum(s, jmax):
+    total = mp.mpc(0)
+    for j in range(2, jmax + 1):
+        H = sum(mp.power(k, -s) for k in range(1, j))
+        total += H / mp.power(j, s)
+    return total
+
+def _ref_L_M_direct(s, nmax):
+    total = mp.mpc(0)
+    for n in range(1, nmax + 1):
+        total += _ref_M(n) / mp.power(n, s)
+    return total
+
+def _ref_soft_min_squared(x, d, alpha=7.0):
+    max_k = x // d
+    distances_sq = [(x - (k*d + d**2))**2 for k in range(max_k + 1)]
+    neg_dist_sq = [-alpha * d for d in distances_sq]
+    M = max(neg_dist_sq)
+    log_sum_exp = M + np.log(sum(np.exp(nd - M) for nd in neg_dist_sq))
+    return -log_sum_exp / alpha
+
+def _ref_compute_F_n(n, s, alpha=7.0, max_d=500):
+    cutoff = min(max_d, 10 * n)
+    terms = []
+    for d in range(2, cutoff + 1):
+        soft_min = _ref_soft_min_squared(n, d, alpha)
+        if soft_min > 0:
+            terms.append(soft_min ** (-s))
+    return sum(terms)
+
+# ============================================================================
+# CASES
+# ============================================================================
+
+def _cached_calls(s, jmax):
+    """
+    L_M_closed_form(s, jmax) through a fresh DiskCache, called as f(s, jmax),
+    f(s, jmax=jmax) and f(s) (jmax the default): value, uncached calls, entries
+    """
+    calls = []
+
+    def closed_form(s, jmax=jmax):
+        calls.append(s)
+        return lfunc.L_M_closed_form(s, jmax)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = cache.DiskCache(Path(tmp) / "bench.sqlite")
+        f = cache.cached(closed_form, cache=store)
+        values = [f(s, jmax), f(s, jmax=jmax), f(s)]
+        entries = store.stats()['entries']
+    return [values, len(calls), entries]
+
+def _zeta_zero_heights(count):
+    """Heights of the first count zeta zeros, computed into a fresh catalog"""
+    with tempfile.TemporaryDirectory() as tmp:
+        return zeros.zeta_zeros(count, dps=mp.dps, workers=1, catalog_dir=tmp)
+
+def _cases(quick):
+    """List of (name, reference thunk, orbit_py thunk, relative tolerance)"""
+    scale = 10 if quick else 1
+
+    n_range = range(1, 20001 // scale)
+    prime_range = range(1, 50001 // scale)
+    large_range = range(10**10, 10**10 + 200 // scale)
+    checkpoints = [10, 100, 1000, n_range[-1]]
+    s_crit = mp.mpc(0.5, 14.134725)
+    jmax = 50 if quick else 200
+    nmax = 2000 // scale
+    grid = 200 // scale
+    x = 97 if quick else 997
+    nodes = [mp.mpf(29) * (m + 1) ** 2 / grid**2 for m in range(grid)]
+    field_sigma, field_t = np.linspace(0.1, 0.9, 5), 10 + 0.125 * np.arange(grid)
+
+    return [
+        ("tau(n)",
+         lambda: [_ref_tau(n) for n in n_range],
+         lambda: [arith.tau(n) for n in n_range], 0),
+        ("M(n)",
+         lambda: [_ref_M(n) for n in n_range],
+         lambda: [arith.M(n) for n in n_range], 0),
+        ("divisors(n)",
+         lambda: [_ref_divisors(n) for n in n_range],
+         lambda: [arith.divisors(n) for n in n_range], 0),
+        ("is_prime(n)",
+         lambda: [_ref_is_prime(n) for n in prime_range],
+         lambda: [arith.is_prime(n) for n in prime_range], 0),
+        ("tau(n), n ~ 1e10",
+         lambda: [_ref_tau(n) for n in large_range],
+         lambda: [arith.tau(n) for n in large_range], 0),
+        ("is_prime(n), n ~ 1e10",
+         lambda: [_ref_is_prime(n) for n in large_range],
+         lambda: [arith.is_prime(n) for n in large_range], 0),
+        (f"M_table(N), N={n_range[-1]}",
+         lambda: [_ref_M(n) for n in n_range],
+         lambda: sieve.M_table(n_range[-1])[1:].tolist(), 0),
+        (f"tau_table(N), N={n_range[-1]}",
+         lambda: [_ref_tau(n) for n in n_range],
+         lambda: sieve.tau_table(n_range[-1])[1:].tolist(), 0),
+        (f"M_segments(N), N={n_range[-1]}",
+         lambda: [_ref_M(n) for n in n_range],
+         lambda: np.concatenate([b for _, b in sieve.M_segments(n_range[-1], 1000)]).tolist(), 0),
+        (f"sum_M_checkpoints, x <= {n_range[-1]}",
+         lambda: [sum(_ref_M(n) for n in range(1, x + 1)) for x in checkpoints],
+         lambda: [summatory.sum_M_checkpoints(checkpoints)[x] for x in checkpoints], 0),
+        (f"correction_sum jmax={jmax}",
+         lambda: _ref_correction_sum(s_crit, jmax),
+         lambda: lfunc.correction_sum(s_crit, jmax), 1e-20),
+        ("correction_sum tail jmax=20",
+         lambda: (mp.zeta(s_crit)**2 - mp.zeta(2*s_crit)) / 2,
+         lambda: lfunc.correction_sum(s_crit, 20, tail=True), 1e-20),
+        (f"L_M_closed_form_grid n={grid}",
+         lambda: [lfunc.L_M_closed_form(mp.mpc(0.5, 10 + 0.125 * m), jmax) for m in range(grid)],
+         lambda: lfunc.L_M_closed_form_grid(10, 0.125, grid, jmax=jmax)[1], 1e-20),
+        (f"L_M_scan n={grid}",
+         lambda: [complex(lfunc.L_M_closed_form(mp.mpc(0.5, 10 + 0.125 * m), jmax)) for m in range(grid)],
+         lambda: fastpath.L_M_scan(0.5 + 1j * (10 + 0.125 * np.arange(grid)), jmax)[0].tolist(), 1e-10),
+        (f"L_M_logderiv_np n={grid}",
+         lambda: [complex(mp.diff(lambda z: lfunc.L_M_closed_form(z, jmax), s) / lfunc.L_M_closed_form(s, jmax))
+                  for s in (mp.mpc(0.5, 10 + 0.125 * m) for m in range(grid))],
+         lambda: fastpath.L_M_logderiv_np(0.5 + 1j * (10 + 0.125 * np.arange(grid)), jmax)[1].tolist(), 1e-10),
+        (f"field tile 5x{grid}",
+         lambda: fastpath.L_M_closed_form_np((field_sigma[:, None] + 1j * field_t).ravel(), jmax)[0].tolist(),
+         lambda: field._tile_values(field_sigma, field_t, jmax)[0]['L'].ravel().tolist(), 1e-10),
+        (f"hurwitz_zeta_range d<={jmax}",
+         lambda: [mp.zeta(s_crit, d) for d in range(2, jmax + 1)],
+         lambda: lfunc.hurwitz_zeta_range(s_crit, jmax, d_min=2)[0], 1e-20),
+        (f"polylog_exp n={grid}",
+         lambda: [mp.polylog(s_crit + 1, mp.exp(-t)) for t in nodes],
+         lambda: quadrature.polylog_exp(s_crit + 1, nodes), 1e-20),
+        (f"L_M_direct nmax={nmax}",
+         lambda: _ref_L_M_direct(2, nmax),
+         lambda: lfunc.L_M_direct(2, nmax), 1e-20),
+        (f"soft_min_squared x={x}",
+         lambda: [_ref_soft_min_squared(x, d) for d in range(2, 501)],
+         lambda: [softmin.soft_min_squared(x, d) for d in range(2, 501)], 1e-12),
+        (f"compute_F_n n={x}",
+         lambda: _ref_compute_F_n(x, 2.0),
+         lambda: softmin.compute_F_n(x, 2.0), 1e-12),
+        (f"compute_F_n_batch n<{x // 4}",
+         lambda: [_ref_compute_F_n(n, 1.0) for n in range(2, x // 4)],
+         lambda: softmin.compute_F_n_batch(np.arange(2, x // 4), 1.0), 1e-12),
+        (f"cached L_M_closed_form jmax={jmax}",
+         lambda: [[lfunc.L_M_closed_form(s_crit, jmax)] * 3, 1, 1],
+         lambda: _cached_calls(s_crit, jmax), 0),
+        ("zeta_zeros n<=5",
+         lambda: [mp.zetazero(n).imag for n in range(1, 6)],
+         lambda: _zeta_zero_heights(5), 1e-20),
+        ("find_L_M_zeros 10<t<40",
+         lambda: zeros.count_L_M_zeros(10, 40)[0],
+         lambda: len(zeros.find_L_M_zeros(10, 40, workers=1)), 0),
+    ]
+
+# ============================================================================
+# PRECISION SUITE
+# ============================================================================
+
+STANDARD_S = (2, 1.5 + 5j, 1.1 + 30j, 0.5 + 14.134725j, 0.7 + 20j)
+DPS_LEVELS = (15, 30, 50)
+DEFAULT_HISTORY = "cache/bench/history.jsonl"
+
+# name -> (evaluate(s, truncation), truncations, quick truncations)
+EVALUATORS = {
+    'closed_form': (lambda s, J: lfunc.L_M_closed_form(s, J), (50, 200, 1000), (200,)),
+    'closed_form_tail': (lambda s, J: lfunc.L_M_closed_form(s, J, tail=True), (20, 50, 200), (50,)),
+    'closed_form_np': (lambda s, J: mp.mpc(fastpath.L_M_closed_form_np([complex(s)], J)[0][0]),
+                       (50, 200, 1000), (200,)),
+    'direct': (lambda s, N: lfunc.L_M_direct(s, N), (1000, 10000), (1000,)),
+    'hurwitz': (lambda s, D: lfunc.L_M_hurwitz(s, D), (50, 200, 1000), (200,)),
+    'integral': (lambda s, T: quadrature.L_M_integral(s, T)[0], (20, 40), (30,)),
+}
+
+def _reference_L_M(s, dps):
+    with mp.workdps(dps):
+        s = mp.mpmathify(s)
+        z = mp.zeta(s)
+        return (z * z + mp.zeta(2 * s)) / 2 - z
+
+def _timed_budget(func, budget=0.5, max_repeat=5):
+    """Best wall time of up to max_repeat runs, stopping once budget seconds are spent"""
+    best, spent, result = math.inf, 0.0, None
+    for _ in range(max_repeat):
+        t0 = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - t0
+        best, spent = min(best, elapsed), spent + elapsed
+        if spent >= budget:
+            break
+    return result, best
+
+def _peak_memory(func):
+    """Peak bytes traced while func runs"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def _git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, check=True, cwd=Path(__file__).parent)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_precision(quick=False, repeat=5, evaluators=None):
+    """Time, memory and error of every evaluator; returns the run record"""
+    s_values = STANDARD_S[::2] if quick else STANDARD_S
+    dps_levels = DPS_LEVELS[:2] if quick else DPS_LEVELS
+    names = evaluators or list(EVALUATORS)
+    ref_dps = max(dps_levels) + 20
+    references = {s: _reference_L_M(s, ref_dps) for s in s_values}
+
+    print(f"{'evaluator':<18} {'s':<18} {'dps':<5} {'trunc':<7} {'time [s]':<11} {'peak [KiB]':<12} {'rel error':<10}")
+    print("-" * 85)
+
+    results = []
+    for name in names:
+        evaluate, truncations, quick_truncations = EVALUATORS[name]
+        for s in s_values:
+            for dps in dps_levels:
+                for trunc in (quick_truncations if quick else truncations):
+                    with mp.workdps(dps):
+                        s_mp = mp.mpmathify(s)
+                        value, elapsed = _timed_budget(lambda: evaluate(s_mp, trunc), max_repeat=repeat)
+                        peak = _peak_memory(lambda: evaluate(s_mp, trunc))
+                    with mp.workdps(ref_dps):
+                        ref = references[s]
+                        error = float(abs(value - ref) / abs(ref))
+
+                    print(f"{name:<18} {str(s):<18} {dps:<5} {trunc:<7} {elapsed:<11.4f} "
+                          f"{peak / 1024:<12.1f} {error:<10.2e}")
+                    results.append({
+                        'evaluator': name, 's': [s.real, s.imag] if isinstance(s, complex) else [s, 0],
+                        'dps': dps, 'truncation': trunc, 'time': elapsed,
+                        'peak_bytes': peak, 'error': error,
+                    })
+
+    return {
+        'timestamp': time.time(),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'mpmath': mpmath.__version__,
+        'numpy': np.__version__,
+        'quick': quick,
+        'results': results,
+    }
+
+def _case_key(r):
+    return r['evaluator'], tuple(r['s']), r['dps'], r['truncation']
+
+def load_history(path=DEFAULT_HISTORY):
+    """All recorded runs, oldest first"""
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def append_history(record, path=DEFAULT_HISTORY):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+def compare_runs(previous, current, slower=1.5, min_time=0.02, digits=1.0):
+    """
+    (slower, less accurate, more accurate) cases of current against previous
+
+    A case is slower when its time grew by more than `slower`× (and took
+    at least min_time); its accuracy changed when the relative error moved
+    by more than `digits` decimal digits, ignoring errors below 10^-dps.
+    """
+    before = {_case_key(r): r for r in previous['results']}
+    slow, worse, better = [], [], []
+    for r in current['results']:
+        old = before.get(_case_key(r))
+        if old is None:
+            continue
+        if r['time'] > slower * old['time'] and r['time'] > min_time:
+            slow.append((r, old))
+        floor = 10.0 ** -r['dps']
+        new_err, old_err = max(r['error'], floor), max(old['error'], floor)
+        if new_err > old_err * 10 ** digits:
+            worse.append((r, old))
+        elif old_err > new_err * 10 ** digits:
+            better.append((r, old))
+    return slow, worse, better
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def _timed(func, repeat):
+    """Run func repeat times, return (last result, best wall time)"""
+    best = math.inf
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - t0)
+    return result, best
+
+def _deviation(ref, new):
+    """Largest relative deviation between two results (inf on structural mismatch)"""
+    if isinstance(ref, (list, tuple)):
+        if len(ref) != len(new):
+            return math.inf
+        return max((_deviation(a, b) for a, b in zip(ref, new)), default=0.0)
+    if isinstance(ref, (bool, int)) and isinstance(new, (bool, int)):
+        return 0.0 if ref == new else math.inf
+    return float(abs(ref - new) / max(1, abs(ref)))
+
+def run(quick=False, repeat=3, dps=30):
+    """Run all cases and print a table; returns a list of result dicts"""
+    results = []
+
+    print(f"{'case':<30} {'reference [s]':<15} {'orbit_py [s]':<15} {'speedup':<10} {'deviation':<12} {'ok':<4}")
+    print("-" * 90)
+
+    with mp.workdps(dps):
+        for name, reference, optimized, tol in _cases(quick):
+            ref_value, ref_time = _timed(reference, 1)
+            new_value, new_time = _timed(optimized, repeat)
+
+            dev = _deviation(ref_value, new_value)
+            ok = dev <= tol
+            speedup = ref_time / new_time if new_time > 0 else math.inf
+
+            print(f"{name:<30} {ref_time:<15.4f} {new_time:<15.4f} {speedup:<10.1f} {dev:<12.2e} {'✓' if ok else '✗':<4}")
+
+            results.append({
+                'case': name,
+                'reference_time': ref_time,
+                'time': new_time,
+                'speedup': speedup,
+                'deviation': dev,
+                'ok': ok,
+            })
+
+    return results
+
+def _describe_case(r):
+    return f"{r['evaluator']} s={complex(*r['s'])} dps={r['dps']} trunc={r['truncation']}"
+
+def main_precision(args):
+    record = run_precision(quick=args.quick, repeat=args.repeat or 5, evaluators=args.evaluator)
+    earlier = [run for run in load_history(args.history) if run.get('quick') == args.quick]
+    append_history(record, args.history)
+    print()
+    print(f"Recorded {len(record['results'])} cases in {args.history}")
+    if not earlier:
+        return
+
+    slow, worse, better = compare_runs(earlier[-1], record)
+    print(f"Against the previous run (revision {earlier[-1].get('revision')}):")
+    for r, old in slow:
+        print(f"  slower      {_describe_case(r)}: {old['time']:.4f} s -> {r['time']:.4f} s")
+    for r, old in worse:
+        print(f"  less exact  {_describe_case(r)}: {old['error']:.2e} -> {r['error']:.2e}")
+    for r, old in better:
+        print(f"  more exact  {_describe_case(r)}: {old['error']:.2e} -> {r['error']:.2e}")
+    if not (slow or worse or better):
+        print("  no changes")
+    if worse:
+        sys.exit(1)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--quick', action='store_true', help='smaller inputs')
+    parser.add_argument('--repeat', type=int, default=None, help='timing repetitions (default 3; with --precision at most 5 within 0.5 s)')
+    parser.add_argument('--precision', action='store_true', help='evaluator speed/accuracy suite')
+    parser.add_argument('--evaluator', action='append', choices=list(EVALUATORS),
+                        help='only this evaluator (repeatable, with --precision)')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSON-lines history file')
+    args = parser.parse_args()
+
+    if args.precision:
+        main_precision(args)
+        return
+
+    results = run(quick=args.quick, repeat=args.repeat or 3)
+
+    failed = [r['case'] for r in results if not r['ok']]
+    print()
+    if failed:
+        print(f"✗ {len(failed)} case(s) disagree with reference: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"✓ All {len(results)} cases agree with reference")
+
+if __name__ == "__main__":
+    main()
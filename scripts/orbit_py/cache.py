@@ -0,0 +1,189 @@
+"""
+Persistent, content-addressed memoization for expensive evaluations
+
+  L_M = cached(L_M_closed_form)
+  L_M(mp.mpc(0.5, 14.13), jmax=200)   # computed once, then read from disk
+
+Each call is keyed by a SHA-256 over
+
+  function module + name, a hash of its source, the arguments bound to
+  its signature with defaults applied (mpf/mpc by their exact repr, arrays
+  by dtype/shape/bytes) and mp.prec
+
+so the same (s, jmax, dps) is never computed twice (f(s, 200),
+f(s, jmax=200) and f(s) with default jmax=200 are one entry), a different
+precision is a different entry, and editing the wrapped function
+invalidates its entries. Edits to helpers it calls are not seen: clear() after those.
+
+Results are pickled into one SQLite file (default cache/orbit_py.sqlite,
+override with the ORBIT_PY_CACHE environment variable; ORBIT_PY_CACHE=off
+disables caching). The file is bounded by max_bytes: when a write pushes
+it over, least recently used entries are deleted until it is back under
+90% of the limit. A hit refreshes the entry's access time only when the
+stored one is older than ACCESS_RESOLUTION seconds, so reads of hot
+entries do not take the write lock. SQLite serializes concurrent writers,
+so worker processes can share one cache.
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+from mpmath import mp
+
+DEFAULT_PATH = "cache/orbit_py.sqlite"
+DEFAULT_MAX_BYTES = 1 << 30
+ACCESS_RESOLUTION = 60.0  # seconds; LRU order is kept to this granularity
+
+def _canonical(obj):
+    """Deterministic string form of an argument, exact for mp numbers"""
+    if isinstance(obj, (mp.mpf, mp.mpc)):
+        return repr(obj)
+    if isinstance(obj, np.ndarray):
+        digest = hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest()
+        return f"ndarray({obj.dtype.str},{obj.shape},{digest})"
+    if isinstance(obj, (list, tuple)):
+        inner = ",".join(_canonical(x) for x in obj)
+        return f"{type(obj).__name__}({inner})"
+    if isinstance(obj, dict):
+        inner = ",".join(f"{_canonical(k)}:{_canonical(v)}"
+                         for k, v in sorted(obj.items(), key=lambda kv: repr(kv[0])))
+        return f"dict({inner})"
+    return f"{type(obj).__name__}({obj!r})"
+
+def _bound_arguments(func, args, kwargs):
+    """Arguments by parameter name, defaults filled in (raw args if func has no signature)"""
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+    except (TypeError, ValueError):
+        return tuple(args), dict(kwargs)
+    bound.apply_defaults()
+    return tuple(bound.arguments.items()), {}
+
+def _source_hash(func):
+    """Hash of the function source (falls back to its bytecode)"""
+    try:
+        source = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        source = getattr(getattr(func, '__code__', None), 'co_code', b'')
+    return hashlib.sha256(source).hexdigest()[:16]
+
+class DiskCache:
+    """SQLite-backed key → pickled value store with LRU size bound"""
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(self._connect()) as db, db:
+            db.execute("""CREATE TABLE IF NOT EXISTS entries (
+                              key      TEXT PRIMARY KEY,
+                              func     TEXT,
+                              value    BLOB,
+                              size     INTEGER,
+                              accessed REAL)""")
+            db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed)")
+
+    def _connect(self):
+        # `with db:` commits but does not close, so callers also wrap it in closing()
+        return sqlite3.connect(self.path, timeout=60)
+
+    @staticmethod
+    def key(func, args, kwargs, source_hash=None):
+        """Content address of func(*args, **kwargs) at the current precision"""
+        if source_hash is None:
+            source_hash = _source_hash(func)
+        args, kwargs = _bound_arguments(func, args, kwargs)
+        parts = [func.__module__, func.__qualname__, source_hash,
+                 _canonical(tuple(args)), _canonical(dict(kwargs)), f"prec={mp.prec}"]
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    def get(self, key):
+        """(True, value) on a hit, (False, None) on a miss"""
+        with contextlib.closing(self._connect()) as db, db:
+            row = db.execute("SELECT value, accessed FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return False, None
+            now = time.time()
+            if now - row[1] > ACCESS_RESOLUTION:
+                db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return True, pickle.loads(row[0])
+
+    def set(self, key, value, func_name=""):
+        """Store value under key, then evict LRU entries if over max_bytes"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with contextlib.closing(self._connect()) as db, db:
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                       (key, func_name, blob, len(blob), time.time()))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(db, total, int(0.9 * self.max_bytes))
+
+    @staticmethod
+    def _evict(db, total, target):
+        rows = db.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        db.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def stats(self):
+        """{'entries': n, 'bytes': total size, 'by_function': {name: n}}"""
+        with contextlib.closing(self._connect()) as db, db:
+            n, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            by_func = dict(db.execute("SELECT func, COUNT(*) FROM entries GROUP BY func"))
+        return {'entries': n, 'bytes': size, 'by_function': by_func}
+
+    def clear(self):
+        with contextlib.closing(self._connect()) as db, db:
+            db.execute("DELETE FROM entries")
+
+_default_cache = None
+
+def default_cache():
+    """The shared DiskCache at $ORBIT_PY_CACHE (None when caching is off)"""
+    global _default_cache
+    path = os.environ.get("ORBIT_PY_CACHE", DEFAULT_PATH)
+    if path.lower() in ("off", "0", "none", ""):
+        return None
+    if _default_cache is None or _default_cache.path != Path(path):
+        _default_cache = DiskCache(path)
+    return _default_cache
+
+def cached(func=None, *, cache=None):
+    """
+    Memoize func on disk; use as cached(f) or @cached / @cached(cache=...)
+
+    The wrapper has the same signature; wrapper.uncached is the original.
+    """
+    if func is None:
+        return functools.partial(cached, cache=cache)
+
+    name = f"{func.__module__}.{func.__qualname__}"
+    source_hash = _source_hash(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        store = cache if cache is not None else default_cache()
+        if store is None:
+            return func(*args, **kwargs)
+        key = DiskCache.key(func, args, kwargs, source_hash)
+        hit, value = store.get(key)
+        if hit:
+            return value
+        value = func(*args, **kwargs)
+        store.set(key, value, name)
+        return value
+
+    wrapper.uncached = func
+    return wrapper
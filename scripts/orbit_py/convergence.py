@@ -0,0 +1,104 @@
+"""
+Convergence diagnostics for checkpointed sums
+
+A checkpoint stream yields (J, S_J) with increasing J, e.g.
+
+  L_M_checkpoints(s, [100, 200, 300, 400, 500])     (lfunc, one pass over j)
+
+convergence_record consumes it, stops as soon as |S_J - S_J'| between
+consecutive checkpoints drops below tol, and returns a JSON-serializable
+record instead of printed verdicts:
+
+  {'s': [re, im], 'checkpoints': [{'jmax', 're', 'im', 'abs', 'change'}, ...],
+   'final_change': |ΔS| at the last checkpoint,
+   'rate': p from a least-squares fit |ΔS_J| ≈ A·J^{-p} (None if < 2 changes),
+   'status': first level name whose threshold final_change is below, else 'fail',
+   'stopped_early': bool, 'tol': tol}
+
+p > 0 means the changes shrink (with equally spaced checkpoints a
+remainder decaying like J^{-q} gives p ≈ q + 1), p ≈ 0 an oscillating or
+stalled sum, p < 0 divergence.
+
+  record = convergence_record(L_M_checkpoints(s, jmax_values), tol=1e-6)
+  write_records("cache/convergence/full_LM.json", records)
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+
+from mpmath import mp, fabs
+
+# (status, threshold on the last change), strictest first
+DEFAULT_LEVELS = (('strong', 1e-6), ('good', 1e-4), ('weak', 1e-2))
+
+def fit_rate(jmax_values, changes):
+    """p in |ΔS_J| ≈ A·J^{-p} by least squares in log-log (None if underdetermined)"""
+    points = [(math.log(j), math.log(c)) for j, c in zip(jmax_values, changes) if c > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return -sxy / sxx if sxx > 0 else None
+
+def classify(change, levels=DEFAULT_LEVELS):
+    """Name of the first level whose threshold change is below, else 'fail'"""
+    if change is None:
+        return 'fail'
+    for name, threshold in levels:
+        if change < threshold:
+            return name
+    return 'fail'
+
+def convergence_record(stream, tol=None, levels=DEFAULT_LEVELS, s=None):
+    """
+    Consume a (J, S_J) stream into a convergence record (see module docstring)
+
+    With tol set, the stream is abandoned at the first checkpoint whose
+    change is below tol, so later (more expensive) checkpoints are never
+    summed.
+    """
+    checkpoints = []
+    previous = None
+    stopped_early = False
+    for jmax, value in stream:
+        value = mp.mpc(value)
+        change = float(fabs(value - previous)) if previous is not None else None
+        checkpoints.append({
+            'jmax': int(jmax),
+            're': float(value.real),
+            'im': float(value.imag),
+            'abs': float(fabs(value)),
+            'change': change,
+        })
+        previous = value
+        if tol is not None and change is not None and change < tol:
+            stopped_early = True
+            break
+
+    changes = [c['change'] for c in checkpoints[1:]]
+    final_change = changes[-1] if changes else None
+    record = {
+        'checkpoints': checkpoints,
+        'final_change': final_change,
+        'rate': fit_rate([c['jmax'] for c in checkpoints[1:]], changes),
+        'status': classify(final_change, levels),
+        'stopped_early': stopped_early,
+        'tol': tol,
+    }
+    if s is not None:
+        s = mp.mpc(s)
+        record['s'] = [float(s.real), float(s.imag)]
+    return record
+
+def write_records(path, records):
+    """Write a list of records as JSON (atomically, via a temporary file)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(records, f, indent=1)
+    os.replace(tmp, path)
@@ -0,0 +1,156 @@
+"""
+Optimal exponents s*(n) = argmin_s F_n(s) over large n ranges, in resumable blocks
+
+n is cut into fixed blocks [b·B, (b+1)·B) (B = block, n ≥ 2), so ranges
+that overlap share blocks. Missing blocks run on a process pool; each
+worker writes its block to block_<b>.npz under a temporary name and renames
+it, so a block file is either complete or absent, and an interrupted scan
+resumes from the missing blocks. Nothing is merged until asked for:
+
+  store = scan_exponents(2, 100_000, alpha=7.0)
+  r = store.merge(2, 100_000)     # {'n', 's_opt', 'F_min', 'has_minimum', 'is_prime'}
+
+s_opt is NaN where F_n is monotonic on s_bounds (has_minimum False) and
+F_min is then F_n at the better bound, as in SoftMinSeries.minimize.
+
+A store is a directory (default cache/optimal_exponents/, named by a hash of
+alpha, s_bounds, tol and block) holding meta.json and the block files.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+from .arith import is_prime
+from .softmin import SoftMinSeries
+
+DEFAULT_DIR = "cache/optimal_exponents"
+
+FIELDS = ('n', 's_opt', 'F_min', 'has_minimum', 'is_prime')
+
+# ============================================================================
+# ONE BLOCK
+# ============================================================================
+
+def _block_range(index, block):
+    return max(2, index * block), (index + 1) * block
+
+def _scan_block(task):
+    path, index, block, alpha, s_bounds, tol = task
+    n = np.arange(*_block_range(index, block), dtype=np.int64)
+    s_opt = np.full(len(n), np.nan)
+    F_min = np.empty(len(n))
+    has_minimum = np.zeros(len(n), dtype=bool)
+    for i, value in enumerate(n.tolist()):
+        s, F_min[i], has_minimum[i] = SoftMinSeries(value, alpha).minimize(s_bounds, tol)
+        if has_minimum[i]:
+            s_opt[i] = s
+    primes = np.array([is_prime(value) for value in n.tolist()], dtype=bool)
+
+    final = Path(path) / f"block_{index:08d}.npz"
+    tmp = final.with_suffix(".npz.tmp")
+    with open(tmp, 'wb') as f:
+        np.savez(f, n=n, s_opt=s_opt, F_min=F_min, has_minimum=has_minimum, is_prime=primes)
+    os.replace(tmp, final)
+    return index
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+class ExponentStore:
+    """Block files of one (alpha, s_bounds, tol, block) configuration"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path / "meta.json") as f:
+            meta = json.load(f)
+        self.alpha = meta['alpha']
+        self.s_bounds = tuple(meta['s_bounds'])
+        self.tol = meta['tol']
+        self.block = meta['block']
+
+    def blocks(self, n_min, n_max):
+        """Indices of the blocks covering n_min..n_max"""
+        return range(max(2, n_min) // self.block, n_max // self.block + 1)
+
+    def has_block(self, index):
+        return (self.path / f"block_{index:08d}.npz").exists()
+
+    def missing(self, n_min, n_max):
+        """Blocks of n_min..n_max not written yet"""
+        return [b for b in self.blocks(n_min, n_max) if not self.has_block(b)]
+
+    def merge(self, n_min, n_max):
+        """
+        Results for n_min ≤ n ≤ n_max from the finished blocks, as arrays by FIELDS
+
+        Blocks not written yet are skipped, so a partial scan can be
+        inspected while it runs.
+        """
+        parts = {name: [] for name in FIELDS}
+        for index in self.blocks(n_min, n_max):
+            if not self.has_block(index):
+                continue
+            with np.load(self.path / f"block_{index:08d}.npz") as data:
+                keep = (data['n'] >= n_min) & (data['n'] <= n_max)
+                for name in FIELDS:
+                    parts[name].append(data[name][keep])
+        return {name: np.concatenate(parts[name]) if parts[name] else np.zeros(0)
+                for name in FIELDS}
+
+def _store_path(alpha, s_bounds, tol, block):
+    key = json.dumps([alpha, list(s_bounds), tol, block])
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return Path(DEFAULT_DIR) / f"alpha{alpha:g}_{digest}"
+
+def _create(path, alpha, s_bounds, tol, block):
+    path.mkdir(parents=True, exist_ok=True)
+    meta = {'alpha': alpha, 's_bounds': list(s_bounds), 'tol': tol, 'block': block}
+    tmp = path / "meta.json.tmp"
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, path / "meta.json")
+
+def scan_exponents(n_min, n_max, alpha=7.0, s_bounds=(0.5, 5.0), tol=1e-10, block=1000,
+                   path=None, workers=None, progress=None):
+    """
+    Compute s*(n) for n_min ≤ n ≤ n_max into an ExponentStore
+
+    block      n per block file (and per task)
+    path       store directory (default: cache/optimal_exponents/alpha<α>_<hash>)
+    workers    process count (default: all cores; 1 runs in-process)
+    progress   optional callable(done, total), called as blocks finish
+
+    Blocks already on disk are skipped; whole blocks are computed, so
+    the store may hold n somewhat beyond the range asked for.
+    """
+    alpha, tol, s_bounds = float(alpha), float(tol), tuple(map(float, s_bounds))
+    path = Path(path) if path is not None else _store_path(alpha, s_bounds, tol, block)
+    if not (path / "meta.json").exists():
+        _create(path, alpha, s_bounds, tol, block)
+
+    store = ExponentStore(path)
+    if (store.alpha, store.s_bounds, store.tol, store.block) != (alpha, s_bounds, tol, block):
+        raise ValueError(f"{path}: holds a different alpha, s_bounds, tol or block")
+
+    missing = store.missing(n_min, n_max)
+    tasks = [(str(path), index, block, alpha, s_bounds, tol) for index in missing]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        for done, task in enumerate(tasks, 1):
+            _scan_block(task)
+            if progress:
+                progress(done, len(tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_scan_block, task) for task in tasks]
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if progress:
+                    progress(done, len(tasks))
+    return store
@@ -0,0 +1,349 @@
+"""
+Double-precision L_M scans with mpmath fallback
+
+NumPy complex128 versions of the closed form, vectorized over arrays of s:
+
+  ζ(s)   = Σ_{n<N} n^{-s} + N^{-s}/2 + N^{1-s}/(s-1)
+           + Σ_{k=1}^{K} B_{2k}/(2k)! · s(s+1)···(s+2k-2) · N^{-s-2k+1}
+  L_M(s) = ζ(s)[ζ(s)-1] - Σ_{j=2}^jmax H_{j-1}(s)/j^s
+
+Every value comes with a first-order absolute error bound. The dominant
+rounding term on the critical line is exp(-s·log n) itself: the argument
+t·log n is only known to eps·t·log n, so each power carries a relative
+error of about eps·(1 + |s|·log n). Those per-term bounds are propagated
+through the running sums, and the Euler–Maclaurin remainder is bounded
+by the first omitted term.
+
+  zeta_np(s)                          ζ(s) and its error bound
+  correction_np(s, jmax)              C(s) and its error bound
+  L_M_closed_form_np(s, jmax)         L_M(s) and its error bound
+  L_M_scan(s, jmax, tol, dps)         fast path, with points whose relative
+                                      error exceeds tol (i.e. near zeros)
+                                      recomputed by L_M_closed_form at dps
+  phase_scan(t, jmax, tol, dps)       arg(f(s)/f(1-s)) at s = 1/2 + it
+
+Logarithmic derivatives come from the same powers with log n weights:
+
+  zeta_deriv_np(s)                    ζ(s), ζ'(s) and their error bounds
+  correction_deriv_np(s, jmax)        C(s), C'(s) and their error bounds
+  L_M_logderiv_np(s, jmax, tail)      L_M(s), L_M'(s)/L_M(s)
+  phase_derivative_np(t, jmax)        dθ/dt = Re ψ(s/2) - log π - 2·Re(L_M'/L_M)
+  phase_increment(t_a, t_b, jmax)     θ(t_b) - θ(t_a) as ∫ dθ/dt, no unwrapping
+
+Integrals use adaptive Gauss–Legendre panels evaluated all at once.
+
+A 10k-point scan of the critical line takes well under a second, against
+minutes for the mpmath loop.
+"""
+
+import math
+import warnings
+
+import numpy as np
+from mpmath import mp
+from scipy.special import loggamma, psi
+
+from .lfunc import L_M_closed_form
+
+EPS = np.finfo(np.float64).eps
+
+# B_{2k}/(2k)! for k = 1..11 (the last one only bounds the remainder)
+_BERNOULLI_RATIOS = np.array([
+    1/6, -1/30, 1/42, -1/30, 5/66, -691/2730, 7/6, -3617/510,
+    43867/798, -174611/330, 854513/138,
+]) / np.array([math.factorial(2 * k) for k in range(1, 12)], dtype=float)
+
+# Entries of the (points × terms) power matrix per chunk
+_CHUNK_ENTRIES = 1 << 20
+
+def _powers(s, n):
+    """n^{-s} as a (len(s), len(n)) matrix, with its per-entry error bound"""
+    log_n = np.log(n)
+    P = np.exp(-np.outer(s, log_n))
+    err = EPS * (1 + np.outer(np.abs(s), log_n)) * np.abs(P)
+    return P, err
+
+def _chunks(num, width):
+    """Slices over num points such that each chunk has ~_CHUNK_ENTRIES entries"""
+    step = max(1, _CHUNK_ENTRIES // max(width, 1))
+    for lo in range(0, num, step):
+        yield slice(lo, min(lo + step, num))
+
+def _zeta_tail(z, N, K=10):
+    """
+    Euler–Maclaurin part of ζ(z) after Σ_{n<N}, elementwise over an array
+
+    Returns (tail, first omitted term).
+    """
+    N_pow = np.exp(-z * math.log(N))  # N^{-s}
+    tail = N_pow / 2 + N * N_pow / (z - 1)
+
+    # (s)_{2k-1} N^{-s-2k+1}, advanced by (s+2k-1)(s+2k)/N² per k
+    factor = z * N_pow / N
+    for k, b in enumerate(_BERNOULLI_RATIOS[:K], start=1):
+        tail += b * factor
+        factor = factor * (z + 2 * k - 1) * (z + 2 * k) / N**2
+    return tail, np.abs(_BERNOULLI_RATIOS[K] * factor)
+
+def zeta_np(s, N=None, K=10):
+    """
+    ζ(s) by Euler–Maclaurin in complex128, vectorized over s
+
+    N defaults to max(16, max|Im s|) terms, which keeps the remainder
+    below double precision for K = 10. Returns (values, error bounds).
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.complex128))
+    if N is None:
+        N = int(max(16, np.abs(s.imag).max(initial=0) + 1))
+    n = np.arange(1, N, dtype=np.float64)
+
+    values = np.empty_like(s)
+    errors = np.empty(s.shape, dtype=np.float64)
+    for sl in _chunks(len(s), len(n)):
+        z = s[sl]
+        P, err = _powers(z, n)
+        head = P.sum(axis=1)
+        head_err = err.sum(axis=1) + EPS * len(n) * np.abs(P).sum(axis=1)
+
+        tail, remainder = _zeta_tail(z, N, K)
+        values[sl] = head + tail
+        errors[sl] = head_err + remainder + EPS * (1 + np.abs(z) * math.log(N)) * np.abs(tail)
+    return values, errors
+
+def correction_np(s, jmax=200):
+    """C(s) = Σ_{j=2}^jmax H_{j-1}(s)/j^s in complex128, as (values, error bounds)"""
+    s = np.atleast_1d(np.asarray(s, dtype=np.complex128))
+    j = np.arange(2, jmax + 1, dtype=np.float64)
+
+    C = np.empty_like(s)
+    C_err = np.empty(s.shape, dtype=np.float64)
+    for sl in _chunks(len(s), len(j)):
+        P, err = _powers(s[sl], j)
+        # H[:, i] = H_{j-1}(s) for j = j[i]
+        H = 1 + np.cumsum(P, axis=1) - P
+        H_err = np.cumsum(err, axis=1) - err + EPS * np.arange(len(j)) * np.abs(H)
+        C[sl] = (H * P).sum(axis=1)
+        C_err[sl] = (np.abs(H) * err + np.abs(P) * H_err).sum(axis=1) \
+            + EPS * len(j) * (np.abs(H) * np.abs(P)).sum(axis=1)
+    return C, C_err
+
+def closed_form_from_zeta(zeta_s, zeta_err, C, C_err):
+    """L_M = ζ(ζ-1) - C from its parts, propagating the error bounds"""
+    values = zeta_s * (zeta_s - 1) - C
+    errors = np.abs(2 * zeta_s - 1) * zeta_err + C_err \
+        + EPS * (np.abs(zeta_s) * (np.abs(zeta_s) + 1) + np.abs(C))
+    return values, errors
+
+def L_M_closed_form_np(s, jmax=200):
+    """
+    L_M_closed_form in complex128, vectorized over s
+
+    Returns (values, error bounds); the bound is absolute, compare it with
+    |L_M(s)| for the relative accuracy.
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.complex128))
+    return closed_form_from_zeta(*zeta_np(s), *correction_np(s, jmax))
+
+def L_M_scan(s, jmax=200, tol=1e-10, dps=30):
+    """
+    L_M over an array of s: complex128 where accurate, mpmath where not
+
+    A point is escalated to L_M_closed_form at `dps` digits when its
+    estimated relative error exceeds tol, which in practice means the
+    neighbourhood of a zero of L_M. Returns (values, relative error
+    estimates, escalated mask).
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.complex128))
+    values, errors = L_M_closed_form_np(s, jmax)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rel = errors / np.abs(values)
+    escalate = ~(rel <= tol)
+
+    with mp.workdps(dps):
+        for i in np.flatnonzero(escalate):
+            values[i] = complex(L_M_closed_form(mp.mpc(s[i].real, s[i].imag), jmax))
+            rel[i] = max(EPS, 10.0 ** (-dps))
+    return values, rel, escalate
+
+def phase_scan(t, jmax=200, tol=1e-10, dps=30):
+    """
+    θ(t) = arg(f(s)/f(1-s)) at s = 1/2 + it, in (-π, π]
+
+    On the critical line L_M(1-s) and γ(1-s) are the conjugates of L_M(s)
+    and γ(s) = π^{-s/2}Γ(s/2), so θ = 2·arg γ(s) - 2·arg L_M(s).
+    Returns (phases, relative error estimates of L_M, escalated mask).
+    """
+    t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+    s = 0.5 + 1j * t
+    L, rel, escalated = L_M_scan(s, jmax, tol, dps)
+    arg_gamma = loggamma(s / 2).imag - t / 2 * math.log(math.pi)
+    theta = np.angle(np.exp(2j * (arg_gamma - np.angle(L))))
+    return theta, rel, escalated
+
+# ============================================================================
+# LOGARITHMIC DERIVATIVES
+# ============================================================================
+
+def zeta_deriv_np(s, N=None, K=10):
+    """
+    ζ(s) and ζ'(s) by Euler–Maclaurin in complex128, vectorized over s
+
+    Every term of zeta_np is differentiated in place: n^{-s} → -log n·n^{-s},
+    and (s)_{2k-1} N^{-s-2k+1} picks up Σ_{i<2k-1} 1/(s+i) - log N.
+    Returns (values, derivatives, value errors, derivative errors).
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.complex128))
+    if N is None:
+        N = int(max(16, np.abs(s.imag).max(initial=0) + 1))
+    n = np.arange(1, N, dtype=np.float64)
+    log_n, log_N = np.log(n), math.log(N)
+
+    values = np.empty_like(s)
+    derivs = np.empty_like(s)
+    errors = np.empty(s.shape, dtype=np.float64)
+    d_errors = np.empty(s.shape, dtype=np.float64)
+    for sl in _chunks(len(s), len(n)):
+        z = s[sl]
+        P, err = _powers(z, n)
+        head = P.sum(axis=1)
+        d_head = -(P * log_n).sum(axis=1)
+        head_err = err.sum(axis=1) + EPS * len(n) * np.abs(P).sum(axis=1)
+        d_head_err = (err * log_n).sum(axis=1) + EPS * len(n) * (np.abs(P) * log_n).sum(axis=1)
+
+        N_pow = np.exp(-z * log_N)
+        tail = N_pow / 2 + N * N_pow / (z - 1)
+        d_tail = -log_N * N_pow / 2 - N * N_pow * (log_N / (z - 1) + 1 / (z - 1)**2)
+
+        factor = z * N_pow / N
+        d_log = 1 / z  # d/ds log (s)_{2k-1}
+        for k, b in enumerate(_BERNOULLI_RATIOS[:K], start=1):
+            tail += b * factor
+            d_tail += b * factor * (d_log - log_N)
+            factor = factor * (z + 2 * k - 1) * (z + 2 * k) / N**2
+            d_log = d_log + 1 / (z + 2 * k - 1) + 1 / (z + 2 * k)
+        remainder = np.abs(_BERNOULLI_RATIOS[K] * factor)
+
+        values[sl] = head + tail
+        derivs[sl] = d_head + d_tail
+        errors[sl] = head_err + remainder + EPS * (1 + np.abs(z) * log_N) * np.abs(tail)
+        d_errors[sl] = d_head_err + remainder * (np.abs(d_log) + log_N) \
+            + EPS * (1 + np.abs(z) * log_N) * np.abs(d_tail)
+    return values, derivs, errors, d_errors
+
+def correction_deriv_np(s, jmax=200):
+    """
+    C(s) and C'(s) in complex128 from one set of powers j^{-s}
+
+    C'(s) = Σ [H'_{j-1}(s) - H_{j-1}(s)·log j] j^{-s}, H'_n = -Σ_{k≤n} log k·k^{-s}.
+    Returns (values, derivatives, value errors, derivative errors).
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.complex128))
+    j = np.arange(2, jmax + 1, dtype=np.float64)
+    log_j = np.log(j)
+    ramp = EPS * np.arange(len(j))
+
+    C = np.empty_like(s)
+    dC = np.empty_like(s)
+    C_err = np.empty(s.shape, dtype=np.float64)
+    dC_err = np.empty(s.shape, dtype=np.float64)
+    for sl in _chunks(len(s), len(j)):
+        P, err = _powers(s[sl], j)
+        dP, d_err = -P * log_j, err * log_j
+        H = 1 + np.cumsum(P, axis=1) - P
+        dH = np.cumsum(dP, axis=1) - dP
+        H_err = np.cumsum(err, axis=1) - err + ramp * np.abs(H)
+        dH_err = np.cumsum(d_err, axis=1) - d_err + ramp * np.abs(dH)
+
+        C[sl] = (H * P).sum(axis=1)
+        dC[sl] = (dH * P + H * dP).sum(axis=1)
+        C_err[sl] = (np.abs(H) * err + np.abs(P) * H_err).sum(axis=1) \
+            + EPS * len(j) * (np.abs(H) * np.abs(P)).sum(axis=1)
+        dC_err[sl] = (np.abs(dH) * err + np.abs(P) * dH_err
+                      + np.abs(H) * d_err + np.abs(dP) * H_err).sum(axis=1) \
+            + EPS * len(j) * (np.abs(dH * P) + np.abs(H * dP)).sum(axis=1)
+    return C, dC, C_err, dC_err
+
+def L_M_logderiv_np(s, jmax=200, tail=False):
+    """
+    L_M(s) and L_M'(s)/L_M(s) in complex128, vectorized over s
+
+    tail=False is L_M_closed_form(s, jmax); tail=True is the full series,
+    i.e. the limit of the tail-corrected sum, evaluated as
+    (ζ(s)² + ζ(2s))/2 - ζ(s) (jmax is then unused).
+    Returns (values, log-derivatives, error bounds of the log-derivatives).
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.complex128))
+    z, dz, z_err, dz_err = zeta_deriv_np(s)
+    if tail:
+        z2, dz2, z2_err, dz2_err = zeta_deriv_np(2 * s)
+        L = (z * z + z2) / 2 - z
+        dL = z * dz + dz2 - dz
+        L_err = np.abs(z - 1) * z_err + z2_err / 2 + EPS * (np.abs(z)**2 + np.abs(z2) + np.abs(z))
+        dL_err = np.abs(dz) * z_err + np.abs(z - 1) * dz_err + dz2_err \
+            + EPS * (np.abs(z * dz) + np.abs(dz2) + np.abs(dz))
+    else:
+        C, dC, C_err, dC_err = correction_deriv_np(s, jmax)
+        L = z * (z - 1) - C
+        dL = (2 * z - 1) * dz - dC
+        L_err = np.abs(2 * z - 1) * z_err + C_err + EPS * (np.abs(z) * (np.abs(z) + 1) + np.abs(C))
+        dL_err = 2 * np.abs(dz) * z_err + np.abs(2 * z - 1) * dz_err + dC_err \
+            + EPS * (np.abs((2 * z - 1) * dz) + np.abs(dC))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_deriv = dL / L
+        return L, log_deriv, (dL_err + np.abs(log_deriv) * L_err) / np.abs(L)
+
+def phase_derivative_np(t, jmax=200):
+    """
+    dθ/dt at s = 1/2 + it for θ as in phase_scan
+
+    θ = 2·arg γ(s) - 2·arg L_M(s), and d/dt arg g(1/2+it) = Re g'/g, so
+    dθ/dt = Re ψ(s/2) - log π - 2·Re(L_M'(s)/L_M(s)).
+    """
+    t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+    s = 0.5 + 1j * t
+    _, log_deriv, _ = L_M_logderiv_np(s, jmax)
+    return psi(s / 2).real - math.log(math.pi) - 2 * log_deriv.real
+
+def _integrate(f, a, b, pieces=1, tol=1e-10, order=20, max_panels=1 << 16):
+    """
+    ∫_a^b f by adaptive Gauss–Legendre; f maps an array of x to values
+
+    A panel is accepted once its own rule and the sum over its two halves
+    agree to tol·(panel width)/(b - a); otherwise it is split. All open
+    panels are evaluated in one call to f per round.
+    """
+    x, w = np.polynomial.legendre.leggauss(order)
+
+    def rules(lo, hi):
+        half = (hi - lo) / 2
+        nodes = (lo + hi)[:, None] / 2 + half[:, None] * x
+        return (f(nodes.ravel()).reshape(nodes.shape) * w).sum(axis=1) * half
+
+    edges = np.linspace(a, b, pieces + 1)
+    lo, hi = edges[:-1], edges[1:]
+    coarse = rules(lo, hi)
+    total = 0.0
+    while len(lo):
+        mid = (lo + hi) / 2
+        halves = rules(np.r_[lo, mid], np.r_[mid, hi])
+        left, right = halves[:len(lo)], halves[len(lo):]
+        fine = left + right
+        done = np.abs(fine - coarse) <= tol * np.abs(hi - lo) / abs(b - a)
+        if len(lo) > max_panels:
+            warnings.warn(f"integral on [{a}, {b}] not converged to {tol:g}")
+            done[:] = True
+        total += fine[done].sum()
+        keep = ~done
+        lo, hi = np.r_[lo[keep], mid[keep]], np.r_[mid[keep], hi[keep]]
+        coarse = np.r_[left[keep], right[keep]]
+    return total
+
+def phase_increment(t_a, t_b, jmax=200, tol=1e-10):
+    """
+    θ(t_b) - θ(t_a), unwrapped, as the integral of phase_derivative_np
+
+    Panels refine themselves around the sharp peaks of dθ/dt near zeros
+    close to the line, so no t-grid or 2π bookkeeping is involved.
+    """
+    pieces = max(1, math.ceil(abs(t_b - t_a)))
+    return float(_integrate(lambda t: phase_derivative_np(t, jmax), t_a, t_b, pieces, tol))
@@ -0,0 +1,232 @@
+"""
+L_M fields over a rectangle of the critical strip, and their residuals
+
+L_M(s), L_M(1-s), ζ(s) and ζ(1-s) on a σ × t grid are written tile by
+tile into memory-mapped .npy arrays, so the whole field can be plotted or
+scanned for residuals later without recomputation.
+
+Every Dirichlet sum on a tile is a matrix product. With
+
+  A[σ, n] = n^{-σ}            (one row per σ, shared by every t)
+  B[n, t] = e^{-it log n}     (one column per t, shared by every σ)
+
+  Σ_{n<N} n^{-s}  = A @ B,    Σ_{n<N} n^{-2s} = A² @ B²   (elementwise squares)
+
+and at 1 - s = (1-σ) - it the same B enters conjugated, so a tile costs a
+few BLAS products plus the Euler–Maclaurin tails of ζ(s) and ζ(2s). The
+truncated correction is
+
+  C_J(s) = Σ_{j=2}^J H_{j-1}(s) j^{-s} = Σ_{k<j≤J} (kj)^{-s} = (Z_J(s)² - Z_J(2s))/2
+
+with Z_J(s) = Σ_{j≤J} j^{-s}, and the full series L_M = (ζ² + ζ(2s))/2 - ζ
+is stored next to the closed form. Residuals:
+
+  closed_form_residual()    |L_M_closed_form - L_M| / |L_M|
+  schwarz_residual()        |L_M(1-s) - conj L_M(s)| / |L_M(s)|  (0 on σ = 1/2)
+  fe_residual(family, p)    |log R(s) - log γ(s)/γ(1-s)|, R = L_M(1-s)/L_M(s),
+                            imaginary part wrapped; candidates as in gamma_search
+
+  field = scan_strip(np.linspace(0.1, 0.9, 81), np.linspace(5, 50, 2000), jmax=200)
+  field.fe_residual('gamma_zeta', (np.sqrt(np.pi), 0.5, 0, 0))
+
+A field is a directory (default cache/fields/, named by a hash of the grid
+and jmax) holding meta.json, one .npy per array and done.npy, a per-tile
+completion mask: an interrupted scan resumes where it stopped. Tiles are
+disjoint, so worker processes write into the shared memmaps directly.
+"""
+
+import hashlib
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from .fastpath import EPS, _zeta_tail
+from .gamma_search import log_factor_ratio
+
+DEFAULT_DIR = "cache/fields"
+
+ARRAYS = ('zeta', 'zeta_reflected', 'L', 'L_reflected', 'L_full', 'L_full_reflected')
+
+# ============================================================================
+# ONE TILE
+# ============================================================================
+
+def _side(sigma, t, jmax, N, log_n, phase, phase2):
+    """ζ, closed-form and full L_M, and an error bound, at s = σ + it (rows × columns)"""
+    A = np.exp(-np.outer(sigma, log_n))
+    A2 = A * A
+    s = sigma[:, None] + 1j * t[None, :]
+
+    zeta_tail, zeta_rem = _zeta_tail(s, N)
+    zeta2_tail, zeta2_rem = _zeta_tail(2 * s, N)
+    zeta = A[:, :N - 1] @ phase[:N - 1] + zeta_tail
+    zeta2 = A2[:, :N - 1] @ phase2[:N - 1] + zeta2_tail
+    Z = A[:, :jmax] @ phase[:jmax]
+    Z2 = A2[:, :jmax] @ phase2[:jmax]
+
+    L = zeta * (zeta - 1) - (Z * Z - Z2) / 2
+    L_full = (zeta * zeta + zeta2) / 2 - zeta
+
+    # each power carries a relative error of eps·(1 + |s| log n), as in fastpath
+    head = A.sum(axis=1)[:, None] + np.abs(s) * (A @ log_n)[:, None]
+    head2 = A2.sum(axis=1)[:, None] + 2 * np.abs(s) * (A2 @ log_n)[:, None]
+    zeta_err = EPS * head + zeta_rem
+    C_err = EPS * (np.abs(Z) * head + head2)
+    error = np.maximum(np.abs(2 * zeta - 1) * zeta_err + C_err,
+                       np.abs(zeta) * zeta_err + EPS * head2 + zeta2_rem)
+    return zeta, L, L_full, error
+
+def _tile_values(sigma, t, jmax):
+    """All stored arrays on one tile, plus the largest error bound"""
+    N = int(max(16, 2 * np.abs(t).max() + 1))  # enough for ζ(2s)
+    log_n = np.log(np.arange(1, max(N, jmax + 1), dtype=np.float64))
+    phase = np.exp(-1j * np.outer(log_n, t))
+    phase2 = phase * phase
+
+    with np.errstate(all='ignore'):  # s = 1 is a pole
+        zeta, L, L_full, err = _side(sigma, t, jmax, N, log_n, phase, phase2)
+        zeta_r, L_r, L_full_r, err_r = _side(1 - sigma, -t, jmax, N, log_n,
+                                             phase.conj(), phase2.conj())
+    values = dict(zip(ARRAYS, (zeta, zeta_r, L, L_r, L_full, L_full_r)))
+    return values, np.maximum(err, err_r)
+
+def _scan_tile(task):
+    path, index, rows, cols = task
+    field = StripField(path, mode='r+')
+    values, error = _tile_values(field.sigma[rows], field.t[cols], field.jmax)
+    for name, block in values.items():
+        field.arrays[name][rows, cols] = block
+    field.arrays['error'][rows, cols] = error
+    for a in field.arrays.values():
+        a.flush()
+    field.done[index] = 1
+    field.done.flush()
+    return index
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+class StripField:
+    """Memory-mapped view of a field written by scan_strip"""
+
+    def __init__(self, path, mode='r'):
+        self.path = Path(path)
+        with open(self.path / "meta.json") as f:
+            meta = json.load(f)
+        self.sigma = np.array(meta['sigma'])
+        self.t = np.array(meta['t'])
+        self.jmax = meta['jmax']
+        self.tile = tuple(meta['tile'])
+        self.arrays = {name: np.load(self.path / f"{name}.npy", mmap_mode=mode)
+                       for name in ARRAYS + ('error',)}
+        self.done = np.load(self.path / "done.npy", mmap_mode=mode)
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    @property
+    def shape(self):
+        return len(self.sigma), len(self.t)
+
+    @property
+    def complete(self):
+        return bool(self.done.all())
+
+    @property
+    def s(self):
+        """σ + it over the whole grid"""
+        return self.sigma[:, None] + 1j * self.t[None, :]
+
+    def closed_form_residual(self):
+        """|L_M_closed_form - L_M| / |L_M|: where the truncation at jmax holds"""
+        L, L_full = self['L'], self['L_full']
+        return np.abs(L - L_full) / np.abs(L_full)
+
+    def schwarz_residual(self, full=False):
+        """|L_M(1-s) - conj L_M(s)| / |L_M(s)|, zero on the critical line"""
+        L, L_r = (self['L_full'], self['L_full_reflected']) if full else (self['L'], self['L_reflected'])
+        return np.abs(L_r - np.conj(L)) / np.abs(L)
+
+    def fe_residual(self, family, params, full=False):
+        """
+        |log R(s) - log γ(s)/γ(1-s)| for one candidate, R = L_M(1-s)/L_M(s)
+
+        Uses the closed form, or the full L_M with full=True. Computed a
+        row at a time, so only the result is held in memory.
+        """
+        L_name = 'L_full' if full else 'L'
+        result = np.empty(self.shape)
+        for i in range(len(self.sigma)):
+            s = self.sigma[i] + 1j * self.t
+            log_R = np.log(self[L_name + '_reflected'][i] / self[L_name][i])
+            log_zeta_ratio = np.log(self['zeta'][i] / self['zeta_reflected'][i])
+            d = log_R - log_factor_ratio(family, params, s, log_zeta_ratio)[0]
+            result[i] = np.hypot(d.real, (d.imag + np.pi) % (2 * np.pi) - np.pi)
+        return result
+
+def _field_path(sigma, t, jmax):
+    digest = hashlib.sha256(np.asarray(sigma, dtype=float).tobytes()
+                            + np.asarray(t, dtype=float).tobytes()
+                            + str(jmax).encode()).hexdigest()[:16]
+    return Path(os.environ.get("ORBIT_PY_FIELDS", DEFAULT_DIR)) / f"strip_{digest}"
+
+def _create(path, sigma, t, jmax, tile):
+    path.mkdir(parents=True, exist_ok=True)
+    shape = (len(sigma), len(t))
+    n_tiles = math.ceil(shape[0] / tile[0]) * math.ceil(shape[1] / tile[1])
+    for name in ARRAYS:
+        open_memmap(path / f"{name}.npy", mode='w+', dtype=np.complex128, shape=shape).flush()
+    open_memmap(path / "error.npy", mode='w+', dtype=np.float64, shape=shape).flush()
+    open_memmap(path / "done.npy", mode='w+', dtype=np.uint8, shape=(n_tiles,)).flush()
+    # meta.json last: its presence marks a usable field
+    meta = {'sigma': list(map(float, sigma)), 't': list(map(float, t)), 'jmax': jmax,
+            'tile': list(tile)}
+    tmp = path / "meta.json.tmp"
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, path / "meta.json")
+
+def scan_strip(sigma, t, jmax=200, path=None, tile=(32, 256), workers=None):
+    """
+    L_M and ζ at s and 1 - s on the grid sigma × t, as a StripField
+
+    sigma, t   1-D grids (rows, columns)
+    path       field directory (default: cache/fields/strip_<hash of grid, jmax>;
+               $ORBIT_PY_FIELDS overrides cache/fields)
+    tile       rows × columns per task
+    workers    process count (default: all cores; 1 runs in-process)
+
+    Tiles already marked done (an earlier, interrupted scan of the same
+    grid) are skipped.
+    """
+    sigma = np.asarray(sigma, dtype=float)
+    t = np.asarray(t, dtype=float)
+    path = Path(path) if path is not None else _field_path(sigma, t, jmax)
+    if not (path / "meta.json").exists():
+        _create(path, sigma, t, jmax, tile)
+
+    field = StripField(path)
+    if field.jmax != jmax or not (np.array_equal(field.sigma, sigma) and np.array_equal(field.t, t)):
+        raise ValueError(f"{path}: holds a different grid or jmax")
+    tile = field.tile
+
+    row_blocks = [slice(i, min(i + tile[0], len(sigma))) for i in range(0, len(sigma), tile[0])]
+    col_blocks = [slice(j, min(j + tile[1], len(t))) for j in range(0, len(t), tile[1])]
+    tasks = [(str(path), index, rows, cols)
+             for index, (rows, cols) in enumerate((r, c) for r in row_blocks for c in col_blocks)
+             if not field.done[index]]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            _scan_tile(task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(_scan_tile, tasks):
+                pass
+    return StripField(path)
@@ -0,0 +1,271 @@
+"""
+Grid search for functional-equation factors γ(s)
+
+If γ(s) L_M(s) = γ(1-s) L_M(1-s), every candidate γ must reproduce
+
+  R(s) = L_M(1-s)/L_M(s) = γ(s)/γ(1-s)
+
+on every grid point. R(s) is the expensive part, so it is computed once
+per point (together with ζ(s)/ζ(1-s), which the candidates reuse), in a
+process pool and memoized on disk by cached(). Candidates are then pure
+NumPy: each family maps a block of parameter rows and all grid points to
+log γ(s)/γ(1-s) at once, and blocks are scored in parallel against
+
+  d = log R - log(γ(s)/γ(1-s))     (imaginary part wrapped to [-π, π))
+
+  mag_rms = rms Re d,  phase_rms = rms Im d,  score = rms |d|
+
+Families (parameter order as in FAMILIES):
+
+  gamma_zeta   Q^{1-2s} Γ(λs+μ)/Γ(λ(1-s)+μ) · (ζ(s)/ζ(1-s))^α
+               (Q=√π, λ=1/2, μ=0, α=0 is the classical π^{-s/2}Γ(s/2))
+  chi          χ(s)/χ(1-s) = χ(s)²,  χ(s) = 2^s π^{s-1} sin(πs/2) Γ(1-s)
+
+  features = ratio_features(s_values, jmax=150, workers=8)
+  ranking = score_candidates(features, candidate_grid(alpha=np.linspace(-2, 2, 81)))
+  run = SearchStore().add_run("zeta powers", features, ranking)
+  SearchStore().top(run, limit=10)
+
+Rankings go to cache/gamma_search.sqlite (runs + scores tables), so later
+sessions can query them without recomputing anything.
+"""
+
+import itertools
+import json
+import math
+import os
+import sqlite3
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from mpmath import mp, zeta, log, fabs
+from scipy.special import loggamma
+
+from .lfunc import L_M_closed_form
+from .cache import cached
+
+DEFAULT_STORE = "cache/gamma_search.sqlite"
+
+FAMILIES = {
+    'gamma_zeta': ('Q', 'lam', 'mu', 'alpha'),
+    'chi': (),
+}
+
+# Candidates the search scripts have tried by hand
+NAMED = {
+    "Classical γ": ('gamma_zeta', (math.sqrt(math.pi), 0.5, 0.0, 0.0)),
+    "Double classical": ('gamma_zeta', (math.pi, 1.0, 0.0, 0.0)),
+    "Zeta ratio": ('gamma_zeta', (1.0, 0.0, 1.0, -1.0)),
+    "Classical × ζ": ('gamma_zeta', (math.sqrt(math.pi), 0.5, 0.0, -1.0)),
+    "χ(s)/χ(1-s)": ('chi', ()),
+}
+_NAME_OF = {(f, tuple(round(x, 9) for x in p)): name for name, (f, p) in NAMED.items()}
+
+# ============================================================================
+# R(s) ONCE PER GRID POINT
+# ============================================================================
+
+@cached
+def point_values(s, jmax):
+    """(L_M(s), L_M(1-s), ζ(s), ζ(1-s)), memoized on disk per (s, jmax, dps)"""
+    return L_M_closed_form(s, jmax), L_M_closed_form(1 - s, jmax), zeta(s), zeta(1 - s)
+
+def _init_worker(dps):
+    mp.dps = dps
+
+def _point_features(task):
+    s, jmax, floor = task
+    L_s, L_1ms, z_s, z_1ms = point_values(mp.mpc(s), jmax)
+    if fabs(L_s) < floor:
+        return complex('nan'), complex(log(z_s / z_1ms))
+    return complex(log(L_1ms / L_s)), complex(log(z_s / z_1ms))
+
+def ratio_features(s_values, jmax=150, workers=None, dps=None, floor=1e-30):
+    """
+    log R(s) and log ζ(s)/ζ(1-s) on a grid, as a dict of complex128 arrays
+
+    Keys: 's', 'log_R' (NaN where |L_M(s)| < floor), 'log_zeta_ratio',
+    'jmax', 'dps'. Points are spread over a process pool (workers=1 runs
+    in-process) and each is read from the disk cache when already known.
+    """
+    s_values = [complex(s) for s in s_values]
+    workers = workers or os.cpu_count() or 1
+    dps = dps or mp.dps
+    tasks = [(s, jmax, floor) for s in s_values]
+
+    if workers == 1:
+        with mp.workdps(dps):
+            rows = [_point_features(task) for task in tasks]
+    else:
+        chunk = max(1, math.ceil(len(tasks) / (4 * workers)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(dps,)) as pool:
+            rows = list(pool.map(_point_features, tasks, chunksize=chunk))
+
+    log_R, log_zeta_ratio = (np.array(col, dtype=complex) for col in zip(*rows))
+    return {'s': np.array(s_values), 'log_R': log_R, 'log_zeta_ratio': log_zeta_ratio,
+            'jmax': jmax, 'dps': dps}
+
+# ============================================================================
+# VECTORIZED CANDIDATES
+# ============================================================================
+
+def _log_gamma_zeta(params, s, log_zeta_ratio):
+    Q, lam, mu, alpha = (params[:, i:i + 1] for i in range(4))
+    return ((1 - 2 * s) * np.log(Q) + loggamma(lam * s + mu) - loggamma(lam * (1 - s) + mu)
+            + alpha * log_zeta_ratio)
+
+def _log_chi(params, s, log_zeta_ratio):
+    log_chi = (s * math.log(2) + (s - 1) * math.log(math.pi)
+               + np.log(np.sin(np.pi * s / 2)) + loggamma(1 - s))
+    return np.broadcast_to(2 * log_chi, (len(params), s.shape[-1]))
+
+_LOG_RATIO = {'gamma_zeta': _log_gamma_zeta, 'chi': _log_chi}
+
+def log_factor_ratio(family, params, s, log_zeta_ratio):
+    """log γ(s)/γ(1-s) for each parameter row (rows × points, complex128)"""
+    params = np.asarray(params, dtype=float)
+    if params.ndim < 2:
+        params = params.reshape(1, len(FAMILIES[family]))
+    with np.errstate(all='ignore'):
+        return _LOG_RATIO[family](params, s[None, :], log_zeta_ratio[None, :])
+
+def _score_block(task):
+    family, params, s, log_R, log_zeta_ratio = task
+    # candidates that are NaN everywhere (poles of Γ) just score NaN
+    with np.errstate(all='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        d = log_R[None, :] - log_factor_ratio(family, params, s, log_zeta_ratio)
+        d_mag = d.real
+        d_phase = (d.imag + np.pi) % (2 * np.pi) - np.pi
+        mag_rms = np.sqrt(np.nanmean(d_mag ** 2, axis=1))
+        phase_rms = np.sqrt(np.nanmean(d_phase ** 2, axis=1))
+        max_error = np.nanmax(np.hypot(d_mag, d_phase), axis=1)
+    return mag_rms, phase_rms, max_error
+
+def candidate_grid(Q=(math.sqrt(math.pi),), lam=(0.5,), mu=(0.0,), alpha=(0.0,)):
+    """Every gamma_zeta candidate on the product of the parameter lists"""
+    return [('gamma_zeta', p) for p in itertools.product(*(np.atleast_1d(v).tolist()
+                                                          for v in (Q, lam, mu, alpha)))]
+
+def describe(family, params):
+    """Readable name of a candidate, e.g. 'gamma_zeta Q=1.772 lam=0.5 mu=0 alpha=-1'"""
+    name = _NAME_OF.get((family, tuple(round(x, 9) for x in params)))
+    if name is not None:
+        return name
+    fields = " ".join(f"{k}={v:.4g}" for k, v in zip(FAMILIES[family], params))
+    return f"{family} {fields}".strip()
+
+def score_candidates(features, candidates, workers=None, block=4096, limit=None):
+    """
+    Score (family, params) candidates against ratio_features output
+
+    Candidates are grouped by family and cut into blocks of at most
+    `block` rows, scored in a process pool (workers=1 runs in-process).
+    Returns dicts with family, params, score, mag_rms, phase_rms and
+    max_error, best (lowest score) first and NaN scores last, for the
+    best `limit` candidates (default: all). Names come from describe().
+    """
+    s, log_R, log_zeta_ratio = features['s'], features['log_R'], features['log_zeta_ratio']
+    workers = workers or os.cpu_count() or 1
+
+    grouped = {}
+    for family, params in candidates:
+        grouped.setdefault(family, []).append(tuple(float(p) for p in params))
+    blocks = [(family, rows[i:i + block])
+              for family, rows in grouped.items()
+              for i in range(0, len(rows), block)]
+    tasks = [(family, np.array(rows, dtype=float).reshape(len(rows), len(FAMILIES[family])),
+              s, log_R, log_zeta_ratio)
+             for family, rows in blocks]
+
+    if workers == 1 or len(tasks) == 1:
+        results = [_score_block(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_score_block, tasks))
+
+    if not results:
+        return []
+    mag_rms, phase_rms, max_error = (np.concatenate(col) for col in zip(*results))
+    score = np.hypot(mag_rms, phase_rms)
+    owners = [(family, params) for family, rows in blocks for params in rows]
+    order = np.argsort(score, kind='stable')[:limit]  # NaN sorts last
+    return [{'family': owners[i][0], 'params': owners[i][1], 'score': float(score[i]),
+             'mag_rms': float(mag_rms[i]), 'phase_rms': float(phase_rms[i]),
+             'max_error': float(max_error[i])}
+            for i in order]
+
+# ============================================================================
+# RESULT STORE
+# ============================================================================
+
+class SearchStore:
+    """SQLite store of search runs and their full rankings"""
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS runs (
+                              id      INTEGER PRIMARY KEY,
+                              label   TEXT,
+                              created REAL,
+                              jmax    INTEGER,
+                              dps     INTEGER,
+                              points  TEXT)""")
+            db.execute("""CREATE TABLE IF NOT EXISTS scores (
+                              run       INTEGER REFERENCES runs(id),
+                              rank      INTEGER,
+                              family    TEXT,
+                              params    TEXT,
+                              score     REAL,
+                              mag_rms   REAL,
+                              phase_rms REAL,
+                              max_error REAL)""")
+            db.execute("CREATE INDEX IF NOT EXISTS scores_run_rank ON scores(run, rank)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=60)
+
+    def add_run(self, label, features, ranking):
+        """Store one ranking with its grid; returns the run id"""
+        points = json.dumps([[s.real, s.imag] for s in features['s'].tolist()])
+        with self._connect() as db:
+            run = db.execute("INSERT INTO runs (label, created, jmax, dps, points) VALUES (?, ?, ?, ?, ?)",
+                             (label, time.time(), features['jmax'], features['dps'], points)).lastrowid
+            db.executemany("INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                           [(run, rank, r['family'], json.dumps(r['params']),
+                             r['score'], r['mag_rms'], r['phase_rms'], r['max_error'])
+                            for rank, r in enumerate(ranking, 1)])
+        return run
+
+    def runs(self):
+        """[(id, label, created, jmax, dps, number of points)], oldest first"""
+        with self._connect() as db:
+            rows = db.execute("SELECT id, label, created, jmax, dps, points FROM runs ORDER BY id").fetchall()
+        return [(i, label, created, jmax, dps, len(json.loads(points)))
+                for i, label, created, jmax, dps, points in rows]
+
+    def top(self, run=None, limit=10, family=None):
+        """Best `limit` candidates of a run (default: the latest), as named dicts"""
+        with self._connect() as db:
+            if run is None:
+                run = db.execute("SELECT MAX(id) FROM runs").fetchone()[0]
+            query = ("SELECT rank, family, params, score, mag_rms, phase_rms, max_error "
+                     "FROM scores WHERE run = ?")
+            args = [run]
+            if family is not None:
+                query += " AND family = ?"
+                args.append(family)
+            rows = db.execute(query + " ORDER BY rank LIMIT ?", args + [limit]).fetchall()
+        keys = ('rank', 'family', 'params', 'score', 'mag_rms', 'phase_rms', 'max_error')
+        ranking = []
+        for row in rows:
+            r = dict(zip(keys, row), params=tuple(json.loads(row[2])))
+            r['name'] = describe(r['family'], r['params'])
+            ranking.append(r)
+        return ranking
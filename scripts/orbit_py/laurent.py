@@ -0,0 +1,105 @@
+"""
+Laurent expansions of ζ, C and L_M about s = 1
+
+Instead of probing (s-1)^k·L_M(s) at s = 1 + 10^-k, the coefficients are
+computed directly, in two independent ways.
+
+Series (exact to the working precision):
+
+  ζ(s)      = 1/(s-1) + Σ_n (-1)^n γ_n/n! (s-1)^n        (Stieltjes constants)
+  j^{-s}    = (1/j) Σ_b (-log j)^b/b! (s-1)^b
+  C_J(s)    = Σ_{j=2}^J H_{j-1}(s) j^{-s}                 (truncated power series,
+                                                          H carried forward in j)
+  L_M(s)    = ζ(ζ-1) - C_J                                (closed form, jmax = J)
+  L_M(s)    = (ζ² + ζ(2s))/2 - ζ                          (full series, tail=True)
+
+so the double-pole coefficient is exactly 1 for any truncation J (C_J is
+entire) and 1/2 for the full L_M.
+
+Contour sampling, for any f with an isolated singularity at s0:
+
+  a_m ≈ (1/N) Σ_{k<N} f(s0 + r·ω^k) ω^{-mk} r^{-m},   ω = e^{2πi/N}
+
+from a fixed budget of N evaluations. The error is aliasing from a_{m±N}
+and is estimated by redoing the sum on every other sample (N/2 points,
+no extra evaluations).
+
+  zeta_laurent(order)                      ζ about 1, from (s-1)^{-1}
+  correction_taylor(jmax, order)           C_J about 1, from (s-1)^0
+  L_M_laurent(jmax, order, tail=False)     L_M about 1, from (s-1)^{-2}
+  laurent_contour(f, s0, radius, num)      any f, with error estimates
+"""
+
+from mpmath import mp, zeta, log, exp, pi, fabs, stieltjes, factorial
+
+def _mul(a, b, n):
+    """First n coefficients of the product of two power series"""
+    return [mp.fsum(a[i] * b[k - i] for i in range(k + 1) if i < len(a) and k - i < len(b))
+            for k in range(n)]
+
+def zeta_laurent(order=4):
+    """Coefficients of ζ(s) at s = 1 for (s-1)^{-1}, (s-1)^0, ..., (s-1)^order"""
+    return [mp.mpf(1)] + [(-1) ** n * stieltjes(n) / factorial(n) for n in range(order + 1)]
+
+def correction_taylor(jmax, order=4):
+    """
+    Taylor coefficients of C_J(s) = Σ_{j=2}^J H_{j-1}(s)/j^s at s = 1, J = jmax
+
+    Each j^{-s} is a power series in (s-1); H_{j-1} is carried forward as a
+    series, so the cost is O(jmax·order²) with no evaluation near the pole.
+    """
+    n = order + 1
+    total = [mp.mpf(0)] * n
+    H = [mp.mpf(1)] + [mp.mpf(0)] * order  # H_1(s) = 1
+    for j in range(2, jmax + 1):
+        minus_log = -log(j)
+        power = [mp.mpf(1) / j]
+        for b in range(1, n):
+            power.append(power[-1] * minus_log / b)
+        total = [t + p for t, p in zip(total, _mul(H, power, n))]
+        H = [h + p for h, p in zip(H, power)]
+    return total
+
+def L_M_laurent(jmax=200, order=4, tail=False):
+    """
+    Coefficients of L_M(s) at s = 1 for (s-1)^{-2}, (s-1)^{-1}, ..., (s-1)^order
+
+    tail=False: L_M_closed_form(s, jmax) = ζ(ζ-1) - C_J.
+    tail=True:  the full series (ζ² + ζ(2s))/2 - ζ, the jmax → ∞ limit of
+                the tail-corrected closed form (jmax is then unused).
+    The first entry is the double-pole coefficient A.
+    """
+    n = order + 3  # (s-1)^{-2} .. (s-1)^order
+    z = zeta_laurent(order + 1)          # from (s-1)^{-1}
+    z_shift = [mp.mpf(0)] + z            # same, indexed from (s-1)^{-2}
+    z_squared = _mul(z, z, n)            # from (s-1)^{-2}
+
+    if tail:
+        # ζ(2s) = Σ_m ζ^{(m)}(2)/m! · 2^m (s-1)^m, analytic at s = 1
+        z2 = [c * 2 ** m for m, c in enumerate(mp.taylor(zeta, 2, order))]
+        z2_shift = [mp.mpf(0)] * 2 + z2
+        return [z_squared[k] / 2 + z2_shift[k] / 2 - z_shift[k] for k in range(n)]
+
+    C = [mp.mpf(0)] * 2 + correction_taylor(jmax, order)
+    return [z_squared[k] - z_shift[k] - C[k] for k in range(n)]
+
+def laurent_contour(f, s0=1, radius=0.25, num=64, lowest=-2, count=5):
+    """
+    Laurent coefficients a_lowest, ..., a_{lowest+count-1} of f about s0
+
+    f is evaluated at num points on |s - s0| = radius (num even); the
+    circle must not enclose any other singularity. Returns (coefficients,
+    error estimates), the estimates from the num/2-point subset.
+    """
+    s0, r = mp.mpmathify(s0), mp.mpf(radius)
+    roots = [exp(2j * pi * k / num) for k in range(num)]
+    samples = [f(s0 + r * w) for w in roots]
+
+    coeffs, errors = [], []
+    for m in range(lowest, lowest + count):
+        full = mp.fsum(v * roots[(-m * k) % num] for k, v in enumerate(samples)) / num
+        half = mp.fsum(v * roots[(-m * k) % num] for k, v in enumerate(samples) if k % 2 == 0) / (num // 2)
+        scale = r ** -m
+        coeffs.append(full * scale)
+        errors.append(fabs(full - half) * scale)
+    return coeffs, errors
@@ -0,0 +1,281 @@
+"""
+L_M(s) evaluators and gamma factors
+
+Closed form:
+  L_M(s) = ζ(s)[ζ(s)-1] - C(s)
+  C(s)   = Σ_{j=2}^jmax H_{j-1}(s)/j^s,   H_n(s) = Σ_{k=1}^n k^{-s}
+
+C(s) carries the running partial zeta forward (H_j = H_{j-1} + j^{-s})
+and computes every power j^{-s} once, so one evaluation costs O(jmax)
+instead of the O(jmax²) of recomputing H_{j-1}(s) inside the j loop.
+
+Checkpointed evaluation (correction_checkpoints, L_M_checkpoints) streams
+the partial sums C_J(s) at increasing J from one pass over j, so a jmax
+sweep costs as much as its largest jmax and can be stopped early.
+
+Batched evaluation shares the power work across many s:
+  L_M_closed_form_many(s_values)    log k computed once, k^{-s} = exp(-s·log k)
+  L_M_closed_form_grid(t0, dt, n)   s = σ + i(t0 + m·dt), powers advanced by
+                                    k^{-s-iΔt} = k^{-s}·exp(-iΔt·log k)
+
+Tail correction (tail=True) adds the remainder Σ_{j>J} H_{j-1}(s)/j^s.
+With H_{j-1}(s) = ζ(s) - ζ(s, j) and the Euler–Maclaurin expansion of the
+Hurwitz zeta ζ(s, j) in j, the remainder is
+
+  ζ(s)ζ(s, J+1) - ζ(2s-1, J+1)/(s-1) - ζ(2s, J+1)/2
+    - Σ_{k≥1} B_{2k}/(2k)! · (s)_{2k-1} · ζ(2s+2k-1, J+1)
+
+The k-series is asymptotic; it is cut at the smallest term, which is also
+the truncation-error estimate. J = 50 already gives ~35 digits at
+|s| ~ 10, where the bare sum needs jmax in the thousands for 4. The
+corrected sum is the full C(s) = (ζ(s)² - ζ(2s))/2, which is analytic
+apart from s = 1 and s = 1/2 (the truncated sum has no poles at all).
+
+On the uniform grid a step costs jmax complex multiplications plus one
+ζ(s), instead of jmax mp.power calls.
+
+Logarithmic derivative (L_M_logderiv), from the same powers j^{-s}:
+  C'(s)   = Σ_{j=2}^jmax [H'_{j-1}(s) - H_{j-1}(s)·log j] / j^s,
+  H'_n(s) = -Σ_{k=1}^n log k / k^s
+  L_M'(s) = (2ζ(s) - 1)·ζ'(s) - C'(s)
+so phase changes arg L_M can be integrated (d/dt arg L_M = Re L_M'/L_M on
+a vertical line) and zeros counted by the argument principle.
+
+Hurwitz zeta for a whole range of shifts (hurwitz_zeta_range):
+  ζ(s, d) = ζ(s, d+1) + d^{-s}
+run downward from one Euler–Maclaurin evaluation at an anchor A ≳ |s|,
+so ζ(s, d) for d = d_min..d_max costs one Bernoulli series plus one power
+per shift instead of a full zeta(s, d) call each. It gives the Hurwitz form
+
+  L_M(s) = Σ_{d=2}^{d_max} d^{-s} ζ(s, d)                    (L_M_hurwitz)
+
+Direct Dirichlet series:
+  L_M(s) = Σ_{n=1}^nmax M(n)/n^s
+
+All functions work in the current mpmath precision (mp.dps).
+"""
+
+import numpy as np
+from mpmath import mp, zeta, gamma, pi, exp, log, bernoulli, factorial, rf, fabs
+
+from .sieve import M_table
+
+def partial_zeta(s, n):
+    """H_n(s) = Σ_{k=1}^n k^{-s}"""
+    return sum(mp.power(k, -s) for k in range(1, n + 1))
+
+def _correction_from_powers(powers):
+    """
+    C(s) from powers[i] = (i + 2)^{-s}, i.e. j^{-s} for j = 2..jmax
+
+    H holds H_{j-1}(s) at the top of each iteration; j^{-s} is used once
+    as the denominator and then folded into H for the next j.
+    """
+    total = mp.mpf(0)
+    H = mp.mpf(1)  # H_1(s) = 1^{-s}
+    for j_pow in powers:
+        total += H * j_pow
+        H += j_pow
+    return total
+
+def _correction_with_derivative(powers, logs):
+    """C(s) and C'(s) from powers j^{-s} and logs log j, j = 2..jmax"""
+    total = d_total = mp.mpf(0)
+    H, d_H = mp.mpf(1), mp.mpf(0)  # H_1(s) = 1, H'_1(s) = -log 1 = 0
+    for j_pow, lj in zip(powers, logs):
+        d_pow = -lj * j_pow
+        total += H * j_pow
+        d_total += d_H * j_pow + H * d_pow
+        H += j_pow
+        d_H += d_pow
+    return total, d_total
+
+def correction_tail(s, jmax, max_terms=60):
+    """
+    Σ_{j>jmax} H_{j-1}(s)/j^s by Euler–Maclaurin, as (tail, error estimate)
+
+    The asymptotic B_{2k} series stops at its smallest term or once a term
+    drops below the working precision; the error estimate is the size of
+    that last term.
+    """
+    a = jmax + 1
+    tail = zeta(s) * zeta(s, a) - zeta(2*s - 1, a) / (s - 1) - zeta(2*s, a) / 2
+
+    error = fabs(tail)
+    for k in range(1, max_terms + 1):
+        term = bernoulli(2*k) / factorial(2*k) * rf(s, 2*k - 1) * zeta(2*s + 2*k - 1, a)
+        if fabs(term) > error:
+            break  # the asymptotic series has started to diverge
+        tail -= term
+        error = fabs(term)
+        if error < mp.eps * fabs(tail):
+            break
+    return tail, error
+
+def correction_sum(s, jmax, tail=False):
+    """
+    C(s) = Σ_{j=2}^jmax H_{j-1}(s)/j^s in O(jmax)
+
+    With tail=True the Euler–Maclaurin remainder for j > jmax is added,
+    giving the full infinite sum (see correction_tail for its error).
+    """
+    total = _correction_from_powers(mp.power(j, -s) for j in range(2, jmax + 1))
+    if tail:
+        total += correction_tail(s, jmax)[0]
+    return total
+
+def L_M_closed_form(s, jmax=200, tail=False):
+    """L_M(s) = ζ(s)[ζ(s)-1] - Σ_{j=2}^jmax H_{j-1}(s)/j^s (+ tail for j > jmax)"""
+    zeta_s = zeta(s)
+    return zeta_s * (zeta_s - 1) - correction_sum(s, jmax, tail)
+
+def correction_checkpoints(s, checkpoints):
+    """
+    Yield (J, C_J(s)) for every J in checkpoints (ascending) from one pass
+
+    The running sum and H_{j-1}(s) are carried between checkpoints, so
+    nothing is recomputed from j = 2; stop iterating to stop summing.
+    """
+    total = mp.mpf(0)
+    H = mp.mpf(1)
+    j = 2
+    for jmax in sorted(checkpoints):
+        while j <= jmax:
+            j_pow = mp.power(j, -s)
+            total += H * j_pow
+            H += j_pow
+            j += 1
+        yield jmax, total
+
+def L_M_checkpoints(s, checkpoints):
+    """Yield (J, L_M_closed_form(s, J)) for every J in checkpoints, one pass over j"""
+    zeta_s = zeta(s)
+    main = zeta_s * (zeta_s - 1)
+    for jmax, C in correction_checkpoints(s, checkpoints):
+        yield jmax, main - C
+
+def L_M_closed_form_many(s_values, jmax=200):
+    """
+    L_M_closed_form at every s in s_values, as a list
+
+    log j (j = 2..jmax) is computed once and shared by all points.
+    """
+    logs = [log(j) for j in range(2, jmax + 1)]
+    values = []
+    for s in s_values:
+        s = mp.mpmathify(s)
+        zeta_s = zeta(s)
+        C = _correction_from_powers(exp(-s * lj) for lj in logs)
+        values.append(zeta_s * (zeta_s - 1) - C)
+    return values
+
+def L_M_logderiv(s, jmax=200, tail=False):
+    """
+    (L_M(s), L_M'(s)/L_M(s)) for L_M_closed_form(s, jmax, tail)
+
+    C'(s) is accumulated in the same pass as C(s), with log j weights on
+    the powers j^{-s}; ζ'(s) comes from mpmath. The tail derivative (tail=True)
+    is taken numerically.
+    """
+    s = mp.mpmathify(s)
+    logs = [log(j) for j in range(2, jmax + 1)]
+    C, d_C = _correction_with_derivative([exp(-s * lj) for lj in logs], logs)
+    if tail:
+        C += correction_tail(s, jmax)[0]
+        d_C += mp.diff(lambda z: correction_tail(z, jmax)[0], s)
+    zeta_s, d_zeta = zeta(s), zeta(s, 1, 1)
+    L = zeta_s * (zeta_s - 1) - C
+    return L, ((2 * zeta_s - 1) * d_zeta - d_C) / L
+
+def L_M_closed_form_grid(t0, dt, num, sigma=0.5, jmax=200, reseed=256):
+    """
+    L_M_closed_form at s = sigma + i(t0 + m·dt) for m = 0..num-1
+
+    The powers j^{-s} are computed exactly at the first point and then
+    advanced along the grid by the fixed rotations exp(-i·dt·log j).
+    Every `reseed` steps they are recomputed from scratch so rounding
+    does not accumulate over long scans.
+
+    Returns (t_values, L_values) as lists of mpf / mpc.
+    """
+    t0, dt, sigma = mp.mpf(t0), mp.mpf(dt), mp.mpf(sigma)
+    logs = [log(j) for j in range(2, jmax + 1)]
+    steps = [exp(mp.mpc(0, -dt) * lj) for lj in logs]
+
+    t_values, L_values = [], []
+    for m in range(num):
+        t = t0 + m * dt
+        s = mp.mpc(sigma, t)
+        if m % reseed == 0:
+            powers = [exp(-s * lj) for lj in logs]
+        else:
+            powers = [p * r for p, r in zip(powers, steps)]
+        zeta_s = zeta(s)
+        t_values.append(t)
+        L_values.append(zeta_s * (zeta_s - 1) - _correction_from_powers(powers))
+    return t_values, L_values
+
+def _hurwitz_em(s, a, max_terms=60):
+    """ζ(s, a) for large a by Euler–Maclaurin at a itself, no head sum"""
+    a_pow = mp.power(a, -s)
+    total = a_pow / 2 + a * a_pow / (s - 1)
+    factor = s * a_pow / a  # (s)_{2k-1} a^{-s-2k+1}
+    last = fabs(total)
+    for k in range(1, max_terms + 1):
+        term = bernoulli(2*k) / factorial(2*k) * factor
+        if fabs(term) > last:
+            break  # asymptotic series started to diverge
+        total += term
+        last = fabs(term)
+        if last < mp.eps * fabs(total):
+            break
+        factor *= (s + 2*k - 1) * (s + 2*k) / a**2
+    return total
+
+def hurwitz_zeta_range(s, d_max, d_min=1):
+    """
+    ζ(s, d) for d = d_min..d_max, as (values, powers d^{-s})
+
+    One Euler–Maclaurin evaluation at A = max(d_max + 1, 2|s| + 20), then
+    ζ(s, d) = ζ(s, d+1) + d^{-s} down to d_min. The recurrence only adds
+    terms, so it is stable; the powers are returned for reuse.
+    """
+    s = mp.mpmathify(s)
+    anchor = max(d_max + 1, int(2 * fabs(s)) + 20)
+    value = _hurwitz_em(s, anchor)
+    for d in range(anchor - 1, d_max, -1):
+        value += mp.power(d, -s)
+
+    values, powers = [], []
+    for d in range(d_max, d_min - 1, -1):
+        d_pow = mp.power(d, -s)
+        value += d_pow
+        values.append(value)
+        powers.append(d_pow)
+    return values[::-1], powers[::-1]
+
+def L_M_hurwitz(s, d_max=200):
+    """L_M(s) = Σ_{d=2}^{d_max} d^{-s} ζ(s, d), the sum over divisor pairs d ≤ n/d"""
+    hurwitz, powers = hurwitz_zeta_range(s, d_max, d_min=2)
+    return mp.fsum(h * p for h, p in zip(hurwitz, powers))
+
+def L_M_direct(s, nmax=1000):
+    """
+    L_M(s) = Σ_{n=1}^nmax M(n)/n^s
+
+    M(n) comes from one divisor sieve up to nmax; terms with M(n) = 0
+    (n = 1 and primes) are skipped.
+    """
+    table = M_table(nmax)
+    total = mp.mpf(0)
+    for n in np.flatnonzero(table):
+        total += int(table[n]) * mp.power(int(n), -s)
+    return total
+
+def gamma_classical(s):
+    """Classical gamma factor: γ(s) = π^(-s/2) Γ(s/2)"""
+    return mp.power(pi, -s/2) * gamma(s/2)
+
+def classical_gamma_ratio(s):
+    """γ(s)/γ(1-s) = π^{(1-2s)/2} Γ(s/2) / Γ((1-s)/2)"""
+    return mp.power(pi, (1 - 2*s)/2) * gamma(s/2) / gamma((1-s)/2)
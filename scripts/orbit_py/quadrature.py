@@ -0,0 +1,182 @@
+"""
+Tanh-sinh quadrature for the L_M integral representation
+
+  L_M(s) = 1/Γ(s) { [ζ(s)-1]/(s-1) + ∫_0^T t^{s-1} f_reg(t) dt }
+  f_reg(t) = [Li_s(e^{-t}) - e^{-t}]/(1-e^{-t}) - [ζ(s)-1]/t
+
+mp.quad spends almost all of its time in polylog(s, e^{-t}), one call per
+node. Here the nodes and weights of every tanh-sinh level are built once
+per precision (and cached), and Li_s(e^{-t}) is evaluated at all nodes of
+a level together from coefficient tables that depend on s only:
+
+  t ≥ 1:  Li_s(e^{-t}) = Σ_{k≥1} k^{-s} e^{-kt}                   (k^{-s} table)
+  t < 1:  Li_s(e^{-t}) = Γ(1-s) t^{s-1} + Σ_{k≥0} ζ(s-k) (-t)^k/k!   (ζ(s-k) table)
+
+both summed by Horner's rule. For an integer s = n the pole of Γ(1-s)
+cancels against ζ(s-k) at k = n-1, which leaves the term
+(-t)^{n-1}/(n-1)! · (H_{n-1} - log t).
+
+  tanh_sinh(f, a, b)         ∫_a^b f, f maps a list of nodes to a list of values
+  polylog_exp(s, t_values)   Li_s(e^{-t}) at every t
+  L_M_integral(s, T=30)      the representation above, as (value, error estimate)
+
+Levels are refined (h halved, only the new odd nodes evaluated) until two
+successive estimates agree to the working precision.
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+from mpmath import mp, zeta, gamma, exp, log, pi, cosh, sinh, fabs, harmonic
+
+@lru_cache(maxsize=None)
+def _level_nodes(prec, level):
+    """
+    New nodes of one tanh-sinh level on [0, 1], as (positions, weights)
+
+    Level 0 has h = 1 and all k; level j > 0 adds the odd multiples of
+    h = 2^-j. Positions are x = 1/(1 + e^{-2u}), u = (π/2)·sinh(kh), so nodes
+    near either end keep their full relative precision. Weights are
+    without the factor h.
+    """
+    with mp.workprec(prec):
+        h = mp.mpf(2) ** -level
+        step = 1 if level == 0 else 2
+        start = 0 if level == 0 else 1
+        positions, weights = [], []
+        k = start
+        while True:
+            u = pi / 2 * sinh(k * h)
+            w = pi / 4 * cosh(k * h) / cosh(u) ** 2
+            if w < mp.eps ** 2:
+                break
+            if k == 0:
+                positions.append(mp.mpf(0.5))
+                weights.append(w)
+            else:
+                positions += [1 / (1 + exp(-2 * u)), 1 / (1 + exp(2 * u))]
+                weights += [w, w]
+            k += step
+        return positions, weights
+
+def tanh_sinh(f, a, b, max_level=10, tol=None):
+    """
+    ∫_a^b f(t) dt by tanh-sinh, as (value, error estimate)
+
+    f takes the list of all new nodes of a level at once and returns their
+    values, so the integrand can share work between nodes. Stops when two
+    successive levels agree to tol (default: the working precision).
+    """
+    a, b = mp.mpf(a), mp.mpf(b)
+    tol = tol or 10 * mp.eps
+    total = None
+    error = mp.inf
+    for level in range(max_level + 1):
+        positions, weights = _level_nodes(mp.prec, level)
+        values = f([a + (b - a) * x for x in positions])
+        new = (b - a) * mp.fsum(v * w for v, w in zip(values, weights))
+        h = mp.mpf(2) ** -level
+        estimate = h * new if total is None else total / 2 + h * new
+        if total is not None:
+            error = fabs(estimate - total)
+            if error <= tol * max(1, fabs(estimate)):
+                return estimate, error
+        total = estimate
+    return total, error
+
+def _horner(coeffs, x):
+    """Σ coeffs[k] x^k"""
+    total = mp.mpf(0)
+    for c in reversed(coeffs):
+        total = total * x + c
+    return total
+
+def _integer_order(s):
+    """n if s is the integer n ≥ 1, else None"""
+    if s.imag == 0 and s.real >= 1 and s.real == int(s.real):
+        return int(s.real)
+    return None
+
+@lru_cache(maxsize=64)
+def _polylog_tables(s, prec):
+    """
+    k^{-s} (k ≤ K, enough for t ≥ 1), ζ(s-k)/k! (enough for t < 1) and Γ(1-s)
+
+    ζ(s-k)/k! only decays like (2π)^{-k} once k ≫ |s|, so that table is
+    extended until its terms at t = 1 stay below the working precision.
+    """
+    with mp.workprec(prec):
+        bits = prec + 10
+        K = int(bits * math.log(2)) + 2
+        powers = [mp.mpf(0)] + [mp.power(k, -s) for k in range(1, K + 1)]
+
+        n_int = _integer_order(s)
+        coeffs, largest, below = [], mp.mpf(0), 0
+        for k in range(10 * bits):
+            c = mp.mpf(0) if k + 1 == n_int else zeta(s - k) / mp.factorial(k)
+            coeffs.append(c)
+            largest = max(largest, fabs(c))
+            # ζ(-2m) = 0, so look for two small terms in a row
+            below = below + 1 if fabs(c) < largest * mp.mpf(2) ** -bits else 0
+            if below == 2:
+                break
+        log_sizes = np.array([float(log(fabs(c))) if c != 0 else -np.inf for c in coeffs])
+        return powers, coeffs, log_sizes, (gamma(1 - s) if n_int is None else None)
+
+def polylog_exp(s, t_values):
+    """
+    Li_s(e^{-t}) for every t > 0 in t_values, as a list
+
+    The coefficient tables depend on s only and are cached, so repeated
+    batches at the same s (the levels of one integral) only pay for the
+    Horner sums, each cut to the terms that matter at its t.
+    """
+    s = mp.mpmathify(s)
+    powers, coeffs, log_sizes, gamma_1ms = _polylog_tables(s, mp.prec)
+    k = np.arange(len(coeffs))
+    n_int = _integer_order(s)
+    bits = mp.prec + 10
+
+    results = []
+    for t in t_values:
+        t = mp.mpf(t)
+        if t >= 1:
+            n = int(bits * math.log(2) / float(t)) + 2  # e^{-kt} < 2^-bits beyond
+            results.append(_horner(powers[:n + 1], exp(-t)))
+            continue
+        # drop the terms that are negligible at this t
+        sizes = log_sizes + k * float(log(t))
+        n = int(np.flatnonzero(sizes > sizes.max() - bits * math.log(2))[-1])
+        series = _horner(coeffs[:n + 1], -t)
+        if n_int is None:
+            results.append(series + gamma_1ms * mp.power(t, s - 1))
+        else:
+            m = n_int - 1
+            results.append(series + (-t) ** m / mp.factorial(m) * (harmonic(m) - log(t)))
+    return results
+
+def L_M_integral(s, T=30, max_level=10):
+    """
+    L_M(s) from the integral representation, as (value, error estimate)
+
+    The singular part [ζ(s)-1]/(s-1) is added analytically (left out
+    within 0.01 of s = 1) and the regular part is integrated over [0, T].
+    """
+    s = mp.mpmathify(s)
+    zeta_1 = zeta(s) - 1
+    singular = zeta_1 / (s - 1) if fabs(s - 1) > 0.01 else mp.mpc(0)
+
+    def regular(t_values):
+        values = []
+        for t, Li in zip(t_values, polylog_exp(s, t_values)):
+            if t == 0:
+                values.append(mp.mpc(0))
+                continue
+            q = exp(-t)
+            values.append(mp.power(t, s - 1) * ((Li - q) / -mp.expm1(-t) - zeta_1 / t))
+        return values
+
+    integral, error = tanh_sinh(regular, 0, T, max_level)
+    gamma_s = gamma(s)
+    return (singular + integral) / gamma_s, error / fabs(gamma_s)
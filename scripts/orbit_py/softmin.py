@@ -0,0 +1,225 @@
+"""
+Soft-min distances and the F_n(s) series
+
+  soft_min_squared(x, d) = -(1/α) log Σ_{k=0}^{x//d} exp(-α (x - (k·d + d²))²)
+  F_n(s)                 = Σ_{d=2}^maxD soft_min_squared(n, d)^(-s)
+
+(terms with soft_min_squared ≤ 0 are left out of F_n).
+
+Only the lattice points nearest x matter: the point j steps beyond the
+nearest one, k0 = round((x - d²)/d), is further by at least d²·|j|(|j|-1)
+in squared distance, so with α = 7 and d ≥ 2 every term from j = ±2 on
+is below 1e-24 of the largest. With tol > 0 (default TOL) only the window
+k0 - w..k0 + w is summed, w the largest |j| with α·d²·|j|(|j|-1) < log(1/tol);
+each dropped term is below tol times the kept maximum, and a call is O(1)
+(three points for α = 7) instead of O(x/d). tol=0 sums the whole lattice.
+
+soft_min_squared evaluates one (x, d). The kernels below evaluate all
+d at once: the lattices (or windows) of every (x, d) pair are laid end to
+end in one flat array (a ragged layout; with tol=0 that is
+Σ_d x/d ≈ x·log maxD entries rather than maxD·x/2 padded), and the
+log-sum-exp of every segment is one np.maximum.reduceat / np.add.reduceat
+pass:
+
+  soft_min_vector(x)            soft_min_squared(x, d) for d = 2..min(maxD, 10x)
+  soft_min_batch(x_values)      the same for many x, as a padded (x, d) array
+                                (NaN past the cutoff), in bounded-memory chunks
+  compute_F_n_batch(n_values)   F_n(s) for many n
+
+Only the exponent changes between evaluations of F_n at different s, so
+SoftMinSeries keeps log soft_min_squared(n, d) for one (n, α) and
+evaluates F_n and its s-derivatives
+
+  F_n^{(k)}(s) = Σ_d (-log m_d)^k m_d^{-s},   m_d = soft_min_squared(n, d)
+
+for any number of s as one exp and one small matrix product:
+
+  F = SoftMinSeries(n, alpha)
+  F(s_grid); F.derivatives(s_grid, order=2)   # F, F', F'' columns
+
+F_n'' = Σ_d m_d^{-s} log² m_d ≥ 0, so F_n is convex in s: it has an
+interior minimum on [a, b] iff F_n'(a) < 0 < F_n'(b), and SoftMinSeries.minimize
+finds it by Newton on F_n'(s) = 0, safeguarded by bisection of the bracket.
+"""
+
+import math
+
+import numpy as np
+
+# Lattice entries per chunk of soft_min_batch (~4 float64 arrays of this size)
+_CHUNK_ENTRIES = 1 << 22
+
+# Default truncation: terms below TOL × the largest are dropped (0: none)
+TOL = 1e-17
+
+def _half_width(d, alpha, tol):
+    """Largest j with α·d²·j(j-1) < log(1/tol): lattice points kept on each side of k0"""
+    c = np.log(1 / tol) / (alpha * d * d)
+    return np.ceil((1 + np.sqrt(1 + 4 * c)) / 2).astype(np.int64) - 1
+
+def _window(x, d, alpha, tol):
+    """First lattice index and point count summed for each (x, d)"""
+    last = x // d
+    if not tol:
+        return np.zeros_like(last), last + 1
+    w = _half_width(d, alpha, tol)
+    k0 = np.clip(np.rint((x - d * d) / d).astype(np.int64), 0, last)
+    lo = np.maximum(k0 - w, 0)
+    return lo, np.minimum(k0 + w, last) - lo + 1
+
+def soft_min_squared(x: int, d: int, alpha: float = 7.0, tol: float = TOL) -> float:
+    """
+    Compute soft-min of squared distances from x to all points k*d + d^2
+    Uses log-sum-exp trick for numerical stability; with tol > 0 only the
+    lattice points near x are summed (see module docstring)
+    """
+    last = x // d
+    if tol:
+        c = math.log(1 / tol) / (alpha * d * d)
+        w = math.ceil((1 + math.sqrt(1 + 4 * c)) / 2) - 1  # _half_width, scalar
+        k0 = min(max(round((x - d * d) / d), 0), last)
+        k = np.arange(max(k0 - w, 0), min(k0 + w, last) + 1, dtype=np.float64)
+    else:
+        k = np.arange(last + 1, dtype=np.float64)
+    neg_dist_sq = -alpha * (x - d * (k + d))**2
+    M = neg_dist_sq.max()
+
+    log_sum_exp = M + np.log(np.exp(neg_dist_sq - M).sum())
+
+    return float(-log_sum_exp / alpha)
+
+def _soft_min_pairs(x, d, alpha, tol):
+    """soft_min_squared over flat arrays of (x, d) pairs, one ragged lattice"""
+    lo, lengths = _window(x, d, alpha, tol)
+    starts = np.zeros(len(x), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    k = np.arange(lengths.sum(), dtype=np.float64)
+    k -= np.repeat((starts - lo).astype(np.float64), lengths)
+
+    # x - (k·d + d²), exact in float64 (integers far below 2^53), built in place
+    neg_dist_sq = k
+    neg_dist_sq *= -np.repeat(d.astype(np.float64), lengths)
+    neg_dist_sq += np.repeat((x - d * d).astype(np.float64), lengths)
+    neg_dist_sq *= neg_dist_sq
+    neg_dist_sq *= -alpha
+    M = np.maximum.reduceat(neg_dist_sq, starts)
+    neg_dist_sq -= np.repeat(M, lengths)
+    log_sum_exp = M + np.log(np.add.reduceat(np.exp(neg_dist_sq, out=neg_dist_sq), starts))
+    return -log_sum_exp / alpha
+
+def soft_min_vector(x: int, max_d: int = 500, alpha: float = 7.0, tol: float = TOL) -> np.ndarray:
+    """soft_min_squared(x, d) for d = 2..min(max_d, 10x); entry i is d = i + 2"""
+    cutoff = min(max_d, 10 * x)
+    d = np.arange(2, cutoff + 1, dtype=np.int64)
+    return _soft_min_pairs(np.full(len(d), x, dtype=np.int64), d, alpha, tol)
+
+def soft_min_batch(x_values, max_d: int = 500, alpha: float = 7.0, tol: float = TOL) -> np.ndarray:
+    """
+    soft_min_squared(x, d) for every x in x_values and d = 2..max_d
+
+    Returns a (len(x_values), max_d - 1) array, column j is d = j + 2, with
+    NaN where d > 10x (the cutoff of compute_F_n). The x values are
+    processed in chunks of about _CHUNK_ENTRIES lattice points.
+    """
+    x_values = np.asarray(x_values, dtype=np.int64)
+    d_all = np.arange(2, max_d + 1, dtype=np.int64)
+    result = np.full((len(x_values), len(d_all)), np.nan)
+
+    cutoffs = np.minimum(max_d, 10 * x_values)
+    # lattice size of each x (over all its d), to cut the chunks
+    if tol:
+        sizes = (cutoffs - 1) * (2 * _half_width(2, alpha, tol) + 1)
+    else:
+        sizes = np.array([(x // d_all[:c - 1] + 1).sum() for x, c in zip(x_values, cutoffs)], dtype=np.int64)
+
+    lo = 0
+    while lo < len(x_values):
+        hi = lo + max(1, int(np.searchsorted(np.cumsum(sizes[lo:]), _CHUNK_ENTRIES, side='right')))
+        counts = cutoffs[lo:hi] - 1
+        rows = np.repeat(np.arange(lo, hi), counts)
+        cols = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        result[rows, cols] = _soft_min_pairs(x_values[rows], d_all[cols], alpha, tol)
+        lo = hi
+    return result
+
+def compute_F_n(n: int, s: float, alpha: float = 7.0, max_d: int = 500, tol: float = TOL) -> float:
+    """Compute F_n(s) = Sum[soft-min_d(n)^(-s), {d, 2, maxD}]"""
+    soft_min = soft_min_vector(n, max_d, alpha, tol)
+    return float((soft_min[soft_min > 0] ** (-s)).sum())
+
+def compute_F_n_batch(n_values, s: float, alpha: float = 7.0, max_d: int = 500,
+                      tol: float = TOL) -> np.ndarray:
+    """F_n(s) for every n in n_values, as an array"""
+    soft_min = soft_min_batch(n_values, max_d, alpha, tol)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        terms = np.where(soft_min > 0, soft_min, np.nan) ** (-s)
+    return np.nansum(terms, axis=1)
+
+# ============================================================================
+# F_n AT MANY s
+# ============================================================================
+
+class SoftMinSeries:
+    """F_n(s) for one (n, alpha): the soft-min vector is computed once, each s is a reduction"""
+
+    def __init__(self, n: int, alpha: float = 7.0, max_d: int = 500, tol: float = TOL):
+        self.n = n
+        self.alpha = alpha
+        soft_min = soft_min_vector(n, max_d, alpha, tol)
+        self.log_soft_min = np.log(soft_min[soft_min > 0])
+
+    def __len__(self):
+        return len(self.log_soft_min)
+
+    def derivatives(self, s, order: int = 2) -> np.ndarray:
+        """
+        F_n(s), F_n'(s), ..., F_n^{(order)}(s)
+
+        s scalar: array of order + 1 values; s array: shape s.shape + (order + 1,)
+        """
+        s_arr = np.asarray(s, dtype=np.float64)
+        powers = (-self.log_soft_min) ** np.arange(order + 1)[:, None]
+        terms = np.exp(-np.multiply.outer(s_arr, self.log_soft_min))
+        return terms @ powers.T
+
+    def __call__(self, s):
+        """F_n(s), a float for scalar s and an array for array s"""
+        value = self.derivatives(s, order=0)[..., 0]
+        return float(value) if np.ndim(value) == 0 else value
+
+    def derivative(self, s, order: int = 1):
+        """d^order F_n / ds^order at s"""
+        value = self.derivatives(s, order)[..., order]
+        return float(value) if np.ndim(value) == 0 else value
+
+    def minimize(self, s_bounds=(0.5, 5.0), tol: float = 1e-12, maxiter: int = 50):
+        """
+        argmin of F_n over s_bounds, as (s, F_n(s), interior)
+
+        interior is False when F_n is monotonic on the interval (F_n' does
+        not change sign between the bounds); s is then the bound where F_n
+        is smaller.
+        Otherwise s is the root of F_n' to within tol.
+        """
+        lo, hi = s_bounds
+        slope_lo, slope_hi = self.derivatives(np.array([lo, hi]), order=1)[:, 1]
+        if not slope_lo < 0:
+            return lo, self(lo), False
+        if not slope_hi > 0:
+            return hi, self(hi), False
+
+        s = (lo + hi) / 2
+        for _ in range(maxiter):
+            _, slope, curvature = self.derivatives(s, order=2)
+            if slope < 0:
+                lo = s
+            else:
+                hi = s
+            s_next = s - slope / curvature
+            if not lo < s_next < hi:
+                s_next = (lo + hi) / 2
+            done = abs(s_next - s) < tol or hi - lo < tol
+            s = s_next
+            if done:
+                break
+        return s, self(s), True
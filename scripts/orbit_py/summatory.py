@@ -0,0 +1,73 @@
+"""
+Summatory functions of M(n) and tau(n) by the Dirichlet hyperbola method
+
+Σ_{n≤x} M(n) counts pairs (d, m) with 2 ≤ d ≤ m and d·m ≤ x, so with
+r = ⌊√x⌋:
+
+  Σ_{n≤x} M(n) = Σ_{d=2}^{r} (⌊x/d⌋ - d + 1)
+               = (D(x) + r)/2 - x
+  D(x)         = Σ_{n≤x} tau(n) = 2·Σ_{d=1}^{r} ⌊x/d⌋ - r²
+
+Each value costs O(√x) integer divisions, done in NumPy blocks, instead of
+O(x) sieving: x = 10^12 takes milliseconds.
+
+  sum_M(x)                   one value
+  sum_M_checkpoints(xs)      many x from a single pass over d
+  divisor_summatory(x)       D(x)
+
+Results are exact Python ints for x < 9·10^18 (int64 block sums).
+"""
+
+import math
+
+import numpy as np
+
+DEFAULT_BLOCK = 1 << 22
+
+def _floor_sum_blocks(xs, roots, block):
+    """
+    For each i: Σ_{d=2}^{roots[i]} ⌊xs[i]/d⌋, sharing one pass over d
+
+    Blocks [a, b) at most double a, so one block sum is below x·log 2 + b
+    and fits in int64 before it is added to a Python int.
+    """
+    totals = [0] * len(xs)
+    r_max = max(roots, default=1)
+
+    a = 2
+    while a <= r_max:
+        b = min(2 * a, a + block, r_max + 1)
+        d = np.arange(a, b, dtype=np.int64)
+        for i, (x, r) in enumerate(zip(xs, roots)):
+            if r < a:
+                continue
+            dd = d if r >= b - 1 else d[:r - a + 1]
+            totals[i] += int((np.int64(x) // dd).sum())
+        a = b
+
+    return totals
+
+def sum_M_checkpoints(checkpoints, block=DEFAULT_BLOCK):
+    """Σ_{n≤x} M(n) for every x in checkpoints, as a dict {x: sum}"""
+    xs = sorted(set(int(x) for x in checkpoints))
+    roots = [math.isqrt(x) if x > 0 else 0 for x in xs]
+    floor_sums = _floor_sum_blocks(xs, roots, block)
+
+    result = {}
+    for x, r, floor_sum in zip(xs, roots, floor_sums):
+        # Σ_{d=2}^{r} (d - 1) = r(r - 1)/2
+        result[x] = floor_sum - r * (r - 1) // 2 if r >= 2 else 0
+    return result
+
+def sum_M(x, block=DEFAULT_BLOCK):
+    """Σ_{n≤x} M(n)"""
+    return sum_M_checkpoints([x], block)[int(x)]
+
+def divisor_summatory(x, block=DEFAULT_BLOCK):
+    """D(x) = Σ_{n≤x} tau(n) = 2·Σ_{d≤√x} ⌊x/d⌋ - ⌊√x⌋²"""
+    x = int(x)
+    if x < 1:
+        return 0
+    r = math.isqrt(x)
+    floor_sum = _floor_sum_blocks([x], [r], block)[0] + x  # add the d = 1 term
+    return 2 * floor_sum - r * r
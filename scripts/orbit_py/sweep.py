@@ -0,0 +1,160 @@
+"""
+Parallel critical-line phase sweeps
+
+  θ(t) = arg(f(s)/f(1-s)),   s = 1/2 + it
+       = arg[(L_M(1-s)/L_M(s)) / (γ(1-s)/γ(s))],   γ(s) = π^{-s/2}Γ(s/2)
+
+The t-grid is cut into contiguous shards that run on a ProcessPoolExecutor.
+Every worker sets mp.dps once in its initializer, and each shard evaluates
+L_M with L_M_closed_form_many so log j is shared inside the shard. Shards
+come back in t order (pool.map), and the phase is unwrapped as they
+arrive:
+
+  for t, theta, theta_unwrapped in phase_sweep(t_values, workers=32):
+      ...
+
+A script's own compute_phase(t) can be swept instead via phase_func=;
+it has to be a module-level function so the workers can unpickle it.
+
+A fixed step miscounts 2π wraps wherever θ moves by more than π between
+samples. adaptive_phase_grid starts coarse and bisects only the intervals
+whose wrapped increment, or the increment predicted from the neighbouring
+slopes, exceeds max_increment (π/2 by default), so the unwrapped phase is
+right with far fewer evaluations than a uniformly fine grid:
+
+  t, theta, theta_unwrapped = adaptive_phase_grid(2, 50, step=0.5)
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from mpmath import mp, arg, conj
+
+from .lfunc import L_M_closed_form_many, gamma_classical
+
+def critical_phase(t, jmax=200):
+    """θ(t) = arg(f(s)/f(1-s)) at s = 1/2 + it, as a float in (-π, π]"""
+    return _phases([t], jmax)[0]
+
+def _phases(t_values, jmax):
+    s_values = [mp.mpc(0.5, t) for t in t_values]
+    phases = []
+    for s, L_s in zip(s_values, L_M_closed_form_many(s_values, jmax)):
+        L_1ms = conj(L_s)  # Schwarz symmetry
+        f_ratio = (L_1ms / L_s) / (gamma_classical(1 - s) / gamma_classical(s))
+        phases.append(float(arg(f_ratio)))
+    return phases
+
+def _init_worker(dps):
+    mp.dps = dps
+
+def _run_shard(task):
+    t_values, jmax, phase_func = task
+    if phase_func is None:
+        return _phases(t_values, jmax)
+    return [phase_func(t) for t in t_values]
+
+class PhaseUnwrapper:
+    """
+    Incremental phase unwrapping: push raw phases in order, get unwrapped
+
+    A jump of more than π between neighbours is taken as a 2π wrap, the
+    same rule as unwrap_phase in the phase scripts.
+    """
+
+    def __init__(self):
+        self.previous = None
+        self.shift = 0.0
+
+    def push(self, phase):
+        if self.previous is not None:
+            diff = phase - self.previous
+            if diff > math.pi:
+                self.shift -= 2 * math.pi
+            elif diff < -math.pi:
+                self.shift += 2 * math.pi
+        self.previous = phase
+        return phase + self.shift
+
+def phase_sweep(t_values, jmax=200, workers=None, dps=None, chunk_size=None, phase_func=None):
+    """
+    Yield (t, θ(t), unwrapped θ(t)) for every t, in the order given
+
+    workers      process count (default: all cores; 1 runs in-process)
+    dps          mpmath precision in the workers (default: current mp.dps)
+    chunk_size   t values per shard (default: ~4 shards per worker)
+    phase_func   module-level t -> phase to use instead of critical_phase
+    """
+    t_values = list(t_values)
+    workers = workers or os.cpu_count() or 1
+    dps = dps or mp.dps
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(t_values) / (4 * workers)))
+
+    shards = [t_values[i:i + chunk_size] for i in range(0, len(t_values), chunk_size)]
+    tasks = [(shard, jmax, phase_func) for shard in shards]
+    unwrapper = PhaseUnwrapper()
+
+    if workers == 1:
+        for shard, task in zip(shards, tasks):
+            with mp.workdps(dps):
+                phases = _run_shard(task)
+            for t, phase in zip(shard, phases):
+                yield t, phase, unwrapper.push(phase)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(dps,)) as pool:
+        for shard, phases in zip(shards, pool.map(_run_shard, tasks)):
+            for t, phase in zip(shard, phases):
+                yield t, phase, unwrapper.push(phase)
+
+def _wrap(x):
+    """Reduce phase differences to [-π, π)"""
+    return (x + math.pi) % (2 * math.pi) - math.pi
+
+def adaptive_phase_grid(t_min, t_max, step=0.5, max_increment=math.pi / 2, min_step=1e-6,
+                        jmax=200, phase_func=None, max_points=10**6):
+    """
+    Sample θ(t) on [t_min, t_max], refining only where it moves fast
+
+    An interval [t_i, t_{i+1}] is bisected while its wrapped increment
+    |Δθ| exceeds max_increment, or while a neighbouring interval's slope
+    predicts such an increment (this catches a full 2π turn hidden inside
+    a coarse step). Intervals shorter than min_step are left alone.
+
+    phase_func maps a list of t to a list of raw phases (default: θ(t)
+    from L_M_closed_form_many at jmax and the current mp.dps). Returns
+    (t, θ, unwrapped θ) as arrays sorted by t; len(t) is the number of
+    evaluations.
+    """
+    if phase_func is None:
+        phase_func = lambda ts: _phases(ts, jmax)
+
+    num = max(2, math.ceil((t_max - t_min) / step) + 1)
+    t = np.linspace(t_min, t_max, num)
+    theta = np.asarray(phase_func(t.tolist()), dtype=float)
+
+    while len(t) < max_points:
+        h = np.diff(t)
+        d = _wrap(np.diff(theta))
+        slope = np.abs(d) / h
+        neighbour = np.maximum(np.r_[0.0, slope[:-1]], np.r_[slope[1:], 0.0])
+        split = (np.abs(d) > max_increment) | (neighbour * h > max_increment)
+        split &= h > 2 * min_step
+        if not split.any():
+            break
+
+        idx = np.flatnonzero(split)
+        mids = (t[idx] + t[idx + 1]) / 2
+        mid_theta = np.asarray(phase_func(mids.tolist()), dtype=float)
+        order = np.argsort(np.r_[t, mids], kind='stable')
+        t = np.r_[t, mids][order]
+        theta = np.r_[theta, mid_theta][order]
+
+    unwrapper = PhaseUnwrapper()
+    unwrapped = np.array([unwrapper.push(x) for x in theta])
+    return t, theta, unwrapped
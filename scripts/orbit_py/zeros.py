@@ -0,0 +1,368 @@
+"""
+Zeros of ζ and L_M near the critical line, and a binary zero catalog
+
+ζ zeros:
+  1. Bracket: sign changes of the Hardy Z-function on a grid of step
+     (mean zero spacing)/8, spacing = 2π/log(t/2π). The count is checked
+     against N(t) (mpmath nzeros); on a shortfall the step is halved.
+  2. Refine: vectorized bisection on all brackets at once (double).
+  3. Polish (dps given): mp.findroot on siegelz, one process per core.
+
+L_M zeros (true L_M = (ζ(s)² + ζ(2s))/2 - ζ(s), i.e. the tail-corrected
+closed form) are not on the line, so local minima of |L_M| on a σ × t
+grid over |σ - 1/2| < sigma_window are used as starting points for
+complex Newton (mp.findroot) in parallel; converged roots inside the
+window are kept, and their number is checked against the argument
+principle (count_L_M_zeros) over the same rectangle.
+
+Catalog file (little-endian):
+
+  header  8s magic 'ORBZCAT1', 8s kind ('zeta'/'L_M'), q first_index,
+          q count, q dps, q jmax                                (48 bytes)
+  records count × (f8 t_hi, f8 t_lo, f8 sigma)              (24 bytes each)
+
+t = t_hi + t_lo is a double-double (~31 digits), so the dps recorded in
+the header is capped at CATALOG_DIGITS; σ is a double. Records are sorted by t,
+so the file is its own index: zero n is record n - first_index, and a
+height lookup is a binary search on the memory-mapped t_hi column.
+
+  zeta_zeros(count, start=1, dps=30)      zeros n = start.. as mpf, built on
+                                          demand into cache/zeros/
+  find_zeta_zeros(t_min, t_max, dps)      (first_index, [t]) in a t-range
+  find_L_M_zeros(t_min, t_max, dps)       [σ + it] near the critical line
+  L_M_zeros(t_min, t_max, dps=30)         the same, cached in cache/zeros/
+  count_L_M_zeros(t_min, t_max)           number of zeros in a rectangle by the
+                                          argument principle
+  write_catalog / ZeroCatalog             the file format above
+"""
+
+import math
+import os
+import struct
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from mpmath import mp
+
+from .fastpath import zeta_np, L_M_logderiv_np, _integrate
+from .lfunc import L_M_closed_form
+from .riemann_siegel import hardy_Z, theta_exact
+
+CATALOG_MAGIC = b"ORBZCAT1"
+CATALOG_DIR = "cache/zeros"
+CATALOG_DIGITS = 31  # significant digits of a double-double height
+_HEADER = struct.Struct("<8s8sqqqq")
+_RECORD = np.dtype([('t_hi', '<f8'), ('t_lo', '<f8'), ('sigma', '<f8')])
+
+# ============================================================================
+# CATALOG
+# ============================================================================
+
+def write_catalog(path, kind, first_index, zeros, dps=0, jmax=0):
+    """
+    Write zeros (mpf heights, or mpc σ + it) sorted by height to path
+
+    The file is written to a temporary name and renamed, so readers never
+    see a partial catalog. The header records min(dps, CATALOG_DIGITS),
+    the precision the records actually hold.
+    """
+    records = np.zeros(len(zeros), dtype=_RECORD)
+    for i, z in enumerate(zeros):
+        z = mp.mpmathify(z)
+        t, sigma = (z.imag, z.real) if isinstance(z, mp.mpc) else (z, mp.mpf(0.5))
+        hi = float(t)
+        records[i] = (hi, float(t - hi), float(sigma))
+    records.sort(order='t_hi')
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(CATALOG_MAGIC, kind.encode().ljust(8, b"\0"),
+                             first_index, len(records), min(dps, CATALOG_DIGITS), jmax))
+        f.write(records.tobytes())
+    os.replace(tmp, path)
+
+class ZeroCatalog:
+    """Read-only, memory-mapped view of a catalog written by write_catalog"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            magic, kind, first, count, dps, jmax = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != CATALOG_MAGIC:
+            raise ValueError(f"{path}: not a zero catalog")
+        self.kind = kind.rstrip(b"\0").decode()
+        self.first_index, self.count, self.dps, self.jmax = first, count, dps, jmax
+        self.records = (np.memmap(self.path, dtype=_RECORD, mode='r',
+                                  offset=_HEADER.size, shape=(count,))
+                        if count else np.zeros(0, dtype=_RECORD))
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def last_index(self):
+        return self.first_index + self.count - 1
+
+    @property
+    def heights(self):
+        """All t as a float64 array (memory-mapped)"""
+        return self.records['t_hi']
+
+    def covers(self, start, count):
+        return self.first_index <= start and start + count - 1 <= self.last_index
+
+    def t(self, n):
+        """Height of zero n as an mpf (double-double precision)"""
+        r = self.records[n - self.first_index]
+        with mp.workdps(max(mp.dps, 32)):
+            return mp.mpf(float(r['t_hi'])) + mp.mpf(float(r['t_lo']))
+
+    def zero(self, n):
+        """Zero n as an mpc σ + it"""
+        r = self.records[n - self.first_index]
+        return mp.mpc(float(r['sigma']), self.t(n))
+
+    def index_at(self, t):
+        """Index of the first zero with height ≥ t"""
+        return self.first_index + int(np.searchsorted(self.heights, t))
+
+    def between(self, t_min, t_max):
+        """Indices n with t_min ≤ t_n ≤ t_max, as a range"""
+        lo = int(np.searchsorted(self.heights, t_min, side='left'))
+        hi = int(np.searchsorted(self.heights, t_max, side='right'))
+        return range(self.first_index + lo, self.first_index + hi)
+
+# ============================================================================
+# ZETA ZEROS
+# ============================================================================
+
+def _zero_spacing(t):
+    return 2 * math.pi / math.log(max(t, 4 * math.pi) / (2 * math.pi))
+
+def _gram_height(x):
+    """t with ϑ(t) = x (Newton on the asymptotic ϑ; t ≥ 7)"""
+    t = max(20.0, 2 * math.pi * math.exp(1 + abs(x) / 1e6))
+    for _ in range(100):
+        step = (float(theta_exact(t)) - x) / (0.5 * math.log(t / (2 * math.pi)))
+        t = max(7.0, t - step)
+        if abs(step) < 1e-12 * t:
+            break
+    return t
+
+def _bisect_Z(a, b, Za, iterations=64):
+    """Shrink all sign-change brackets [a, b] of Z at once"""
+    a, b, Za = a.copy(), b.copy(), Za.copy()
+    for _ in range(iterations):
+        mid = (a + b) / 2
+        Zm, _ = hardy_Z(mid)
+        left = np.sign(Zm) == np.sign(Za)
+        a = np.where(left, mid, a)
+        Za = np.where(left, Zm, Za)
+        b = np.where(left, b, mid)
+        if np.all(b - a <= 4 * np.finfo(float).eps * b):
+            break
+    return (a + b) / 2
+
+def _init_worker(dps):
+    mp.dps = dps
+
+def _polish_zeta(task):
+    """Newton from t; if it leaves the sign-change bracket [lo, hi], solve on the bracket"""
+    t, lo, hi = task
+    root = mp.findroot(mp.siegelz, mp.mpf(t))
+    if not lo <= root <= hi:
+        root = mp.findroot(mp.siegelz, (mp.mpf(lo), mp.mpf(hi)), solver='illinois')
+    return root
+
+def _parallel_map(func, items, dps, workers):
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(items) < 2:
+        with mp.workdps(dps):
+            return [func(x) for x in items]
+    chunk = max(1, len(items) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(dps,)) as pool:
+        return list(pool.map(func, items, chunksize=chunk))
+
+def find_zeta_zeros(t_min, t_max, dps=None, workers=None, max_halvings=5):
+    """
+    All zeros of ζ on the critical line with t_min < t ≤ t_max
+
+    Returns (first_index, heights): first_index is the ordinal of the first
+    zero found, heights are floats (dps=None) or mpf polished at dps.
+    """
+    with mp.workdps(15):
+        n_below = int(mp.nzeros(t_min)) if t_min > 14 else 0
+        expected = (int(mp.nzeros(t_max)) if t_max > 14 else 0) - n_below
+
+    step = _zero_spacing(t_max) / 8
+    for _ in range(max_halvings + 1):
+        grid = np.arange(t_min, t_max + step, step)
+        grid = grid[grid <= t_max]
+        Z, _ = hardy_Z(grid)
+        change = np.flatnonzero(np.sign(Z[:-1]) * np.sign(Z[1:]) < 0)
+        if len(change) >= expected:
+            break
+        step /= 2
+    else:
+        warnings.warn(f"found {len(change)} of {expected} zeros in ({t_min}, {t_max}]")
+
+    heights = _bisect_Z(grid[change], grid[change + 1], Z[change]).tolist()
+    if dps is not None:
+        tasks = list(zip(heights, grid[change].tolist(), grid[change + 1].tolist()))
+        heights = _parallel_map(_polish_zeta, tasks, dps, workers)
+    return n_below + 1, heights
+
+def zeta_zeros(count, start=1, dps=30, workers=None, catalog_dir=CATALOG_DIR):
+    """
+    Heights of zeros n = start, ..., start + count - 1 as mpf
+
+    Looked up in any catalog under catalog_dir that covers the range at
+    ≥ dps digits; otherwise the range is computed and saved as a new one.
+    Catalogs hold CATALOG_DIGITS digits, so above that the computed
+    heights are returned directly.
+    """
+    directory = Path(catalog_dir)
+    want_dps = dps or 0
+    for path in sorted(directory.glob("zeta_*.orbz")) if directory.exists() else []:
+        catalog = ZeroCatalog(path)
+        if (catalog.kind == 'zeta' and min(catalog.dps, CATALOG_DIGITS) >= want_dps
+                and catalog.covers(start, count)):
+            return [catalog.t(n) for n in range(start, start + count)]
+
+    # Gram points bracket the range generously: ϑ(t)/π + 1 ≈ N(t)
+    t_lo = _gram_height((start - 2.5) * math.pi) - 2 * _zero_spacing(start) if start > 3 else 1.0
+    t_hi = _gram_height((start + count + 0.5) * math.pi)
+    first, heights = find_zeta_zeros(max(1.0, t_lo), t_hi, dps, workers)
+    # a wide S(t) excursion: widen downward or upward until the range is covered
+    while first > start or first + len(heights) < start + count:
+        if first > start:
+            t_lo -= 4 * _zero_spacing(t_lo)
+        else:
+            t_hi += 4 * _zero_spacing(t_hi)
+        first, heights = find_zeta_zeros(max(1.0, t_lo), t_hi, dps, workers)
+
+    heights = heights[start - first:start - first + count]
+    path = directory / f"zeta_{start}_{count}_{want_dps}.orbz"
+    write_catalog(path, 'zeta', start, heights, dps=want_dps)
+    if want_dps > CATALOG_DIGITS:
+        return heights
+    catalog = ZeroCatalog(path)
+    return [catalog.t(n) for n in range(start, start + count)]
+
+# ============================================================================
+# L_M ZEROS
+# ============================================================================
+
+def _polish_L_M(task):
+    s0, jmax = task
+    f = lambda s: L_M_closed_form(s, jmax, tail=True)
+    try:
+        root = mp.findroot(f, s0, verify=False)
+    except (ZeroDivisionError, ValueError):
+        return None
+    if abs(f(root)) > mp.mpf(10) ** (-mp.dps // 2):
+        return None
+    return root
+
+def _grid_minima(values):
+    """(row, column) of the local minima of a 2-D array, edges included"""
+    padded = np.pad(values, 1, constant_values=np.inf)
+    centre = padded[1:-1, 1:-1]
+    is_min = np.ones(values.shape, dtype=bool)
+    for di in (-1, 0, 1):
+        for dj in (-1, 0, 1):
+            if di or dj:
+                is_min &= centre <= padded[1 + di:padded.shape[0] - 1 + di,
+                                           1 + dj:padded.shape[1] - 1 + dj]
+    return np.nonzero(is_min)
+
+def find_L_M_zeros(t_min, t_max, dps=30, jmax=None, step=0.01, sigma_window=0.5,
+                   sigma_step=0.05, workers=None, check=True):
+    """
+    Zeros σ + it of L_M with t_min ≤ t ≤ t_max and |σ - 1/2| < sigma_window
+
+    Starting points are the local minima of |L_M| on a σ × t grid over the
+    window (steps sigma_step × step, double precision), so zeros off the
+    critical line get one too; each is refined by complex Newton at dps
+    digits. The tail correction needs jmax ≳ |s| to reach that precision,
+    so jmax defaults to max(30, 2t) per starting point.
+
+    With check=True the result is compared with count_L_M_zeros over the
+    same rectangle, and a mismatch is reported as a warning.
+    Returns mpc zeros sorted by t.
+    """
+    t = np.arange(t_min, t_max + step, step)
+    n_sigma = max(2, math.ceil(2 * sigma_window / sigma_step) + 1)
+    sigma = np.linspace(0.5 - sigma_window, 0.5 + sigma_window, n_sigma)
+    s = (sigma[:, None] + 1j * t[None, :]).ravel()
+    zeta_s, _ = zeta_np(s)
+    zeta_2s, _ = zeta_np(2 * s)
+    absL = np.abs((zeta_s**2 + zeta_2s) / 2 - zeta_s).reshape(len(sigma), len(t))
+    rows, cols = _grid_minima(absL)
+
+    tasks = [(mp.mpc(float(sigma[i]), float(t[j])), jmax or max(30, int(2 * t[j])))
+             for i, j in zip(rows, cols)]
+    roots = _parallel_map(_polish_L_M, tasks, dps, workers)
+
+    zeros = {}
+    for root in roots:
+        if root is None or not (t_min <= root.imag <= t_max) or abs(root.real - 0.5) >= sigma_window:
+            continue
+        key = (round(float(root.real), 8), round(float(root.imag), 8))
+        zeros.setdefault(key, root)
+    zeros = sorted(zeros.values(), key=lambda z: z.imag)
+
+    if check:
+        expected, _ = count_L_M_zeros(t_min, t_max, 0.5 - sigma_window, 0.5 + sigma_window,
+                                      jmax=max(200, int(2 * t_max)))
+        if expected != len(zeros):
+            warnings.warn(f"found {len(zeros)} L_M zeros in t ∈ [{t_min}, {t_max}], "
+                          f"|σ - 1/2| < {sigma_window}; the argument principle counts {expected}")
+    return zeros
+
+def L_M_zeros(t_min, t_max, dps=30, jmax=None, workers=None, catalog_dir=CATALOG_DIR):
+    """
+    find_L_M_zeros through a catalog file per (t_min, t_max, dps)
+
+    Above CATALOG_DIGITS the zeros are computed (and saved) but returned
+    directly, since the catalog cannot hold them at dps digits.
+    """
+    path = Path(catalog_dir) / f"L_M_{t_min:g}_{t_max:g}_{dps}.orbz"
+    if not path.exists() or dps > CATALOG_DIGITS:
+        zeros = find_L_M_zeros(t_min, t_max, dps, jmax, workers=workers)
+        write_catalog(path, 'L_M', 1, zeros, dps=dps, jmax=jmax or 0)
+        if dps > CATALOG_DIGITS:
+            return zeros
+    catalog = ZeroCatalog(path)
+    return [catalog.zero(n) for n in range(1, catalog.count + 1)]
+
+def count_L_M_zeros(t_min, t_max, sigma_min=0.0, sigma_max=1.0, jmax=200, tail=True, tol=1e-6):
+    """
+    Zeros of L_M in sigma_min < σ < sigma_max, t_min < t < t_max
+
+    N = (1/2πi) ∮ L_M'/L_M ds around the rectangle (counterclockwise),
+    with L_M'/L_M from L_M_logderiv_np: tail=True counts zeros of the full
+    L_M (those of find_L_M_zeros), tail=False of L_M_closed_form at jmax.
+    The rectangle must avoid the pole at s = 1 (t_min > 0 does).
+    Returns (N rounded, the winding number as computed).
+    """
+    g = lambda s: L_M_logderiv_np(s, jmax, tail)[1]
+    height = t_max - t_min
+    pieces = max(1, math.ceil(height))
+    edges = [
+        _integrate(lambda x: g(x + 1j * t_min), sigma_min, sigma_max, 1, tol),
+        1j * _integrate(lambda y: g(sigma_max + 1j * y), t_min, t_max, pieces, tol),
+        -_integrate(lambda x: g(x + 1j * t_max), sigma_min, sigma_max, 1, tol),
+        -1j * _integrate(lambda y: g(sigma_min + 1j * y), t_min, t_max, pieces, tol),
+    ]
+    winding = sum(edges) / (2j * math.pi)
+    count = round(winding.real)
+    if abs(winding - count) > 0.1:
+        warnings.warn(f"winding number {winding:.4f} is not close to an integer; "
+                      f"a zero may lie on the contour")
+    return count, winding
@@ -3,19 +3,9 @@
 
 from mpmath import mp
 
-mp.dps = 30
+from orbit_py import M
 
-def M(n):
-    if n < 4:
-        return 0
-    count = 0
-    sqrt_n = int(n**0.5) + 1
-    for d in range(2, sqrt_n + 1):
-        if d * d > n:
-            break
-        if n % d == 0:
-            count += 1
-    return count
+mp.dps = 30
 
 print("Testing truncation error:")
 print()
@@ -1,18 +1,16 @@
 #!/usr/bin/env python3
 """
 Test pole structure of C(s) at s=1
+
+Besides the ε-probes, the Laurent coefficients of C at s = 1 are computed
+directly: the Taylor series of the truncated C_J, and contour samples of the
+tail-corrected C, whose double pole is (ζ² - ζ(2s))/2 → 1/2·(s-1)^-2.
 """
-import mpmath as mp
+from mpmath import mp
 
-mp.dps = 50
+from orbit_py import correction_sum, correction_taylor, laurent_contour
 
-def C_func(s, jmax):
-    """C(s) = sum_{j=2}^{jmax} H_{j-1}(s) / j^s"""
-    result = mp.mpf(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = sum(mp.power(k, -s) for k in range(1, j))
-        result += H_j_minus_1 / mp.power(j, s)
-    return result
+mp.dps = 50
 
 print("=== Pole Structure of C(s) at s=1 ===")
 print()
@@ -28,7 +26,7 @@ for k_exp in range(1, 8):
     eps = mp.power(10, -k_exp)
     s = 1 + eps
 
-    C_val = C_func(s, jmax)
+    C_val = correction_sum(s, jmax)
 
     # Test different pole orders
     test0 = C_val                    # k=0: just C(s)
@@ -41,6 +39,21 @@ for k_exp in range(1, 8):
     print(f"  (s-1)²·C(s)    = {mp.nstr(test2, 12)}")
     print()
 
+print("=== Laurent coefficients at s=1 ===")
+print()
+print(f"Truncated C (jmax={jmax}), Taylor series (no negative powers, C_J is entire):")
+for m, c in enumerate(correction_taylor(jmax, order=3)):
+    print(f"  (s-1)^{m}:  {mp.nstr(c, 20)}")
+print()
+
+N = 64
+coeffs, errors = laurent_contour(lambda s: correction_sum(s, 100, tail=True), 1, radius=0.25,
+                                 num=N, lowest=-2, count=3)
+print(f"Tail-corrected C (jmax=100 + Euler–Maclaurin), contour with {N} evaluations:")
+for m, c, e in zip(range(-2, 1), coeffs, errors):
+    print(f"  (s-1)^{m:<2}: {mp.nstr(c.real, 20):>26}  (± {mp.nstr(e, 3)})")
+print()
+
 print("=== Interpretation ===")
 print()
 print("If (s-1)²·C(s) → constant ≠ 0:  C has double pole")
@@ -12,67 +12,61 @@ UNKNOWN for other Re(s) < 1
 This script tests convergence of C(s) for various s values.
 """
 
-from mpmath import mp, zeta
+from mpmath import mp
 from mpmath import fabs
 
-mp.dps = 40
+from orbit_py import correction_checkpoints, correction_tail, convergence_record, write_records
 
-def partial_zeta(s, n):
-    """H_n(s) = Σ_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
+mp.dps = 40
 
-def C_sum(s, jmax):
-    """Compute C(s) = Σ_{j=2}^jmax H_{j-1}(s)/j^s"""
-    total = mp.mpc(0)
-    for j in range(2, jmax + 1):
-        H = partial_zeta(s, j - 1)
-        total += H / mp.power(j, s)
-    return total
+# C(s) counts as converged once consecutive checkpoints agree this well;
+# the sweep stops there
+STOP_TOL = 1e-4
+LEVELS = (('converged', STOP_TOL),)
+RECORDS_PATH = "cache/convergence/closed_form.json"
 
-def L_M_closed(s, jmax):
-    """Full closed form"""
-    zs = zeta(s)
-    c = C_sum(s, jmax)
-    return zs * (zs - 1) - c
+# jmax values for the tail-corrected sum (an order of magnitude fewer terms)
+TAIL_JMAX_VALUES = [10, 20, 50]
 
 def test_convergence(s, jmax_values):
-    """Test if C(s) converges by trying different jmax"""
+    """
+    Test if C(s) converges by trying different jmax
+
+    The checkpoints come from one pass over j (correction_checkpoints) and
+    the sweep stops at the first change below STOP_TOL. Returns the
+    convergence record.
+    """
     print(f"\nTesting s = {s}")
     print(f"  Re(s) = {float(s.real):.2f}, Im(s) = {float(s.imag):.2f}")
     print()
-    print(f"  {'jmax':<10} {'|C(s)|':<20} {'Change':<15} {'Converged?':<12}")
-    print(f"  {'-'*60}")
-
-    prev = None
-    results = []
+    print(f"  {'jmax':<10} {'|C(s)|':<20} {'Change':<15}")
+    print(f"  {'-'*45}")
 
-    for jmax in jmax_values:
-        c_val = C_sum(s, jmax)
-        mag = fabs(c_val)
+    record = convergence_record(correction_checkpoints(s, jmax_values), tol=STOP_TOL,
+                                levels=LEVELS, s=s)
 
-        if prev is not None:
-            change = fabs(c_val - prev)
-            change_str = f"{float(change):.6e}"
-            converged = "✓" if change < 1e-4 else "..."
-        else:
-            change_str = "N/A"
-            converged = ""
+    for point in record['checkpoints']:
+        change_str = f"{point['change']:.6e}" if point['change'] is not None else "N/A"
+        print(f"  {point['jmax']:<10} {point['abs']:<20.10f} {change_str:<15}")
 
-        mag_str = f"{float(mag):.10f}"
-        print(f"  {jmax:<10} {mag_str:<20} {change_str:<15} {converged:<12}")
+    # Same sum with the Euler–Maclaurin remainder for j > jmax added
+    print()
+    print(f"  Tail-corrected (remainder for j > jmax added):")
+    print(f"  {'jmax':<10} {'|C(s)|':<20} {'Est. error':<15} {'Change':<15}")
+    print(f"  {'-'*60}")
 
-        prev = c_val
-        results.append(mag)
+    prev_tail = None
+    for jmax, C_partial in correction_checkpoints(s, TAIL_JMAX_VALUES):
+        tail, tail_err = correction_tail(s, jmax)
+        c_val = C_partial + tail
+        change_str = f"{float(fabs(c_val - prev_tail)):.6e}" if prev_tail is not None else "N/A"
+        print(f"  {jmax:<10} {float(fabs(c_val)):<20.10f} {float(tail_err):<15.3e} {change_str:<15}")
+        prev_tail = c_val
 
-    # Check final convergence
-    if len(results) >= 2:
-        final_change = abs(results[-1] - results[-2])
-        if final_change < 1e-4:
-            print(f"\n  ✓ C(s) CONVERGES (change < 1e-4)")
-            return True
-        else:
-            print(f"\n  ⚠ C(s) may NOT converge (change = {float(final_change):.2e})")
-            return False
+    rate = f"{record['rate']:.3f}" if record['rate'] is not None else "N/A"
+    stop = f", stopped early at jmax={record['checkpoints'][-1]['jmax']}" if record['stopped_early'] else ""
+    print(f"\n  status: {record['status']}, |ΔC| ~ jmax^-p with p = {rate}{stop}")
+    return record
 
 def main():
     print("=" * 80)
@@ -112,24 +106,31 @@ def main():
 
     converged_cases = []
     failed_cases = []
+    records = []
 
     for s, label in test_cases:
         print(f"\n{'='*80}")
         print(f"{label}")
         print(f"{'='*80}")
 
-        converged = test_convergence(s, jmax_values)
+        record = test_convergence(s, jmax_values)
+        record['label'] = label
+        records.append(record)
 
-        if converged:
+        if record['status'] == 'converged':
             converged_cases.append((s, label))
         else:
             failed_cases.append((s, label))
 
+    write_records(RECORDS_PATH, records)
+
     print()
     print("=" * 80)
     print("SUMMARY")
     print("=" * 80)
     print()
+    print(f"Convergence records: {RECORDS_PATH}")
+    print()
 
     print(f"Converged ({len(converged_cases)}):")
     for s, label in converged_cases:
@@ -7,32 +7,18 @@ First zero: t₁ ≈ 14.134725...
 
 Hypothesis: Period of θ oscillation near t₁ equals {t₁}?
 
-Test with fine grid around t₁.
+Test with fine grid around t₁, refined adaptively wherever θ moves by
+more than π/2 between neighbouring samples.
 """
 
-from mpmath import mp, zeta, gamma, pi, arg, conj
+from mpmath import mp, arg, conj
 import math
 
-mp.dps = 50
-
-FIRST_ZERO = "14.134725141734693790457251983562470270784257115699243175685567460149"
-
-def partial_zeta(s, n):
-    """H_n(s) = Σ_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
+import numpy as np
 
-def L_M_closed_form(s, jmax=200):
-    """L_M(s) using closed form"""
-    zeta_s = zeta(s)
-    correction = mp.mpc(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
+from orbit_py import L_M_closed_form, gamma_classical, zeta_zeros, adaptive_phase_grid
 
-def gamma_classical(s):
-    """γ(s) = π^(-s/2) Γ(s/2)"""
-    return mp.power(pi, -s/2) * gamma(s/2)
+mp.dps = 50
 
 def compute_phase(t):
     """Compute arg(f(s)/f(1-s)) at s = 1/2 + it"""
@@ -44,26 +30,9 @@ def compute_phase(t):
     f_ratio = (L_1ms / L_s) / (g_1ms / g_s)
     return float(arg(f_ratio))
 
-def unwrap_phases(phases):
-    """Unwrap phase jumps"""
-    unwrapped = [phases[0]]
-    for i in range(1, len(phases)):
-        diff = phases[i] - phases[i-1]
-        if diff > math.pi:
-            unwrapped.append(phases[i] - 2*math.pi)
-        elif diff < -math.pi:
-            unwrapped.append(phases[i] + 2*math.pi)
-        else:
-            unwrapped.append(phases[i])
-
-    # Make cumulative
-    for i in range(1, len(unwrapped)):
-        while unwrapped[i] - unwrapped[i-1] > math.pi:
-            unwrapped[i] -= 2*math.pi
-        while unwrapped[i] - unwrapped[i-1] < -math.pi:
-            unwrapped[i] += 2*math.pi
-
-    return unwrapped
+def compute_phases(t_values):
+    """compute_phase over a batch of t (for adaptive_phase_grid)"""
+    return [compute_phase(t) for t in t_values]
 
 def main():
     print("=" * 80)
@@ -71,7 +40,7 @@ def main():
     print("=" * 80)
     print()
 
-    t1 = float(mp.mpf(FIRST_ZERO))
+    t1 = float(zeta_zeros(1)[0])
     t1_frac = t1 - math.floor(t1)
 
     print(f"First Riemann zero: t₁ = {t1:.10f}")
@@ -85,24 +54,19 @@ def main():
     t_max = 15.0
     step = 0.05  # Fine grid
 
-    t_values = []
-    t_current = t_min
-    while t_current <= t_max:
-        t_values.append(t_current)
-        t_current += step
+    # Start from the fixed grid, bisect wherever the unwrapping is ambiguous
+    t_grid, phases_raw, phases_unwrapped = adaptive_phase_grid(
+        t_min, t_max, step=step, phase_func=compute_phases)
+    t_values = t_grid.tolist()
+
+    uniform_points = round((t_max - t_min) / np.diff(t_grid).min()) + 1
 
     print()
-    print(f"Computing θ(t) for t ∈ [{t_min}, {t_max}] with step {step}")
-    print(f"Total points: {len(t_values)}")
+    print(f"Computing θ(t) for t ∈ [{t_min}, {t_max}] with step {step}, refined adaptively")
+    print(f"Total points: {len(t_values)} (smallest step {np.diff(t_grid).min():.6f}, "
+          f"{uniform_points} points on a uniform grid)")
     print()
 
-    phases_raw = []
-    for t in t_values:
-        phase = compute_phase(t)
-        phases_raw.append(phase)
-
-    phases_unwrapped = unwrap_phases(phases_raw)
-
     # Find extrema
     extrema = []
     for i in range(1, len(t_values) - 1):
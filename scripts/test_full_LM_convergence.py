@@ -10,86 +10,39 @@ due to cancellation between oscillating terms.
 This is the RIGHT test for analytic continuation.
 """
 
-from mpmath import mp, zeta
-from mpmath import fabs
+from mpmath import mp
+
+from orbit_py import L_M_checkpoints, convergence_record, write_records
 
 mp.dps = 40
 
-def partial_zeta(s, n):
-    """H_n(s) = Σ_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
+# Stop a sweep once consecutive checkpoints agree this well ("strong")
+STOP_TOL = 1e-6
+RECORDS_PATH = "cache/convergence/full_LM.json"
 
-def L_M_closed(s, jmax):
-    """
-    FULL closed form:
-    L_M(s) = ζ(s)[ζ(s)-1] - Σ_{j=2}^jmax H_{j-1}(s)/j^s
+def test_convergence(s, jmax_values):
     """
-    zs = zeta(s)
-
-    # First part (can be computed exactly)
-    part1 = zs * (zs - 1)
+    Test if FULL L_M(s) converges
 
-    # Second part (truncated sum)
-    part2 = mp.mpc(0)
-    for j in range(2, jmax + 1):
-        H = partial_zeta(s, j - 1)
-        part2 += H / mp.power(j, s)
-
-    return part1 - part2
-
-def test_convergence(s, jmax_values):
-    """Test if FULL L_M(s) converges"""
+    All checkpoints come from one pass over j (L_M_checkpoints); the sweep
+    stops at the first change below STOP_TOL. Returns the convergence record.
+    """
     print(f"\nTesting s = {s}")
     print(f"  Re(s) = {float(s.real):.2f}, Im(s) = {float(s.imag):.2f}")
     print()
-    print(f"  {'jmax':<10} {'|L_M(s)|':<20} {'Change':<15} {'Status':<12}")
-    print(f"  {'-'*60}")
-
-    prev = None
-    results = []
-
-    for jmax in jmax_values:
-        lm_val = L_M_closed(s, jmax)
-        mag = fabs(lm_val)
-
-        if prev is not None:
-            change = fabs(lm_val - prev)
-            change_str = f"{float(change):.6e}"
-
-            if change < 1e-6:
-                status = "✓✓✓"
-            elif change < 1e-4:
-                status = "✓✓"
-            elif change < 1e-2:
-                status = "✓"
-            else:
-                status = "..."
-        else:
-            change_str = "N/A"
-            status = ""
-
-        mag_str = f"{float(mag):.10f}"
-        print(f"  {jmax:<10} {mag_str:<20} {change_str:<15} {status:<12}")
-
-        prev = lm_val
-        results.append((jmax, lm_val, mag))
-
-    # Check convergence
-    if len(results) >= 2:
-        final_change = fabs(results[-1][1] - results[-2][1])
-
-        if final_change < 1e-6:
-            print(f"\n  ✓✓✓ L_M(s) STRONGLY CONVERGES (change < 1e-6)")
-            return "strong"
-        elif final_change < 1e-4:
-            print(f"\n  ✓✓ L_M(s) CONVERGES (change < 1e-4)")
-            return "good"
-        elif final_change < 1e-2:
-            print(f"\n  ✓ L_M(s) LIKELY CONVERGES (change < 1e-2)")
-            return "weak"
-        else:
-            print(f"\n  ✗ L_M(s) does NOT converge (change = {float(final_change):.2e})")
-            return "fail"
+    print(f"  {'jmax':<10} {'|L_M(s)|':<20} {'Change':<15}")
+    print(f"  {'-'*45}")
+
+    record = convergence_record(L_M_checkpoints(s, jmax_values), tol=STOP_TOL, s=s)
+
+    for point in record['checkpoints']:
+        change_str = f"{point['change']:.6e}" if point['change'] is not None else "N/A"
+        print(f"  {point['jmax']:<10} {point['abs']:<20.10f} {change_str:<15}")
+
+    rate = f"{record['rate']:.3f}" if record['rate'] is not None else "N/A"
+    stop = f", stopped early at jmax={record['checkpoints'][-1]['jmax']}" if record['stopped_early'] else ""
+    print(f"\n  status: {record['status']}, |ΔL_M| ~ jmax^-p with p = {rate}{stop}")
+    return record
 
 def main():
     print("=" * 80)
@@ -128,20 +81,27 @@ def main():
     jmax_values = [100, 200, 300, 400, 500]
 
     results_summary = []
+    records = []
 
     for s, label in test_cases:
         print(f"\n{'='*80}")
-        print(f"{label}")
+        print(label)
         print(f"{'='*80}")
 
-        status = test_convergence(s, jmax_values)
-        results_summary.append((s, label, status))
+        record = test_convergence(s, jmax_values)
+        record['label'] = label
+        records.append(record)
+        results_summary.append((s, label, record['status']))
+
+    write_records(RECORDS_PATH, records)
 
     print()
     print("=" * 80)
     print("SUMMARY")
     print("=" * 80)
     print()
+    print(f"Convergence records: {RECORDS_PATH}")
+    print()
 
     strong = [r for r in results_summary if r[2] == "strong"]
     good = [r for r in results_summary if r[2] == "good"]
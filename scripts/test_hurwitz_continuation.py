@@ -10,43 +10,14 @@ where ζ(s,a) is Hurwitz zeta, which has KNOWN continuation!
 If this sum converges for Re(s) < 1, we have analytic continuation WITHOUT FR!
 """
 
-from mpmath import mp, zeta
+from mpmath import mp
 from mpmath import re, im, fabs
 
+from orbit_py import L_M_closed_form, L_M_hurwitz
+
 # Set precision
 mp.dps = 40
 
-def partial_zeta(s, n):
-    """Compute H_n(s) = sum_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=200):
-    """
-    Standard closed form (works for Re(s) > 1):
-    L_M(s) = ζ(s)[ζ(s) - 1] - Σ_{j=2}^∞ H_{j-1}(s)/j^s
-    """
-    zeta_s = zeta(s)
-    correction = mp.mpf(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
-def L_M_hurwitz(s, d_max=200):
-    """
-    Analytic continuation candidate via Hurwitz zeta:
-    L_M(s) = Σ_{d=2}^{d_max} d^{-s} ζ(s,d)
-
-    Uses mpmath's zeta(s,a) which includes analytic continuation.
-    """
-    total = mp.mpc(0)
-    for d in range(2, d_max + 1):
-        # zeta(s, d) is Hurwitz zeta = Σ_{n=0}^∞ 1/(n+d)^s
-        # mpmath handles continuation automatically
-        hurwitz_term = zeta(s, d)
-        total += hurwitz_term / mp.power(d, s)
-    return total
-
 def main():
     print("=" * 80)
     print("Testing Analytic Continuation via Hurwitz Zeta")
@@ -8,53 +8,19 @@ Fixes:
 3. Better quadrature setup
 """
 
-from mpmath import mp, gamma, polylog, exp, quad, conj, fabs, zeta
+from mpmath import mp, conj, fabs
 import sys
+import time
 
-mp.dps = 50
-
-def M(n):
-    """M(n) = count of divisors d where 2 ≤ d ≤ √n"""
-    if n < 4:
-        return 0
-    count = 0
-    sqrt_n = int(n**0.5) + 1
-    for d in range(2, sqrt_n + 1):
-        if d * d > n:
-            break
-        if n % d == 0:
-            count += 1
-    return count
-
-def L_M_direct(s, nmax=5000):
-    """Direct sum with LARGER nmax"""
-    result = mp.mpc(0)
-    for n in range(1, nmax + 1):
-        result += M(n) / mp.power(n, s)
-    return result
-
-def integrand_regular(t, s):
-    """
-    Regular part: [Li_s(e^{-t}) - e^{-t}]/(1-e^{-t}) - [ζ(s)-1]/t
-
-    This removes the t^{-1} singularity.
-    """
-    if t == 0:
-        return mp.mpc(0)
-
-    exp_mt = exp(-t)
-    Li_s_val = polylog(s, exp_mt)
-
-    # Full expression
-    full = (Li_s_val - exp_mt) / (1 - exp_mt)
+from orbit_py import L_M_direct, L_M_integral
 
-    # Singular part
-    singular = (zeta(s) - 1) / t
-
-    # Regular = full - singular
-    regular = full - singular
+mp.dps = 50
 
-    return mp.power(t, s - 1) * regular
+# Sweep of TEST 2: s = SWEEP_SIGMA + it, t = 0, SWEEP_STEP, ...
+SWEEP_POINTS = 100
+SWEEP_SIGMA = 2
+SWEEP_STEP = 0.2
+SWEEP_DPS = 30
 
 def L_M_integral_fixed(s):
     """
@@ -63,28 +29,12 @@ def L_M_integral_fixed(s):
     L_M(s) = 1/Γ(s) { [ζ(s)-1]/(s-1) + ∫_0^∞ t^{s-1} f_reg(t) dt }
 
     where f_reg(t) = [Li_s(e^{-t}) - e^{-t}]/(1-e^{-t}) - [ζ(s)-1]/t
-    """
-
-    # Singular part (analytical)
-    if abs(s - 1) > 0.01:
-        singular_contrib = (zeta(s) - 1) / (s - 1)
-    else:
-        # Near s=1, use L'Hopital or series
-        # For now, skip this case
-        singular_contrib = mp.mpc(0)
-
-    # Regular part (numerical integration)
-    # Split at t=10 (tail is exponentially small)
-    regular_contrib = quad(lambda t: integrand_regular(t, s), [0, 30],
-                          maxdegree=15, error=True)
-
-    integral_val = singular_contrib + regular_contrib[0]
-    error_est = regular_contrib[1]
-
-    # Divide by Γ(s)
-    gamma_s = gamma(s)
 
-    return integral_val / gamma_s, error_est / abs(gamma_s)
+    The regular part is integrated over [0, 30] (the tail is exponentially
+    small) by tanh-sinh, with Li_s(e^{-t}) evaluated at all nodes of a level
+    from tables that are built once per s (orbit_py.quadrature).
+    """
+    return L_M_integral(s, T=30, max_level=10)
 
 def main():
     print("=" * 80)
@@ -123,6 +73,33 @@ def main():
         except Exception as e:
             print(f"{str(s):<20} ERROR: {e}")
 
+    print()
+    print("=" * 80)
+    print(f"TEST 2: Sweep of {SWEEP_POINTS} points s = {SWEEP_SIGMA} + it ({SWEEP_DPS} digits)")
+    print("=" * 80)
+    print()
+
+    print(f"{'t':<10} {'|Direct|':<15} {'|Integral|':<15} {'Error':<15} {'Est.err':<10}")
+    print("-" * 65)
+
+    start = time.perf_counter()
+    errors = []
+    with mp.workdps(SWEEP_DPS):
+        for i in range(SWEEP_POINTS):
+            s = mp.mpc(SWEEP_SIGMA, i * SWEEP_STEP)
+            L_direct = L_M_direct(s, nmax=5000)
+            L_int, err_est = L_M_integral_fixed(s)
+            error = fabs(L_direct - L_int)
+            errors.append(float(error))
+            if i % 10 == 0:
+                print(f"{float(s.imag):<10.2f} {float(fabs(L_direct)):<15.6e} {float(fabs(L_int)):<15.6e} "
+                      f"{float(error):<15.6e} {float(err_est):<10.2e}")
+    elapsed = time.perf_counter() - start
+
+    print()
+    print(f"  {SWEEP_POINTS} points in {elapsed:.1f} s")
+    print(f"  Error range: [{min(errors):.3e}, {max(errors):.3e}]")
+
     print()
     print("=" * 80)
     print("INTERPRETATION")
@@ -15,27 +15,9 @@ Test:
 from mpmath import mp, gamma, polylog, exp, quad, conj, fabs
 import sys
 
-mp.dps = 50
+from orbit_py import L_M_direct
 
-def M(n):
-    """M(n) = count of divisors d where 2 ≤ d ≤ √n"""
-    if n < 4:
-        return 0
-    count = 0
-    sqrt_n = int(n**0.5) + 1
-    for d in range(2, sqrt_n + 1):
-        if d * d > n:
-            break
-        if n % d == 0:
-            count += 1
-    return count
-
-def L_M_direct(s, nmax=1000):
-    """Direct Dirichlet series"""
-    result = mp.mpc(0)
-    for n in range(1, nmax + 1):
-        result += M(n) / mp.power(n, s)
-    return result
+mp.dps = 50
 
 def integrand(t, s):
     """
@@ -14,6 +14,8 @@ from fractions import Fraction
 from decimal import Decimal, getcontext
 import statistics
 
+from orbit_py import M, is_prime
+
 getcontext().prec = 100
 
 def is_perfect_square(n):
@@ -21,28 +23,6 @@ def is_perfect_square(n):
     sqrt_n = int(math.sqrt(n))
     return sqrt_n * sqrt_n == n
 
-def is_prime(n):
-    """Simple primality test."""
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
-
-def M(n):
-    """Childhood function: count divisors 2 ≤ d ≤ √n."""
-    count = 0
-    sqrt_n = int(math.sqrt(n))
-    for d in range(2, sqrt_n + 1):
-        if n % d == 0:
-            count += 1
-    return count
-
 def continued_fraction_sqrt(D, max_period=10000):
     """Compute continued fraction expansion of √D."""
     if is_perfect_square(D):
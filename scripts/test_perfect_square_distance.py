@@ -15,33 +15,14 @@ import math
 from decimal import Decimal, getcontext
 import statistics
 
+from orbit_py import M, is_prime
+
 getcontext().prec = 100
 
 def is_perfect_square(n):
     sqrt_n = int(math.sqrt(n))
     return sqrt_n * sqrt_n == n
 
-def is_prime(n):
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
-
-def M(n):
-    """Childhood function."""
-    count = 0
-    sqrt_n = int(math.sqrt(n))
-    for d in range(2, sqrt_n + 1):
-        if n % d == 0:
-            count += 1
-    return count
-
 def distance_to_perfect_square(n):
     """
     Distance to nearest perfect square.
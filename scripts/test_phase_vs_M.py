@@ -11,56 +11,18 @@ Strategy:
 4. Look for pattern!
 """
 
-from mpmath import mp, zeta, gamma, pi, arg, conj
+from mpmath import mp, arg, conj
 import math
 
+from orbit_py import tau, M, L_M_closed_form, L_M_closed_form_grid, gamma_classical
+
 mp.dps = 50
 
-def M(n):
-    """M(n) = count of divisors d where 2 ≤ d ≤ √n"""
-    if n < 4:
-        return 0
-    tau = 0
-    sqrt_n = int(n**0.5) + 1
-    for d in range(1, sqrt_n + 1):
-        if d * d > n:
-            break
-        if n % d == 0:
-            tau += 1 if d * d == n else 2
-    return (tau - 1) // 2
-
-def tau(n):
-    """Count divisors of n"""
-    count = 0
-    sqrt_n = int(n**0.5) + 1
-    for d in range(1, sqrt_n + 1):
-        if d * d > n:
-            break
-        if n % d == 0:
-            count += 1 if d * d == n else 2
-    return count
-
-def partial_zeta(s, n):
-    """H_n(s) = Σ_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=200):
-    """L_M(s) using closed form"""
-    zeta_s = zeta(s)
-    correction = mp.mpc(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
-def gamma_classical(s):
-    """γ(s) = π^(-s/2) Γ(s/2)"""
-    return mp.power(pi, -s/2) * gamma(s/2)
-
-def compute_phase(t):
-    """Compute arg(f(s)/f(1-s)) at s = 1/2 + it"""
+def compute_phase(t, L_s=None):
+    """Compute arg(f(s)/f(1-s)) at s = 1/2 + it (L_s = L_M(s) if known)"""
     s = mp.mpc(0.5, t)
-    L_s = L_M_closed_form(s, jmax=200)
+    if L_s is None:
+        L_s = L_M_closed_form(s, jmax=200)
     L_1ms = conj(L_s)
     g_s = gamma_classical(s)
     g_1ms = gamma_classical(1 - s)
@@ -100,9 +62,12 @@ def main():
     print(f"{'n':<5} {'θ_raw [rad]':<15} {'θ_unwrapped':<15}")
     print("-" * 35)
 
+    # Integer n is a uniform t-grid: powers advance by exp(-i·log k)
+    _, L_values = L_M_closed_form_grid(n_values[0], 1, len(n_values), jmax=200)
+
     prev_unwrapped = 0
-    for n in n_values:
-        phase = compute_phase(float(n))
+    for n, L_s in zip(n_values, L_values):
+        phase = compute_phase(float(n), L_s)
         theta_raw.append(phase)
 
         if len(theta_unwrapped) == 0:
@@ -11,32 +11,18 @@ or similar.
 Test by comparing θ(t) with arg of various functions.
 """
 
-from mpmath import mp, zeta, gamma, pi, arg, conj, fabs
+from mpmath import mp, zeta, gamma, arg, conj, fabs
 import math
 
+from orbit_py import L_M_closed_form, L_M_closed_form_many, gamma_classical
+
 mp.dps = 50
 
-def partial_zeta(s, n):
-    """H_n(s) = Σ_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=200):
-    """L_M(s) using closed form"""
-    zeta_s = zeta(s)
-    correction = mp.mpc(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
-def gamma_classical(s):
-    """γ(s) = π^(-s/2) Γ(s/2)"""
-    return mp.power(pi, -s/2) * gamma(s/2)
-
-def compute_phase(t):
-    """Compute arg(f(s)/f(1-s)) at s = 1/2 + it"""
+def compute_phase(t, L_s=None):
+    """Compute arg(f(s)/f(1-s)) at s = 1/2 + it (L_s = L_M(s) if known)"""
     s = mp.mpc(0.5, t)
-    L_s = L_M_closed_form(s, jmax=200)
+    if L_s is None:
+        L_s = L_M_closed_form(s, jmax=200)
     L_1ms = conj(L_s)
     g_s = gamma_classical(s)
     g_1ms = gamma_classical(1 - s)
@@ -61,15 +47,16 @@ def main():
 
     data = []
 
-    for t in t_values:
+    L_values = L_M_closed_form_many([mp.mpc(0.5, t) for t in t_values], jmax=200)
+
+    for t, L_s in zip(t_values, L_values):
         s = mp.mpc(0.5, t)
 
         # Compute θ
-        theta = compute_phase(t)
+        theta = compute_phase(t, L_s)
 
         # Compute arguments
         zeta_s = zeta(s)
-        L_s = L_M_closed_form(s, jmax=200)
         gamma_s = gamma(s/2)
 
         arg_zeta = float(arg(zeta_s))
@@ -11,6 +11,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from fractions import Fraction
 
+from orbit_py import is_prime
+
 # ============================================================================
 # VARIANT 1: ANCHOR POINT PROJECTION
 # ============================================================================
@@ -160,20 +162,6 @@ def test_variant(func, name, n_values, alpha_range):
     return alpha_values, F_values
 
 
-def is_prime(n):
-    """Simple primality test"""
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(np.sqrt(n)) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
-
-
 # ============================================================================
 # MAIN
 # ============================================================================
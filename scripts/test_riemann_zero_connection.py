@@ -11,49 +11,13 @@ All Riemann zeros (assuming RH) lie on Re(s) = 1/2.
 from mpmath import mp, zeta, gamma, pi
 from mpmath import re, im, arg, fabs
 
+from orbit_py import L_M_closed_form, zeta_zeros, L_M_zeros
+
 # Set high precision
 mp.dps = 50
 
-def partial_zeta(s, n):
-    """Compute H_n(s) = sum_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=250):
-    """
-    Compute L_M(s) using closed form:
-    L_M(s) = ζ(s)[ζ(s) - 1] - Σ_{j=2}^∞ H_{j-1}(s)/j^s
-    """
-    zeta_s = zeta(s)
-    correction = mp.mpf(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
-# First 20 nontrivial Riemann zeta zeros (imaginary parts)
-# Source: LMFDB, Odlyzko databases
-RIEMANN_ZEROS = [
-    14.134725141734693790457251983562470270784257115699243175685567460149963429809,
-    21.022039638771554992628479593896902777334340524902781754629520403587598586817,
-    25.010857580145688763213790992562821818659549672557996672496542006745092098495,
-    30.424876125859513210311897530584091320181560023715440180962146036993329389333,
-    32.935061587739189690662368964074903488812715603517039009280003440784815608630,
-    37.586178158825671257217763480705332821405597350830793218333001113433439300911,
-    40.918719012147495187398126914633254395726165962777279536161303667916201804076,
-    43.327073280914999519496122165406805782645668371836871442410186675237935267094,
-    48.005150881167159727942472749427516041686844001144425117775312280998597815369,
-    49.773832477672302181916784678563724057723178299676662824814897086310712372736,
-    52.970321477714460644147603360823133929607645814814842010341888393210945093784,
-    56.446247697063394804451976837453163243818485163809203283645143865975268811364,
-    59.347044002602353079653587598801838493127812121257132198526079667726503541340,
-    60.831778524609804760913878869815858592850624129467132223531205520073114763950,
-    65.112544048081606660717149050475045031492460586275244119327034650903577077412,
-    67.079810529494173714886161379874266556504898305237414907415758158393255081083,
-    69.546401711173979319059716183514003414547116995593571020485840167643853875820,
-    72.067157674481907582522041874352730040826329454441128850119512547966168131614,
-    75.704690699083933168611097135591505339430604288922053925430202639343432733471,
-    77.144840068874804200716531241650582761595130666311396787069235167811544364823,
-]
+# Number of Riemann zeros to test (heights from the orbit_py zero catalog)
+NUM_ZEROS = 20
 
 def main():
     print("=" * 80)
@@ -70,7 +34,7 @@ def main():
 
     results = []
 
-    for k, t in enumerate(RIEMANN_ZEROS, start=1):
+    for k, t in enumerate(zeta_zeros(NUM_ZEROS), start=1):
         s = mp.mpc(0.5, t)
 
         try:
@@ -139,6 +103,26 @@ def main():
         print()
         print("If min is very small (< 10^-3), might be near-zero → investigate further")
 
+    print()
+    print("=" * 80)
+    print("Zeros of L_M near the critical line (full L_M, tail-corrected C(s))")
+    print("=" * 80)
+    print()
+
+    zeta_heights = [r['t'] for r in results]
+    t_top = zeta_heights[-1] + 1
+    lm_zeros = L_M_zeros(1, t_top)
+
+    print(f"{'σ':<15} {'t':<15} {'Nearest ζ zero':<18} {'Δt':<12}")
+    print("-" * 60)
+    for z in lm_zeros:
+        t = float(z.imag)
+        nearest = min(zeta_heights, key=lambda h: abs(h - t))
+        print(f"{float(z.real):<15.10f} {t:<15.10f} {nearest:<18.6f} {t - nearest:<12.6f}")
+    print()
+    print(f"{len(lm_zeros)} L_M zeros with |σ - 1/2| < 1/2 and t ≤ {t_top:.1f}, "
+          f"{sum(1 for z in lm_zeros if abs(z.real - 0.5) < 1e-20)} on the line")
+
     print()
     print("=" * 80)
     print("Interpretation")
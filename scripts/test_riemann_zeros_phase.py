@@ -10,41 +10,21 @@ Strategy:
 3. Look for pattern in local behavior
 """
 
-from mpmath import mp, zeta, gamma, pi, arg, conj
+from mpmath import mp, arg, conj
 import math
 
+from orbit_py import L_M_closed_form, gamma_classical, cached, phase_sweep, phase_critical, zeta_zeros
+
 mp.dps = 50
 
-# First 10 Riemann zeros (imaginary parts, high precision)
-RIEMANN_ZEROS = [
-    "14.134725141734693790457251983562470270784257115699243175685567460149",
-    "21.022039638771554992628479593896902777334340524902781754629520403587",
-    "25.010857580145688763213790992562821818659549672557996672496542006745",
-    "30.424876125859513210311897530584091320181560023715440180962146036993",
-    "32.935061587739189690662368964074903488812715603517039009280003440784",
-    "37.586178158825671257217763480705332821223516907122693753374506616112",
-    "40.918719012147495187398126914633254395726165962777279536161303667416",
-    "43.327073280914999519496122165406805782645668371836871550219241212999",
-    "48.005150881167159727942472749427516041686844001144425117775312864002",
-    "49.773832477672302181916784678563724057723178299676662100781189447663",
-]
-
-def partial_zeta(s, n):
-    """H_n(s) = Σ_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=200):
-    """L_M(s) using closed form"""
-    zeta_s = zeta(s)
-    correction = mp.mpc(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
-def gamma_classical(s):
-    """γ(s) = π^(-s/2) Γ(s/2)"""
-    return mp.power(pi, -s/2) * gamma(s/2)
+# Memoized on disk across runs (cache/orbit_py.sqlite, keyed by s, jmax, dps)
+L_M_closed_form = cached(L_M_closed_form)
+
+# Number of Riemann zeros to study (heights from the orbit_py zero catalog)
+NUM_ZEROS = 10
+
+# Zero indices for the large-height check (three consecutive zeros each)
+LARGE_ZERO_INDICES = [10**4, 10**5, 10**6]
 
 def compute_phase(t):
     """Compute arg(f(s)/f(1-s)) at s = 1/2 + it"""
@@ -71,18 +51,14 @@ def main():
     print(f"{'Zero #':<8} {'t (precise)':<25} {'{t}':<15} {'θ(t)':<15} {'⌊t⌋':<8}")
     print("-" * 75)
 
-    for i, t_str in enumerate(RIEMANN_ZEROS, 1):
-        # Parse with high precision
-        t_zero = mp.mpf(t_str)
-        t_float = float(t_zero)
+    t_floats = [float(t) for t in zeta_zeros(NUM_ZEROS)]
+    sweep = phase_sweep(t_floats, dps=mp.dps, chunk_size=1, phase_func=compute_phase)
 
+    for i, (t_float, theta, _) in enumerate(sweep, 1):
         # Fractional and integer parts
         t_floor = math.floor(t_float)
         t_frac = t_float - t_floor
 
-        # Compute phase
-        theta = compute_phase(t_float)
-
         print(f"{i:<8} {t_float:<25.10f} {t_frac:<15.10f} {theta:<15.6f} {t_floor:<8}")
 
         results.append({
@@ -180,6 +156,25 @@ def main():
     else:
         print("No floors with multiple zeros in this range.")
 
+    print()
+    print("=" * 80)
+    print("Large heights: θ at the 10^4-th to 10^6-th zeros (Riemann–Siegel)")
+    print("=" * 80)
+    print()
+
+    large_zeros = [(n + k, float(t))
+                   for n in LARGE_ZERO_INDICES
+                   for k, t in enumerate(zeta_zeros(3, start=n, dps=None))]
+    large_t = [t for _, t in large_zeros]
+    large_theta, large_err = phase_critical(large_t, jmax=200)
+
+    print(f"{'Zero #':<10} {'t':<22} {'{t}':<15} {'θ(t)':<15} {'θ/2π':<15} {'Rel err L_M':<12}")
+    print("-" * 90)
+    for (index, t), theta, err in zip(large_zeros, large_theta, large_err):
+        t_frac = t - math.floor(t)
+        print(f"{index:<10} {t:<22.10f} {t_frac:<15.10f} {theta:<15.6f} "
+              f"{theta / (2 * math.pi):<15.10f} {err:<12.2e}")
+
     print()
     print("=" * 80)
     print("CONCLUSION")
@@ -9,29 +9,24 @@ Test both:
 2. Does L_M(s, jmax) converge as jmax increases? (Convergence)
 
 Hypothesis: Symmetry can hold even if values don't converge!
-"""
-
-from mpmath import mp, zeta, conj, fabs
 
-mp.dps = 40
+The closing section repeats both tests over the whole strip instead of
+three points: orbit_py.field scans σ × t for two jmax and reports, per σ,
+the Schwarz residual and the distance of the closed form from the full
+L_M = (ζ² + ζ(2s))/2 - ζ (fields kept in cache/fields/).
+"""
 
-def partial_zeta(s, n):
-    """H_n(s) = Σ_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
+import numpy as np
+from mpmath import mp, conj, fabs
 
-def L_M_closed(s, jmax):
-    """
-    L_M(s) = ζ(s)[ζ(s)-1] - Σ_{j=2}^jmax H_{j-1}(s)/j^s
-    """
-    zs = zeta(s)
-    part1 = zs * (zs - 1)
+from orbit_py import L_M_closed_form
+from orbit_py.field import scan_strip
 
-    part2 = mp.mpc(0)
-    for j in range(2, jmax + 1):
-        H = partial_zeta(s, j - 1)
-        part2 += H / mp.power(j, s)
+FIELD_SIGMA = np.linspace(0.1, 0.9, 9)
+FIELD_T = np.linspace(5, 30, 1001)
+FIELD_JMAX = (200, 500)
 
-    return part1 - part2
+mp.dps = 40
 
 def test_critical_line_behavior(s):
     """
@@ -52,8 +47,8 @@ def test_critical_line_behavior(s):
 
     for jmax in jmax_values:
         # Compute L_M(s) and L_M(1-s)
-        L_s = L_M_closed(s, jmax)
-        L_1ms = L_M_closed(1 - s, jmax)
+        L_s = L_M_closed_form(s, jmax)
+        L_1ms = L_M_closed_form(1 - s, jmax)
 
         # Test Schwarz symmetry: L_M(1-s) should equal conj(L_M(s))
         L_s_conj = conj(L_s)
@@ -104,6 +99,28 @@ def main():
     for s in test_points:
         test_critical_line_behavior(s)
 
+    print()
+    print("=" * 80)
+    print(f"STRIP SCAN: σ ∈ [{FIELD_SIGMA[0]}, {FIELD_SIGMA[-1]}], t ∈ [{FIELD_T[0]:g}, {FIELD_T[-1]:g}], "
+          f"{len(FIELD_SIGMA)} × {len(FIELD_T)} points")
+    print("=" * 80)
+    print()
+
+    fields = [scan_strip(FIELD_SIGMA, FIELD_T, jmax=jmax) for jmax in FIELD_JMAX]
+    schwarz = [f.schwarz_residual() for f in fields]
+    closed = [f.closed_form_residual() for f in fields]
+
+    header = "".join(f"{'Schwarz J=' + str(j):<16}" for j in FIELD_JMAX) + \
+        "".join(f"{'|L-L_full|/|L_full| J=' + str(j):<25}" for j in FIELD_JMAX)
+    print(f"{'σ':<8} {header}")
+    print("  (max over t for Schwarz, median over t for the closed form)")
+    print("-" * 85)
+    for i, sigma in enumerate(FIELD_SIGMA):
+        cols = "".join(f"{np.max(r[i]):<16.3e}" for r in schwarz) + \
+            "".join(f"{np.median(r[i]):<25.3e}" for r in closed)
+        print(f"{sigma:<8.2f} {cols}")
+    print()
+
     print()
     print("=" * 80)
     print("ANALYSIS")
@@ -14,26 +14,14 @@ This tests the prediction numerically.
 from mpmath import mp, euler
 import math
 
+from orbit_py import sum_M_checkpoints
+
 # Set precision
 mp.dps = 30
 
-def M(n):
-    """
-    M(n) = count of divisors d where 2 ≤ d ≤ √n
-         = floor((tau(n) - 1) / 2)
-    """
-    tau = 0
-    sqrt_n = int(n**0.5) + 1
-    for d in range(1, sqrt_n + 1):
-        if d * d > n:
-            break
-        if n % d == 0:
-            tau += 1 if d * d == n else 2
-    return (tau - 1) // 2
-
-def sum_M(x_max):
-    """Compute Σ_{n=1}^{x_max} M(n)"""
-    return sum(M(n) for n in range(1, x_max + 1))
+def sum_M(x_values):
+    """Compute Σ_{n=1}^{x} M(n) for every x in x_values (hyperbola method, O(√x))"""
+    return sum_M_checkpoints(x_values)
 
 def asymptotic_prediction(x):
     """
@@ -74,20 +62,22 @@ def main():
     print("-" * 80)
 
     # Test at various x values
-    x_values = [10, 50, 100, 200, 500, 1000, 2000, 5000]
+    x_values = [10, 50, 100, 200, 500, 1000, 2000, 5000,
+                10**4, 10**5, 10**6, 10**7, 10**8, 10**9, 10**10, 10**12]
+    sums = sum_M(x_values)
 
     results = []
 
-    print(f"{'x':<10} {'Σ M(n)':<15} {'Predicted':<15} {'Error':<15} {'Rel Error %':<15}")
+    print(f"{'x':<14} {'Σ M(n)':<18} {'Predicted':<20} {'Error':<20} {'Rel Error %':<12}")
     print("-" * 80)
 
     for x in x_values:
-        actual = sum_M(x)
+        actual = sums[x]
         predicted = asymptotic_prediction(x)
         error = actual - predicted
         rel_error = 100 * error / actual if actual != 0 else 0
 
-        print(f"{x:<10} {actual:<15.2f} {predicted:<15.2f} {error:<15.2f} {rel_error:<15.4f}")
+        print(f"{x:<14} {actual:<18} {predicted:<20.2f} {error:<20.2f} {rel_error:<12.4f}")
 
         results.append({
             'x': x,
@@ -8,66 +8,51 @@ If this works, then:
   R(s) = L_M(1-s)/L_M(s) = [classical ratio] · [ζ(s)/ζ(1-s)]^α
 """
 
-from mpmath import mp, zeta, gamma, pi, sin, cos, exp, log, sqrt
-from mpmath import re, im, arg, fabs, conj
+import numpy as np
+from mpmath import mp
+
+from orbit_py.gamma_search import (ratio_features, log_factor_ratio, score_candidates,
+                                   candidate_grid, SearchStore, NAMED)
 
 # Set precision
 mp.dps = 40
 
-def partial_zeta(s, n):
-    """Compute H_n(s) = sum_{k=1}^n k^{-s}"""
-    return sum(mp.power(k, -s) for k in range(1, n + 1))
-
-def L_M_closed_form(s, jmax=200):
-    """Compute L_M(s) using closed form"""
-    zeta_s = zeta(s)
-    correction = mp.mpf(0)
-    for j in range(2, jmax + 1):
-        H_j_minus_1 = partial_zeta(s, j - 1)
-        correction += H_j_minus_1 / mp.power(j, s)
-    return zeta_s * (zeta_s - 1) - correction
-
-def classical_gamma_ratio(s):
-    """Classical γ(s)/γ(1-s) for ζ(s)"""
-    return mp.power(pi, (1 - 2*s)/2) * gamma(s/2) / gamma((1-s)/2)
-
-def test_zeta_power(s, alpha):
+def test_zeta_power(features, alpha):
     """
-    Test if R(s) = [classical] · [ζ(s)/ζ(1-s)]^α
+    Test if R(s) = [classical] · [ζ(s)/ζ(1-s)]^α at every grid point
 
-    Returns: error in magnitude and phase
-    """
-    L_s = L_M_closed_form(s, jmax=150)
-    L_1ms = L_M_closed_form(1 - s, jmax=150)
+    R(s) comes precomputed in features (ratio_features), so each α costs
+    one vectorized evaluation of the predicted ratio.
 
-    if fabs(L_s) < 1e-30:
-        return None
-
-    R_actual = L_1ms / L_s
-
-    # Predicted R
-    classical = classical_gamma_ratio(s)
-    zeta_ratio = zeta(s) / zeta(1-s)
+    Returns: per point, error in magnitude and phase (None where L_M(s) = 0)
+    """
+    family, (Q, lam, mu, _) = NAMED["Classical γ"]
+    log_pred = log_factor_ratio(family, (Q, lam, mu, alpha), features['s'], features['log_zeta_ratio'])[0]
 
-    R_predicted = classical * mp.power(zeta_ratio, alpha)
+    R_actual = np.exp(features['log_R'])
+    R_predicted = np.exp(log_pred)
 
     # Compute error
-    error_mag = fabs(fabs(R_actual) - fabs(R_predicted))
-    error_phase = fabs(arg(R_actual) - arg(R_predicted))
+    error_mag = np.abs(np.abs(R_actual) - np.abs(R_predicted))
+    error_phase = np.abs(np.angle(R_actual) - np.angle(R_predicted))
 
     # Normalize phase error to [-π, π]
-    while error_phase > pi:
-        error_phase -= 2*pi
-    error_phase = fabs(error_phase)
-
-    return {
-        'error_mag': float(error_mag),
-        'error_phase': float(error_phase),
-        'R_actual_mag': float(fabs(R_actual)),
-        'R_predicted_mag': float(fabs(R_predicted)),
-        'R_actual_phase': float(arg(R_actual)),
-        'R_predicted_phase': float(arg(R_predicted))
-    }
+    error_phase = np.abs(np.where(error_phase > np.pi, error_phase - 2*np.pi, error_phase))
+
+    results = []
+    for i in range(len(R_actual)):
+        if np.isnan(features['log_R'][i]):
+            results.append(None)
+            continue
+        results.append({
+            'error_mag': float(error_mag[i]),
+            'error_phase': float(error_phase[i]),
+            'R_actual_mag': float(np.abs(R_actual[i])),
+            'R_predicted_mag': float(np.abs(R_predicted[i])),
+            'R_actual_phase': float(np.angle(R_actual[i])),
+            'R_predicted_phase': float(np.angle(R_predicted[i]))
+        })
+    return results
 
 def main():
     print("=" * 80)
@@ -88,6 +73,9 @@ def main():
     # Test various powers of zeta
     alpha_values = [-2.0, -1.5, -1.0, -0.5, 0.0, 0.5, 1.0, 1.5, 2.0]
 
+    # R(s) once per point, shared by every α below
+    features = ratio_features([complex(sigma, t) for sigma, t in test_points], jmax=150)
+
     print("Testing different α values:\n")
 
     for alpha in alpha_values:
@@ -100,26 +88,19 @@ def main():
         total_error_phase = 0
         count = 0
 
-        for sigma, t in test_points:
-            s = mp.mpc(sigma, t)
+        for (sigma, t), result in zip(test_points, test_zeta_power(features, alpha)):
+            if result is None:
+                continue
 
-            try:
-                result = test_zeta_power(s, alpha)
-                if result is None:
-                    continue
+            s_str = f"{float(sigma):.1f}+{float(t):.1f}i"
+            match = "✓" if result['error_mag'] < 0.01 and result['error_phase'] < 0.1 else "✗"
 
-                s_str = f"{float(sigma):.1f}+{float(t):.1f}i"
-                match = "✓" if result['error_mag'] < 0.01 and result['error_phase'] < 0.1 else "✗"
+            print(f"{s_str:<15} {result['R_actual_mag']:<15.6f} {result['R_predicted_mag']:<15.6f} "
+                  f"{result['error_mag']:<15.6e} {result['error_phase']:<15.6f} {match:<10}")
 
-                print(f"{s_str:<15} {result['R_actual_mag']:<15.6f} {result['R_predicted_mag']:<15.6f} "
-                      f"{result['error_mag']:<15.6e} {result['error_phase']:<15.6f} {match:<10}")
-
-                total_error_mag += result['error_mag']
-                total_error_phase += result['error_phase']
-                count += 1
-
-            except Exception as e:
-                print(f"{sigma}+{t}i: ERROR: {e}")
+            total_error_mag += result['error_mag']
+            total_error_phase += result['error_phase']
+            count += 1
 
         if count > 0:
             avg_err_mag = total_error_mag / count
@@ -129,6 +110,20 @@ def main():
             if avg_err_mag < 0.01 and avg_err_phase < 0.1:
                 print(f"*** CANDIDATE FOUND: α = {alpha:.1f} ***")
 
+    print()
+    print("=" * 80)
+    print("Fine α scan")
+    print("=" * 80)
+    print()
+
+    Q, lam, mu, _ = NAMED["Classical γ"][1]
+    ranking = score_candidates(features, candidate_grid(Q, lam, mu, alpha=np.linspace(-3, 3, 601)))
+    run = SearchStore().add_run("zeta power α scan", features, ranking)
+    print(f"601 values of α in [-3, 3], best 5 by rms|Δlog R| (run {run}):")
+    for r in ranking[:5]:
+        print(f"  α = {r['params'][3]:+.2f}:  rms|Δlog R| = {r['score']:.6f}  "
+              f"(log {r['mag_rms']:.6f}, phase {r['phase_rms']:.6f})")
+
     print()
     print("=" * 80)
     print("Summary")
@@ -5,19 +5,8 @@ Improved scatter plot with three categories based on factorization type
 
 import numpy as np
 import matplotlib.pyplot as plt
-import pickle
 
-def is_prime(n):
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(np.sqrt(n)) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+from orbit_py import is_prime, scan_exponents
 
 def is_prime_power(n):
     """Check if n = p^k for some prime p and k >= 2"""
@@ -43,24 +32,21 @@ def is_prime_power(n):
 
     return False
 
-# Load data
-with open('cache/optimal_exponents.pkl', 'rb') as f:
-    data = pickle.load(f)
-
-results = data['results']
+# Load data: the blocks analyze_optimal_exponents.py writes (computed here if missing)
+n_min, n_max, alpha = 2, 300, 7.0
+results = scan_exponents(n_min, n_max, alpha).merge(n_min, n_max)
 
 # Categorize
 primes = []
 prime_powers = []
 other_composites = []
 
-for n, info in results.items():
-    if not info['has_minimum'] or info['s_opt'] is None:
+for n, s_opt, has_min, prime in zip(*(results[name].tolist()
+                                      for name in ('n', 's_opt', 'has_minimum', 'is_prime'))):
+    if not has_min:
         continue
 
-    s_opt = info['s_opt']
-
-    if info['is_prime']:
+    if prime:
         primes.append((n, s_opt))
     elif is_prime_power(n):
         prime_powers.append((n, s_opt))